@@ -0,0 +1 @@
+"""Performance benchmarks for the Mercor pipeline."""
@@ -0,0 +1,74 @@
+"""
+Benchmark Work Experience matching for applicants with long histories.
+
+Compares the original nested-loop company/title/start scan with
+ExperienceMatcher's hash indexes. Entries carry no record_id, a share of them
+have an edited title, and the existing records are shuffled:
+
+    python -m benchmarks.bench_experience_match --entries 100 300 1000
+"""
+import argparse
+import random
+import time
+
+from src.experience_match import ExperienceMatcher
+
+
+def make_history(count: int, edited: float, seed: int = 0) -> tuple[list[dict], list[tuple]]:
+    rng = random.Random(seed)
+    existing = [
+        {"id": f"rec{i:014d}", "fields": {"Company": f"Company {i % 50}", "Title": f"Role {i}",
+                                          "Start": f"{1990 + i // 12}-{i % 12 + 1:02d}-01"}}
+        for i in range(count)
+    ]
+    entries = []
+    for record in existing:
+        fields = dict(record["fields"])
+        if rng.random() < edited:
+            fields["Title"] += " (edited)"
+        entries.append((None, fields))
+    rng.shuffle(existing)
+    return existing, entries
+
+
+def nested_loop(existing: list[dict], entries: list[tuple]) -> int:
+    """The matching upsert_work_experience used to do: a scan per entry, exact fields only."""
+    processed = set()
+    matched = 0
+    for _, fields in entries:
+        for record in existing:
+            if record["id"] in processed:
+                continue
+            ef = record["fields"]
+            if ef["Company"] == fields["Company"] and ef["Title"] == fields["Title"] and ef["Start"] == fields["Start"]:
+                processed.add(record["id"])
+                matched += 1
+                break
+    return matched
+
+
+def indexed(existing: list[dict], entries: list[tuple]) -> int:
+    return sum(1 for m in ExperienceMatcher(existing).match(entries) if m is not None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, nargs="+", default=[100, 300, 1000],
+                        help="work experience entries per applicant")
+    parser.add_argument("--edited", type=float, default=0.1, help="share of entries with an edited title")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for count in args.entries:
+        existing, entries = make_history(count, args.edited)
+        print(f"{count} entries, {args.edited:.0%} edited")
+        for label, match in (("nested loop", nested_loop), ("ExperienceMatcher", indexed)):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                matched = match(existing, entries)
+            elapsed = (time.perf_counter() - started) / args.repeat
+            print(f"  {label:<18} {elapsed * 1000:9.2f} ms   {matched:>5} matched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark per-request latency with and without the pooled session layer.
+
+Runs against a local FakeAirtableServer so no Airtable credentials are needed:
+
+    python -m benchmarks.bench_http_pool --requests 500
+"""
+import argparse
+import statistics
+import time
+
+import requests
+
+from src.airtable_client import AirtableClient
+from src.fake_airtable import FakeAirtableBase, FakeAirtableServer
+
+
+def time_calls(func, count: int) -> list[float]:
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<28} mean {statistics.mean(timings):6.3f} ms   p50 {statistics.median(timings):6.3f} ms   p95 {p95:6.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    base = FakeAirtableBase(base_id="appBench")
+    record_id = base.seed("Applications", [{"Application ID": "APP001"}])[0]["id"]
+    server = FakeAirtableServer(base).start()
+    base_url = server.base_url
+    url = f"{base_url}/appBench/Applications/{record_id}"
+
+    # Before: a fresh connection for every request
+    report("requests.request (no pool)", time_calls(lambda: requests.request("GET", url).json(), args.requests))
+
+    # After: AirtableClient with its pooled keep-alive session
+    for transport in ("requests", "httpx"):
+        with AirtableClient(api_key="bench", base_id="appBench", base_url=base_url, transport=transport) as client:
+            client._rate_limit = lambda: None
+            timings = time_calls(lambda: client.get_record("Applications", record_id), args.requests)
+            report(f"AirtableClient ({transport})", timings)
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Microbenchmark experience date parsing over many entries.
+
+Compares dateutil on every date (the old parse_date), the ISO fast path with
+a cold memo, the same with a warm memo, and calculate_total_experience over
+the entries with one reference now:
+
+    python -m benchmarks.bench_parse_dates --entries 100000
+"""
+import argparse
+import time
+from datetime import datetime
+
+from dateutil import parser as date_parser
+
+from src.shortlist import calculate_total_experience
+from src.utils import _parse_date_string, parse_date
+
+
+def make_dates(count: int) -> list[str]:
+    # Stored dates are mostly YYYY-MM-DD, some YYYY-MM; a few hundred distinct values repeat
+    return [f"{2000 + i % 25}-{i % 12 + 1:02d}" + ("" if i % 7 == 0 else f"-{i % 28 + 1:02d}") for i in range(count)]
+
+
+def timed(label: str, func, count: int):
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms   {elapsed / count * 1e6:6.2f} us/entry")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    dates = make_dates(args.entries)
+    experience = [{"start": start, "end": dates[(i + 1) % len(dates)] if i % 4 else None}
+                  for i, start in enumerate(dates)]
+    print(f"{args.entries} dates, {len(set(dates))} distinct")
+
+    timed("dateutil every time", lambda: [date_parser.parse(d) for d in dates], args.entries)
+    _parse_date_string.cache_clear()
+    timed("parse_date, cold memo", lambda: [parse_date(d) for d in dates], args.entries)
+    timed("parse_date, warm memo", lambda: [parse_date(d) for d in dates], args.entries)
+    now = datetime.now()
+    timed("calculate_total_experience", lambda: calculate_total_experience(experience, now), args.entries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark bytes on the wire per page of Applications for each Compressed JSON encoding.
+
+Seeds a FakeAirtableBase with one page of applicants per encoding and reads it
+back through AirtableClient, so the sizes include Airtable's response envelope:
+
+    python -m benchmarks.bench_payload_size --experience 3 12 30
+"""
+import argparse
+import json
+
+from src.fake_airtable import FakeAirtableBase
+from src.json_codec import encode_packed, encode_plain
+
+ENCODINGS = {
+    "indent=2 (legacy)": lambda data: json.dumps(data, indent=2),
+    "compact": encode_plain,
+    "zlib+base64": encode_packed
+}
+
+
+def make_applicant(index: int, experience_count: int) -> dict:
+    return {
+        "applicant_id": f"APP{index:05d}",
+        "record_id": f"rec{index:014d}",
+        "personal": {"name": f"Applicant {index}", "email": f"applicant{index}@example.com",
+                     "location": "San Francisco, USA", "linkedin": f"https://linkedin.com/in/applicant{index}"},
+        "experience": [
+            {"record_id": f"rec{index:07d}{i:07d}", "company": ["Google", "Stripe", "Acme Corp"][i % 3],
+             "title": "Senior Software Engineer", "start": f"{2000 + i}-01-01", "end": f"{2001 + i}-01-01",
+             "technologies": ["Python", "PostgreSQL", "Kubernetes"]}
+            for i in range(experience_count)
+        ],
+        "salary": {"preferred_rate": 95, "minimum_rate": 80, "currency": "USD", "availability": 30}
+    }
+
+
+def page_bytes(encode, experience_count: int, page_size: int) -> int:
+    base = FakeAirtableBase()
+    base.seed("Applications", [
+        {"Application ID": f"APP{i:05d}", "Compressed JSON": encode(make_applicant(i, experience_count))}
+        for i in range(page_size)
+    ])
+    with base.client() as client:
+        client.get_records("Applications", fields=["Compressed JSON"])
+        return client.stats()["total"]["bytes_received"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experience", type=int, nargs="+", default=[3, 12, 30],
+                        help="work experience entries per applicant")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    for experience_count in args.experience:
+        print(f"{experience_count} experience entries, {args.page_size} records per page")
+        baseline = None
+        for label, encode in ENCODINGS.items():
+            size = page_bytes(encode, experience_count, args.page_size)
+            baseline = baseline or size
+            print(f"  {label:<20} {size:>9} B/page   {size / baseline:6.1%} of legacy")
+
+
+if __name__ == "__main__":
+    main()
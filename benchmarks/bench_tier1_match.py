@@ -0,0 +1,57 @@
+"""
+Benchmark Tier-1 company matching as the Tier-1 list grows.
+
+Compares the original substring loop over TIER_1_COMPANIES with the
+compiled Tier1Matcher on synthetic company lists:
+
+    python -m benchmarks.bench_tier1_match --companies 10 1000 5000
+"""
+import argparse
+import time
+
+from src.tier1 import Tier1Matcher
+
+
+def make_companies(count: int) -> list[str]:
+    return [f"Company {i} Holdings" if i % 3 else f"Firm{i}" for i in range(count)]
+
+
+def make_experience(count: int) -> list[str]:
+    names = ["Random Startup LLC", "Acme Corp", "Globex", "Initech Software", "Firm42 Inc"]
+    return [f"{names[i % len(names)]} {i}" for i in range(count)]
+
+
+def substring_loop(companies: list[str], experience: list[str]) -> int:
+    """The check worked_at_tier1 used to do: lowercased substring tests, entry x company."""
+    return sum(1 for company in experience if any(tier1.lower() in company.lower() for tier1 in companies))
+
+
+def compiled(matcher: Tier1Matcher, experience: list[str]) -> int:
+    return sum(1 for company in experience if matcher.match(company))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", type=int, nargs="+", default=[10, 1000, 5000],
+                        help="Tier-1 list sizes")
+    parser.add_argument("--entries", type=int, default=2000, help="experience entries checked")
+    args = parser.parse_args()
+
+    experience = make_experience(args.entries)
+    for count in args.companies:
+        companies = make_companies(count)
+        started = time.perf_counter()
+        matcher = Tier1Matcher(companies)
+        build = time.perf_counter() - started
+
+        print(f"{count} Tier-1 companies, {args.entries} entries (matcher build {build * 1000:.1f} ms)")
+        for label, match, target in (("substring loop", substring_loop, companies),
+                                     ("Tier1Matcher", compiled, matcher)):
+            started = time.perf_counter()
+            matched = match(target, experience)
+            elapsed = time.perf_counter() - started
+            print(f"  {label:<15} {elapsed * 1000:9.2f} ms   {matched:>5} matched")
+
+
+if __name__ == "__main__":
+    main()
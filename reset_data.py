@@ -1,63 +1,59 @@
 """Reset and populate test data for Mercor pipeline demo."""
+from concurrent.futures import ThreadPoolExecutor
 from src.airtable_client import AirtableClient
 
+# Tables emptied by clear_data, with a small field to fetch instead of whole records
+CLEAR_TABLES = {
+    'Shortlisted Leads': 'Applicants',
+    'Salary Preferences': 'Application ID',
+    'Work Experience': 'Application ID',
+    'Personal Details': 'Application ID'
+}
+
+
+def clear_table(client, table_name, id_field):
+    """Delete every record in a table, 10 per request."""
+    record_ids = [r['id'] for r in client.iter_records(table_name, fields=[id_field])]
+    try:
+        deleted = client.batch_delete(table_name, record_ids)
+    except Exception as e:
+        print(f'Failed to clear {table_name}: {e}')
+        return 0
+    print(f'Deleted {len(deleted)} records from {table_name}')
+    return len(deleted)
+
+
 def clear_data():
     """Clear all existing test data."""
     client = AirtableClient()
     
     print('Clearing existing data...')
     
-    # Delete Shortlisted Leads
-    leads = client.get_records('Shortlisted Leads')
-    for r in leads:
-        try:
-            client.delete_record('Shortlisted Leads', r['id'])
-        except:
-            pass
-    print(f'Deleted {len(leads)} shortlisted leads')
-    
-    # Delete Salary Preferences
-    salary = client.get_records('Salary Preferences')
-    for r in salary:
-        try:
-            client.delete_record('Salary Preferences', r['id'])
-        except:
-            pass
-    print(f'Deleted {len(salary)} salary records')
-    
-    # Delete Work Experience
-    exp = client.get_records('Work Experience')
-    for r in exp:
-        try:
-            client.delete_record('Work Experience', r['id'])
-        except:
-            pass
-    print(f'Deleted {len(exp)} experience records')
-    
-    # Delete Personal Details
-    personal = client.get_records('Personal Details')
-    for r in personal:
-        try:
-            client.delete_record('Personal Details', r['id'])
-        except:
-            pass
-    print(f'Deleted {len(personal)} personal records')
+    # Clear the child tables concurrently; the shared rate limiter keeps the total under 5 req/s
+    with ThreadPoolExecutor(max_workers=len(CLEAR_TABLES)) as executor:
+        list(executor.map(lambda item: clear_table(client, *item), CLEAR_TABLES.items()))
     
     # Reset Applications
-    apps = client.get_records('Applications')
-    for r in apps:
-        try:
-            client.update_record('Applications', r['id'], {
+    apps = client.get_records('Applications', fields=['Application ID'])
+    updates = [
+        {
+            'id': r['id'],
+            'fields': {
                 'Application ID': r['fields'].get('Application ID', ''),
                 'Compressed JSON': '',
                 'Shortlist Status': None,
                 'LLM Summary': '',
                 'LLM Score': None,
                 'LLM Follow-Ups': ''
-            })
-        except:
-            pass
-    print(f'Reset {len(apps)} applications')
+            }
+        }
+        for r in apps
+    ]
+    try:
+        client.batch_update('Applications', updates)
+        print(f'Reset {len(apps)} applications')
+    except Exception as e:
+        print(f'Failed to reset applications: {e}')
     
     print('Data cleared!')
 
@@ -97,9 +93,11 @@ def populate_test_data():
         }
     ]
     
+    # Upsert on Email so re-running the seed updates rows instead of duplicating them
+    result = client.batch_upsert('Personal Details', personal_data, merge_on=['Email'])
     for p in personal_data:
-        client.create_record('Personal Details', p)
-        print(f"Created Personal: {p['Full Name']}")
+        print(f"Upserted Personal: {p['Full Name']}")
+    print(f"Personal Details: {len(result['created'])} created, {len(result['updated'])} updated")
     
     # Work Experience
     experience_data = [
@@ -156,9 +154,12 @@ def populate_test_data():
         }
     ]
     
+    # Created, not upserted: Company/Title/Start isn't unique per applicant, and the Application ID link
+    # can't be a merge field, so an upsert could merge two applicants' roles into one record
+    created = client.batch_create('Work Experience', experience_data)
     for e in experience_data:
-        client.create_record('Work Experience', e)
         print(f"Created Experience: {e['Company']} - {e['Title']}")
+    print(f"Work Experience: {len(created)} created")
     
     # Salary Preferences - Using both USD and INR
     salary_data = [
@@ -1,89 +1,309 @@
+import json
+import threading
 import time
-import requests
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Iterator
+from urllib.parse import quote, urlencode
 from src.config import (
     AIRTABLE_API_KEY,
     AIRTABLE_BASE_ID,
-    AIRTABLE_RATE_LIMIT,
-    BATCH_SIZE
+    AIRTABLE_MAX_RETRIES,
+    AIRTABLE_RETRY_MAX_DELAY,
+    AIRTABLE_TIMEOUT,
+    BATCH_SIZE,
+    CIRCUIT_BREAKER_RESET,
+    CIRCUIT_BREAKER_THRESHOLD,
+    WRITE_BUFFER_MAX_DELAY
 )
+from src.http_session import HTTP_ERRORS, create_session
+from src.linked_index import LinkedRecordIndex
+from src.metrics import RequestStats
+from src.mirror import AirtableMirror
+from src.record_cache import RecordCache
+from src.retry import CircuitBreaker, RetryPolicy, call_with_retry
+from src.write_buffer import WriteBuffer
+from src.rate_limiter import TokenBucket, get_shared_limiter
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Record IDs per RECORD_ID() filter request, keeping the URL well under Airtable's limit
+RECORD_ID_CHUNK = 50
+
+
+def build_list_endpoint(table_name: str, filter_formula: str = None, offset: str = None,
+                        fields: list[str] = None, page_size: int = None,
+                        sort: list[dict] = None, view: str = None) -> str:
+    """Build the endpoint for one page of a list-records request.
+
+    sort takes Airtable's shape: [{"field": "Start", "direction": "desc"}].
+    """
+    params = []
+    if filter_formula:
+        params.append(("filterByFormula", filter_formula))
+    for field in fields or []:
+        params.append(("fields[]", field))
+    if page_size:
+        params.append(("pageSize", page_size))
+    for i, spec in enumerate(sort or []):
+        params.append((f"sort[{i}][field]", spec["field"]))
+        params.append((f"sort[{i}][direction]", spec.get("direction", "asc")))
+    if view:
+        params.append(("view", view))
+    if offset:
+        params.append(("offset", offset))
+
+    endpoint = table_name
+    if params:
+        endpoint += "?" + urlencode(params, quote_via=quote)
+    return endpoint
+
 
 class AirtableClient:
     """Client for interacting with Airtable API."""
 
     BASE_URL = "https://api.airtable.com/v0"
 
-    def __init__(self, api_key: str = None, base_id: str = None):
+    def __init__(self, api_key: str = None, base_id: str = None, base_url: str = None,
+                 session=None, transport: str = None, pool_size: int = None,
+                 rate_limiter: TokenBucket = None, cache_ttl: float = None,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None):
         self.api_key = api_key or AIRTABLE_API_KEY
         self.base_id = base_id or AIRTABLE_BASE_ID
+        self.base_url = base_url or self.BASE_URL
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
-        self._last_request_time = 0
 
-    def _rate_limit(self):
+        # Shared by every client (and worker process) talking to the same base
+        self.rate_limiter = rate_limiter or get_shared_limiter(self.base_id)
+        self.retry_policy = retry_policy or RetryPolicy(AIRTABLE_MAX_RETRIES, max_delay=AIRTABLE_RETRY_MAX_DELAY)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET, name="Airtable"
+        )
+
+        # One pooled session shared by every method keeps connections alive between calls
+        self._owns_session = session is None
+        self.session = session or create_session(transport, pool_size)
+
+        self.record_cache = RecordCache() if cache_ttl is None else RecordCache(ttl=cache_ttl)
+        self.linked_index = LinkedRecordIndex()
+        self.write_buffer = None
+        self.metrics = RequestStats()
+        self.mirror = None
+        # snapshot key -> [lock, callers using it], so concurrent misses share one fetch; dropped when unused
+        self._read_locks = {}
+        self._read_locks_guard = threading.Lock()
+
+    def close(self):
+        """Release pooled connections."""
+        if self._owns_session:
+            self.session.close()
+        if self.mirror is not None:
+            self.mirror.close()
+            self.mirror = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def buffered_writes(self, max_delay: float = None) -> Iterator[WriteBuffer]:
+        """Coalesce update_record calls into batch PATCHes until the block exits.
+
+        Reads of a table flush its pending updates first, so callers still
+        see their own writes.
+        """
+        if self.write_buffer is not None:
+            yield self.write_buffer
+            return
+
+        buffer = WriteBuffer(self.batch_update, max_delay=WRITE_BUFFER_MAX_DELAY if max_delay is None else max_delay)
+        self.write_buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self.write_buffer = None
+            buffer.flush()
+            stats = buffer.stats()
+            logger.info(f"Flushed {stats['queued']} buffered updates in {stats['requests']} requests")
+
+    def use_mirror(self, path: str = None, **kwargs) -> AirtableMirror:
+        """Sync the pipeline tables into a SQLite mirror and serve their reads from it.
+
+        Unfiltered get_records and get_linked_records calls on mirrored tables
+        are answered locally; writes through this client keep the mirror current.
+        """
+        mirror = AirtableMirror(self, path, **kwargs)
+        mirror.sync()
+        self.mirror = mirror
+        return mirror
+
+    def _mirrored(self, table_name: str) -> bool:
+        return self.mirror is not None and self.mirror.is_mirrored(table_name)
+
+    def stats(self) -> dict:
+        """Request metrics plus read-cache counters for this client."""
+        stats = self.metrics.snapshot()
+        stats["cache"] = self.record_cache.stats()
+        return stats
+
+    def log_stats(self, label: str = "Airtable"):
+        """Log a summary of the request metrics collected so far."""
+        lines = self.metrics.format()
+        cache = self.record_cache.stats()
+        lines.append(f"  cache: {cache['hits']} hits, {cache['misses']} misses")
+        logger.info(f"{label} request stats: " + "\n".join(lines))
+
+    def _flush_pending(self, table_name: str):
+        if self.write_buffer is not None and self.write_buffer.has_pending(table_name):
+            self.write_buffer.flush(table_name)
+
+    def invalidate_cache(self, table_name: str = None):
+        """Drop locally held table data so the next read goes to Airtable."""
+        self.record_cache.invalidate(table_name)
+        self.linked_index.invalidate(table_name)
+
+    def _records_written(self, table_name: str, records: list[dict]):
+        """Keep local caches in step with records created or updated through this client."""
+        self.record_cache.apply_writes(table_name, records)
+        self.linked_index.upsert(table_name, records)
+        if self.mirror is not None:
+            self.mirror.apply_writes(table_name, records)
+
+    def _records_deleted(self, table_name: str, record_ids: list[str]):
+        """Keep local caches in step with records deleted through this client."""
+        self.record_cache.apply_deletes(table_name, record_ids)
+        self.linked_index.remove(table_name, record_ids)
+        if self.mirror is not None:
+            self.mirror.apply_deletes(table_name, record_ids)
+
+    def _rate_limit(self) -> float:
         """Enforce rate limiting."""
-        elapsed = time.time() - self._last_request_time
-        min_interval = 1.0 / AIRTABLE_RATE_LIMIT
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        waited = self.rate_limiter.acquire()
+        self.metrics.record_rate_limit_wait(waited)
+        return waited
+
+    def _record_request(self, table_name: str, method: str, start: float, bytes_sent: int,
+                        response=None, error: bool = False):
+        content = getattr(response, "content", None)
+        bytes_received = len(content) if isinstance(content, (bytes, bytearray)) else 0
+        self.metrics.record_request(table_name, method, time.perf_counter() - start,
+                                    bytes_sent, bytes_received, error)
 
-    def _make_request(self, method: str, endpoint: str, data: dict = None, retries: int = 3) -> dict:
-        """Make an API request with retry logic."""
-        url = f"{self.BASE_URL}/{self.base_id}/{endpoint}"
+    def _make_request(self, method: str, endpoint: str, data: dict = None) -> dict:
+        """Make an API request under the retry policy and circuit breaker."""
+        url = f"{self.base_url}/{self.base_id}/{endpoint}"
+        table_name = endpoint.split("?")[0].split("/")[0]
+        bytes_sent = len(json.dumps(data)) if data is not None else 0
+        attempts = 0
+
+        def send() -> dict:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                self.metrics.record_retry(table_name, method)
 
-        for attempt in range(retries):
             self._rate_limit()
+            start = time.perf_counter()
+            response = None
             try:
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
                     headers=self.headers,
-                    json=data
+                    json=data,
+                    timeout=AIRTABLE_TIMEOUT
                 )
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    raise
-
-    def get_records(self, table_name: str, filter_formula: str = None) -> list[dict]:
-        """Fetch all records from a table."""
-        records = []
-        offset = None
+                result = response.json()
+            except Exception:
+                self._record_request(table_name, method, start, bytes_sent, response, error=True)
+                raise
+            self._record_request(table_name, method, start, bytes_sent, response)
+            return result
 
-        while True:
-            params = []
-            if filter_formula:
-                params.append(f"filterByFormula={requests.utils.quote(filter_formula)}")
-            if offset:
-                params.append(f"offset={offset}")
+        label = f"{method} {endpoint.split('?')[0]}"
+        return call_with_retry(send, self.retry_policy, self.circuit_breaker, HTTP_ERRORS, label)
+
+    def _snapshot(self, table_name: str, filter_formula: str = None, fields: list[str] = None,
+                  sort: list[dict] = None, view: str = None) -> tuple[list[dict], int]:
+        """Cached records for a read plus the snapshot version they belong to."""
+        self._flush_pending(table_name)
+        key = (
+            table_name,
+            filter_formula,
+            tuple(fields) if fields else None,
+            tuple((s["field"], s.get("direction", "asc")) for s in sort) if sort else None,
+            view
+        )
+        with self._read_locks_guard:
+            entry = self._read_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                records = self.record_cache.get(key)
+                if records is None:
+                    records = list(self.iter_records(table_name, filter_formula, fields, sort=sort, view=view))
+                    logger.info(f"Fetched {len(records)} records from {table_name}")
+                    return records, self.record_cache.put(key, records)
+                return records, self.record_cache.version(key)
+        finally:
+            with self._read_locks_guard:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._read_locks[key]
 
-            endpoint = table_name
-            if params:
-                endpoint += "?" + "&".join(params)
+    def get_records(self, table_name: str, filter_formula: str = None, fields: list[str] = None,
+                    sort: list[dict] = None, view: str = None) -> list[dict]:
+        """Fetch all records from a table, served from the mirror or read cache when possible."""
+        if self._mirrored(table_name) and not (filter_formula or sort or view):
+            self._flush_pending(table_name)
+            return self.mirror.get_records(table_name, fields)
+        records, _ = self._snapshot(table_name, filter_formula, fields, sort, view)
+        return list(records)
 
+    def iter_records(self, table_name: str, filter_formula: str = None, fields: list[str] = None,
+                     page_size: int = None, sort: list[dict] = None, view: str = None) -> Iterator[dict]:
+        """Yield records page by page without holding the table in memory.
+
+        fields limits which columns Airtable returns (records keep their id).
+        Reads go straight to the API and bypass the read cache.
+        """
+        self._flush_pending(table_name)
+        offset = None
+        pages = records = 0
+
+        while True:
+            endpoint = build_list_endpoint(table_name, filter_formula, offset, fields, page_size, sort, view)
             result = self._make_request("GET", endpoint)
-            records.extend(result.get("records", []))
+            pages += 1
+            records += len(result.get("records", []))
+            yield from result.get("records", [])
 
             offset = result.get("offset")
             if not offset:
                 break
 
-        logger.info(f"Fetched {len(records)} records from {table_name}")
+        self.metrics.record_list_call(table_name, pages, records)
+
+    def get_records_by_id(self, table_name: str, record_ids: list[str], fields: list[str] = None) -> list[dict]:
+        """Fetch specific records through RECORD_ID() filters, RECORD_ID_CHUNK IDs per request."""
+        record_ids = list(dict.fromkeys(record_ids))
+        records = []
+        for i in range(0, len(record_ids), RECORD_ID_CHUNK):
+            chunk = record_ids[i:i + RECORD_ID_CHUNK]
+            formula = "OR(" + ", ".join(f"RECORD_ID() = '{rid}'" for rid in chunk) + ")"
+            records.extend(self.iter_records(table_name, formula, fields))
         return records
 
     def get_record(self, table_name: str, record_id: str) -> dict:
         """Fetch a single record by ID."""
+        self._flush_pending(table_name)
         endpoint = f"{table_name}/{record_id}"
         return self._make_request("GET", endpoint)
 
@@ -91,14 +311,20 @@ class AirtableClient:
         """Create a new record."""
         data = {"fields": fields}
         result = self._make_request("POST", table_name, data)
+        self._records_written(table_name, [result])
         logger.info(f"Created record in {table_name}: {result.get('id')}")
         return result
 
     def update_record(self, table_name: str, record_id: str, fields: dict) -> dict:
-        """Update an existing record."""
+        """Update an existing record (queued instead while writes are buffered)."""
+        if self.write_buffer is not None:
+            self.write_buffer.add(table_name, record_id, fields)
+            return {"id": record_id, "fields": fields}
+
         endpoint = f"{table_name}/{record_id}"
         data = {"fields": fields}
         result = self._make_request("PATCH", endpoint, data)
+        self._records_written(table_name, [result])
         logger.info(f"Updated record {record_id} in {table_name}")
         return result
 
@@ -106,6 +332,7 @@ class AirtableClient:
         """Delete a record."""
         endpoint = f"{table_name}/{record_id}"
         result = self._make_request("DELETE", endpoint)
+        self._records_deleted(table_name, [record_id])
         logger.info(f"Deleted record {record_id} from {table_name}")
         return result
 
@@ -117,6 +344,7 @@ class AirtableClient:
             data = {"records": [{"fields": r} for r in batch]}
             result = self._make_request("POST", table_name, data)
             results.extend(result.get("records", []))
+        self._records_written(table_name, results)
         return results
 
     def batch_update(self, table_name: str, records: list[dict]) -> list[dict]:
@@ -127,15 +355,57 @@ class AirtableClient:
             data = {"records": batch}
             result = self._make_request("PATCH", table_name, data)
             results.extend(result.get("records", []))
+        self._records_written(table_name, results)
+        return results
+
+    def batch_delete(self, table_name: str, record_ids: list[str]) -> list[dict]:
+        """Delete multiple records in batches using the records[] multi-delete form."""
+        self._flush_pending(table_name)
+        results = []
+        for i in range(0, len(record_ids), BATCH_SIZE):
+            batch = record_ids[i:i + BATCH_SIZE]
+            endpoint = f"{table_name}?" + urlencode([("records[]", rid) for rid in batch])
+            result = self._make_request("DELETE", endpoint)
+            results.extend(result.get("records", []))
+        self._records_deleted(table_name, [r["id"] for r in results if r.get("deleted")])
+        logger.info(f"Deleted {len(results)} records from {table_name}")
         return results
 
+    def batch_upsert(self, table_name: str, records: list[dict], merge_on: list[str]) -> dict:
+        """Create or update records in batches, matched on merge_on fields via performUpsert.
+
+        Airtable only merges on scalar fields (text, number, email, ...), not on
+        linked-record or computed fields. Returns created and updated record IDs
+        along with the written records.
+        """
+        self._flush_pending(table_name)
+        upserted = {"created": [], "updated": [], "records": []}
+        for i in range(0, len(records), BATCH_SIZE):
+            batch = records[i:i + BATCH_SIZE]
+            data = {
+                "performUpsert": {"fieldsToMergeOn": merge_on},
+                "records": [{"fields": r} for r in batch]
+            }
+            result = self._make_request("PATCH", table_name, data)
+            upserted["created"].extend(result.get("createdRecords", []))
+            upserted["updated"].extend(result.get("updatedRecords", []))
+            upserted["records"].extend(result.get("records", []))
+        self._records_written(table_name, upserted["records"])
+        logger.info(f"Upserted {len(records)} records in {table_name}: "
+                    f"{len(upserted['created'])} created, {len(upserted['updated'])} updated")
+        return upserted
+
     def get_linked_records(self, parent_id: str, child_table: str, link_field: str = "Application ID") -> list[dict]:
         """Fetch all child records linked to a parent."""
-        # Get all records and filter in Python (Airtable formula doesn't work well with record IDs)
-        all_records = self.get_records(child_table)
-        linked = []
-        for record in all_records:
-            links = record.get("fields", {}).get(link_field, [])
-            if parent_id in links:
-                linked.append(record)
+        if self._mirrored(child_table):
+            self._flush_pending(child_table)
+            return self.mirror.get_linked_records(parent_id, child_table, link_field)
+
+        # Airtable formulas don't work well with record IDs, so index the cached
+        # child table snapshot and rebuild only when a refetch brings new content
+        records, version = self._snapshot(child_table)
+        linked = self.linked_index.lookup(child_table, link_field, parent_id, version)
+        if linked is None:
+            self.linked_index.load(child_table, records, version)
+            linked = self.linked_index.lookup(child_table, link_field, parent_id, version)
         return linked
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Async Airtable Client - asyncio sibling of AirtableClient with bounded concurrency.
+"""
+import asyncio
+from typing import AsyncIterator
+from urllib.parse import urlencode
+import httpx
+from src.airtable_client import AirtableClient, build_list_endpoint
+from src.config import (
+    AIRTABLE_API_KEY,
+    AIRTABLE_BASE_ID,
+    AIRTABLE_MAX_CONCURRENCY,
+    AIRTABLE_MAX_RETRIES,
+    AIRTABLE_POOL_SIZE,
+    AIRTABLE_RETRY_MAX_DELAY,
+    AIRTABLE_TIMEOUT,
+    BATCH_SIZE,
+    CIRCUIT_BREAKER_RESET,
+    CIRCUIT_BREAKER_THRESHOLD
+)
+from src.rate_limiter import TokenBucket, get_shared_limiter
+from src.retry import CircuitBreaker, RetryPolicy, call_with_retry_async
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncAirtableClient:
+    """Async client for the Airtable API.
+
+    Up to max_concurrency requests are in flight at once; each still takes a
+    token from the shared rate limiter, so the base's request budget holds.
+    """
+
+    BASE_URL = AirtableClient.BASE_URL
+
+    def __init__(self, api_key: str = None, base_id: str = None, base_url: str = None,
+                 max_concurrency: int = None, rate_limiter: TokenBucket = None,
+                 http_client: httpx.AsyncClient = None, pool_size: int = None,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None):
+        self.api_key = api_key or AIRTABLE_API_KEY
+        self.base_id = base_id or AIRTABLE_BASE_ID
+        self.base_url = base_url or self.BASE_URL
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.rate_limiter = rate_limiter or get_shared_limiter(self.base_id)
+        self._semaphore = asyncio.Semaphore(max_concurrency or AIRTABLE_MAX_CONCURRENCY)
+        self.retry_policy = retry_policy or RetryPolicy(AIRTABLE_MAX_RETRIES, max_delay=AIRTABLE_RETRY_MAX_DELAY)
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET, name="Airtable"
+        )
+
+        self._owns_http = http_client is None
+        if http_client is None:
+            pool_size = pool_size or AIRTABLE_POOL_SIZE
+            limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            http_client = httpx.AsyncClient(limits=limits, timeout=AIRTABLE_TIMEOUT)
+        self.http = http_client
+
+    async def aclose(self):
+        """Release pooled connections."""
+        if self._owns_http:
+            await self.http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _rate_limit(self) -> float:
+        """Enforce rate limiting without blocking the event loop."""
+        return await self.rate_limiter.acquire_async()
+
+    async def _make_request(self, method: str, endpoint: str, data: dict = None) -> dict:
+        """Make an API request under the retry policy and circuit breaker."""
+        url = f"{self.base_url}/{self.base_id}/{endpoint}"
+
+        async def send() -> dict:
+            # The semaphore bounds in-flight requests; the limiter paces them
+            async with self._semaphore:
+                await self._rate_limit()
+                response = await self.http.request(method, url, headers=self.headers, json=data)
+                response.raise_for_status()
+                return response.json()
+
+        label = f"{method} {endpoint.split('?')[0]}"
+        return await call_with_retry_async(send, self.retry_policy, self.circuit_breaker, (httpx.HTTPError,), label)
+
+    async def get_records(self, table_name: str, filter_formula: str = None, fields: list[str] = None,
+                          sort: list[dict] = None, view: str = None) -> list[dict]:
+        """Fetch all records from a table."""
+        records = [r async for r in self.iter_records(table_name, filter_formula, fields, sort=sort, view=view)]
+        logger.info(f"Fetched {len(records)} records from {table_name}")
+        return records
+
+    async def iter_records(self, table_name: str, filter_formula: str = None, fields: list[str] = None,
+                           page_size: int = None, sort: list[dict] = None, view: str = None) -> AsyncIterator[dict]:
+        """Yield records page by page without holding the table in memory."""
+        offset = None
+
+        # Pages are chained by offset, so they are fetched one after another
+        while True:
+            endpoint = build_list_endpoint(table_name, filter_formula, offset, fields, page_size, sort, view)
+            result = await self._make_request("GET", endpoint)
+            for record in result.get("records", []):
+                yield record
+
+            offset = result.get("offset")
+            if not offset:
+                break
+
+    async def get_record(self, table_name: str, record_id: str) -> dict:
+        """Fetch a single record by ID."""
+        endpoint = f"{table_name}/{record_id}"
+        return await self._make_request("GET", endpoint)
+
+    async def create_record(self, table_name: str, fields: dict) -> dict:
+        """Create a new record."""
+        data = {"fields": fields}
+        result = await self._make_request("POST", table_name, data)
+        logger.info(f"Created record in {table_name}: {result.get('id')}")
+        return result
+
+    async def update_record(self, table_name: str, record_id: str, fields: dict) -> dict:
+        """Update an existing record."""
+        endpoint = f"{table_name}/{record_id}"
+        data = {"fields": fields}
+        result = await self._make_request("PATCH", endpoint, data)
+        logger.info(f"Updated record {record_id} in {table_name}")
+        return result
+
+    async def delete_record(self, table_name: str, record_id: str) -> dict:
+        """Delete a record."""
+        endpoint = f"{table_name}/{record_id}"
+        result = await self._make_request("DELETE", endpoint)
+        logger.info(f"Deleted record {record_id} from {table_name}")
+        return result
+
+    async def _send_batches(self, method: str, table_name: str, payloads: list[dict]) -> list[dict]:
+        """Send batch payloads concurrently, returning records in input order."""
+        results = await asyncio.gather(*(
+            self._make_request(method, table_name, payload) for payload in payloads
+        ))
+        records = []
+        for result in results:
+            records.extend(result.get("records", []))
+        return records
+
+    async def batch_create(self, table_name: str, records: list[dict]) -> list[dict]:
+        """Create multiple records in concurrent batches."""
+        payloads = [
+            {"records": [{"fields": r} for r in records[i:i + BATCH_SIZE]]}
+            for i in range(0, len(records), BATCH_SIZE)
+        ]
+        return await self._send_batches("POST", table_name, payloads)
+
+    async def batch_update(self, table_name: str, records: list[dict]) -> list[dict]:
+        """Update multiple records in concurrent batches."""
+        payloads = [
+            {"records": records[i:i + BATCH_SIZE]}
+            for i in range(0, len(records), BATCH_SIZE)
+        ]
+        return await self._send_batches("PATCH", table_name, payloads)
+
+    async def batch_delete(self, table_name: str, record_ids: list[str]) -> list[dict]:
+        """Delete multiple records in concurrent batches."""
+        endpoints = [
+            f"{table_name}?" + urlencode([("records[]", rid) for rid in record_ids[i:i + BATCH_SIZE]])
+            for i in range(0, len(record_ids), BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._make_request("DELETE", e) for e in endpoints))
+        return [record for result in results for record in result.get("records", [])]
+
+    async def batch_upsert(self, table_name: str, records: list[dict], merge_on: list[str]) -> dict:
+        """Create or update records in concurrent batches via performUpsert."""
+        payloads = [
+            {"performUpsert": {"fieldsToMergeOn": merge_on}, "records": [{"fields": r} for r in records[i:i + BATCH_SIZE]]}
+            for i in range(0, len(records), BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(
+            self._make_request("PATCH", table_name, payload) for payload in payloads
+        ))
+        upserted = {"created": [], "updated": [], "records": []}
+        for result in results:
+            upserted["created"].extend(result.get("createdRecords", []))
+            upserted["updated"].extend(result.get("updatedRecords", []))
+            upserted["records"].extend(result.get("records", []))
+        return upserted
+
+    async def get_linked_records(self, parent_id: str, child_table: str, link_field: str = "Application ID") -> list[dict]:
+        """Fetch all child records linked to a parent."""
+        all_records = await self.get_records(child_table)
+        return [
+            record for record in all_records
+            if parent_id in record.get("fields", {}).get(link_field, [])
+        ]
@@ -0,0 +1,110 @@
+"""
+Changeset - Planned creates, updates and deletes across tables, applied in batched requests.
+"""
+from src.airtable_client import AirtableClient
+from src.config import BATCH_SIZE
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+OPERATIONS = ("update", "create", "delete")
+
+
+def is_empty_value(value) -> bool:
+    """Airtable omits empty text, empty lists and unset values from records it returns."""
+    return value is None or value == "" or value == []
+
+
+def changed_fields(existing: dict, fields: dict) -> list[str]:
+    """Names of fields whose planned value differs from the existing record's."""
+    changed = []
+    for name, value in fields.items():
+        current = existing.get(name)
+        if is_empty_value(value) and is_empty_value(current):
+            continue
+        if current != value:
+            changed.append(name)
+    return changed
+
+
+class Changeset:
+    """Writes planned per table, each tagged with the applicant (owner) it belongs to.
+
+    Applying sends every table's changes as 10-record batch calls, however
+    many owners they came from. A failed batch only fails the owners that
+    had a change in it.
+    """
+
+    def __init__(self):
+        # table -> {"update": [(owner, {"id", "fields"})], "create": [(owner, fields)], "delete": [(owner, id)]}
+        self.tables = {}
+
+    def _ops(self, table_name: str) -> dict:
+        return self.tables.setdefault(table_name, {op: [] for op in OPERATIONS})
+
+    def create(self, table_name: str, fields: dict, owner: str = None):
+        self._ops(table_name)["create"].append((owner, fields))
+
+    def update(self, table_name: str, record_id: str, fields: dict, owner: str = None):
+        self._ops(table_name)["update"].append((owner, {"id": record_id, "fields": fields}))
+
+    def delete(self, table_name: str, record_id: str, owner: str = None):
+        self._ops(table_name)["delete"].append((owner, record_id))
+
+    def extend(self, other: "Changeset"):
+        """Append every change planned in another changeset."""
+        for table_name, ops in other.tables.items():
+            for op in OPERATIONS:
+                self._ops(table_name)[op].extend(ops[op])
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """{table: {"create": n, "update": n, "delete": n}}"""
+        return {table_name: {op: len(ops[op]) for op in OPERATIONS} for table_name, ops in self.tables.items()}
+
+    def __len__(self) -> int:
+        return sum(len(ops[op]) for ops in self.tables.values() for op in OPERATIONS)
+
+    def describe(self, per_change: bool = True) -> str:
+        """Human-readable plan, one line per table, each followed by one per change unless per_change is off."""
+        lines = []
+        for table_name, ops in self.tables.items():
+            lines.append(f"{table_name}: {len(ops['create'])} create, {len(ops['update'])} update, "
+                         f"{len(ops['delete'])} delete")
+            if not per_change:
+                continue
+            for owner, fields in ops["create"]:
+                lines.append(f"  create for {owner}: {', '.join(sorted(fields))}")
+            for owner, record in ops["update"]:
+                lines.append(f"  update {record['id']} for {owner}: {', '.join(sorted(record['fields']))}")
+            for owner, record_id in ops["delete"]:
+                lines.append(f"  delete {record_id} for {owner}")
+        return "\n".join(lines) if lines else "No changes"
+
+    def apply(self, client: AirtableClient, on_applied=None) -> set[str]:
+        """Send all changes in batches; returns the owners with at least one failed batch.
+
+        on_applied(table_name, op, results) is called after each successful
+        batch with the records Airtable returned for it.
+        """
+        failed = set()
+        for table_name, ops in self.tables.items():
+            for op in OPERATIONS:
+                changes = ops[op]
+                for i in range(0, len(changes), BATCH_SIZE):
+                    batch = changes[i:i + BATCH_SIZE]
+                    payload = [change for _, change in batch]
+                    try:
+                        if op == "create":
+                            results = client.batch_create(table_name, payload)
+                        elif op == "update":
+                            results = client.batch_update(table_name, payload)
+                        else:
+                            results = client.batch_delete(table_name, payload)
+                    except Exception as e:
+                        owners = {owner for owner, _ in batch}
+                        logger.error(f"Failed to {op} {len(batch)} records in {table_name}: {e}")
+                        failed.update(owners)
+                        continue
+                    if on_applied:
+                        on_applied(table_name, op, results)
+        return failed
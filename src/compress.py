@@ -1,21 +1,52 @@
 """
 Compression Pipeline - Gather data from linked tables and create canonical JSON per applicant.
 """
+import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from src.airtable_client import AirtableClient
 from src.config import (
+    AIRTABLE_MIRROR_PATH,
+    AIRTABLE_POOL_SIZE,
+    COMPRESS_WATERMARK_PATH,
+    COMPRESS_WORKERS,
     TABLE_APPLICANTS,
     TABLE_PERSONAL,
     TABLE_EXPERIENCE,
     TABLE_SALARY
 )
-from src.utils import get_logger
+from src.document_cache import load_document
+from src.json_codec import encode_applicant
+from src.linked_index import group_by_link
+from src.mirror import SYNC_OVERLAP_SECONDS
+from src.utils import canonical_json, format_airtable_time, get_logger
 
 logger = get_logger(__name__)
 
+# Applicant fields needed to rebuild the JSON and compare it with the stored one
+APPLICANT_FIELDS = ["Application ID", "Compressed JSON"]
 
-def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_record_id: str) -> dict:
-    """Fetch all related data for one applicant."""
+# Child-table fields read by the bulk join (link field included)
+PERSONAL_FIELDS = ["Application ID", "Full Name", "Email", "Location", "LinkedIn"]
+EXPERIENCE_FIELDS = ["Application ID", "Company", "Title", "Start", "End", "Technologies"]
+SALARY_FIELDS = ["Application ID", "Preferred Rate", "Minimum Rate", "Currency", "Availability"]
+
+# Inverse link fields on Applications listing each child table's records
+CHILD_LINK_FIELDS = {TABLE_PERSONAL: "Personal Details", TABLE_EXPERIENCE: "Work Experience", TABLE_SALARY: "Salary Preferences"}
+
+# Applicants whose own JSON inputs changed since {since}, or who were never compressed
+APPLICANT_CHANGED_FORMULA = (
+    "OR(IS_AFTER(LAST_MODIFIED_TIME({{Application ID}}), '{since}'), "
+    "IS_AFTER(CREATED_TIME(), '{since}'), {{Compressed JSON}} = '')"
+)
+CHILD_CHANGED_FORMULA = "OR(IS_AFTER(LAST_MODIFIED_TIME(), '{since}'), IS_AFTER(CREATED_TIME(), '{since}'))"
+
+
+def assemble_applicant_data(applicant_id: str, applicant_record_id: str, personal_records: list[dict],
+                            experience_records: list[dict], salary_records: list[dict]) -> dict:
+    """Build the applicant data object from its linked child records."""
     data = {
         "applicant_id": applicant_id,
         "record_id": applicant_record_id,
@@ -24,8 +55,6 @@ def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_re
         "salary": {}
     }
 
-    # Fetch Personal Details
-    personal_records = client.get_linked_records(applicant_record_id, TABLE_PERSONAL)
     if personal_records:
         fields = personal_records[0].get("fields", {})
         data["personal"] = {
@@ -35,8 +64,6 @@ def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_re
             "linkedin": fields.get("LinkedIn", "")
         }
 
-    # Fetch Work Experience
-    experience_records = client.get_linked_records(applicant_record_id, TABLE_EXPERIENCE)
     for record in experience_records:
         fields = record.get("fields", {})
         data["experience"].append({
@@ -48,8 +75,6 @@ def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_re
             "technologies": fields.get("Technologies", [])
         })
 
-    # Fetch Salary Preferences
-    salary_records = client.get_linked_records(applicant_record_id, TABLE_SALARY)
     if salary_records:
         fields = salary_records[0].get("fields", {})
         data["salary"] = {
@@ -62,25 +87,56 @@ def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_re
     return data
 
 
+def fetch_applicant_data(client: AirtableClient, applicant_id: str, applicant_record_id: str) -> dict:
+    """Fetch all related data for one applicant."""
+    personal_records = client.get_linked_records(applicant_record_id, TABLE_PERSONAL)
+    experience_records = client.get_linked_records(applicant_record_id, TABLE_EXPERIENCE)
+    salary_records = client.get_linked_records(applicant_record_id, TABLE_SALARY)
+    return assemble_applicant_data(applicant_id, applicant_record_id,
+                                   personal_records, experience_records, salary_records)
+
+
 def build_json_object(applicant_data: dict) -> str:
-    """Convert applicant data to JSON string."""
-    return json.dumps(applicant_data, indent=2)
+    """Convert applicant data to its Compressed JSON encoding."""
+    return encode_applicant(applicant_data)
 
 
-def compress_single_applicant(client: AirtableClient, applicant_record: dict) -> bool:
-    """Compress data for a single applicant."""
+def is_unchanged(applicant_record: dict, data: dict, reencode: bool = False) -> bool:
+    """True when the stored Compressed JSON already holds exactly this content.
+
+    With reencode, content stored in an older encoding counts as changed so
+    it gets rewritten in the current one.
+    """
+    stored = applicant_record.get("fields", {}).get("Compressed JSON")
+    if not stored:
+        return False
+    if reencode:
+        return stored == build_json_object(data)
+    try:
+        return load_document(stored, applicant_record.get("id")).canonical == canonical_json(data)
+    except json.JSONDecodeError:
+        return False
+
+
+def compress_applicant(client: AirtableClient, applicant_record: dict, reencode: bool = False) -> str:
+    """Compress one applicant; returns "written", "skipped" (JSON unchanged) or "failed"."""
     record_id = applicant_record.get("id")
     fields = applicant_record.get("fields", {})
     applicant_id = fields.get("Application ID")
 
     if not applicant_id:
         logger.warning(f"Record {record_id} has no Application ID, skipping")
-        return False
+        return "failed"
 
     try:
         # Fetch all related data
         data = fetch_applicant_data(client, applicant_id, record_id)
 
+        # Leave the record alone if nothing changed; a write would still fire automations
+        if is_unchanged(applicant_record, data, reencode):
+            logger.info(f"Compressed JSON unchanged for {applicant_id}, skipping write")
+            return "skipped"
+
         # Build JSON
         json_string = build_json_object(data)
 
@@ -90,33 +146,206 @@ def compress_single_applicant(client: AirtableClient, applicant_record: dict) ->
         })
 
         logger.info(f"Compressed applicant {applicant_id}")
-        return True
+        return "written"
 
     except Exception as e:
         logger.error(f"Failed to compress applicant {applicant_id}: {e}")
-        return False
+        return "failed"
 
 
-def compress_all_applicants():
-    """Main function: compress all applicants in batch."""
-    client = AirtableClient()
+def compress_single_applicant(client: AirtableClient, applicant_record: dict) -> bool:
+    """Compress data for a single applicant."""
+    return compress_applicant(client, applicant_record) != "failed"
 
-    # Fetch all applicants
-    applicants = client.get_records(TABLE_APPLICANTS)
-    logger.info(f"Found {len(applicants)} applicants to compress")
 
-    success_count = 0
-    failure_count = 0
+def fetch_children(client: AirtableClient, table_name: str, fields: list[str], applicants: list[dict] = None) -> list[dict]:
+    """A child table's records: all of them, or only those the given applicants link to.
 
+    The second form reads the applicants' inverse link fields (CHILD_LINK_FIELDS)
+    and fetches just those record IDs, so its cost follows the number of
+    applicants rather than the size of the table.
+    """
+    if applicants is None:
+        return client.get_records(table_name, fields=fields)
+    link_field = CHILD_LINK_FIELDS[table_name]
+    record_ids = [rid for a in applicants for rid in a.get("fields", {}).get(link_field, [])]
+    return client.get_records_by_id(table_name, record_ids, fields=fields) if record_ids else []
+
+
+def compress_applicants_bulk(client: AirtableClient, applicants: list[dict], reencode: bool = False,
+                             workers: int = 1, linked_only: bool = False) -> dict[str, list[str]]:
+    """Compress applicants from one scan per child table.
+
+    Children are hash-joined on their Application ID link instead of being
+    looked up per applicant, and the updates go out through the client's
+    write buffer, so a run costs O(pages + N/10) requests. linked_only
+    fetches just the children these applicants link to (they must carry
+    CHILD_LINK_FIELDS) instead of scanning whole tables. With workers > 1
+    the three child tables are read concurrently. Returns record IDs
+    grouped by outcome: "written", "skipped" and "failed".
+    """
+    scans = [(TABLE_PERSONAL, PERSONAL_FIELDS), (TABLE_EXPERIENCE, EXPERIENCE_FIELDS), (TABLE_SALARY, SALARY_FIELDS)]
+    parents = applicants if linked_only else None
+    with ThreadPoolExecutor(max_workers=min(workers, len(scans))) as pool:
+        personal, experience, salary = pool.map(
+            lambda scan: group_by_link(fetch_children(client, scan[0], scan[1], parents)), scans
+        )
+
+    outcomes = {"written": [], "skipped": [], "failed": []}
     for applicant in applicants:
-        if compress_single_applicant(client, applicant):
-            success_count += 1
+        record_id = applicant["id"]
+        applicant_id = applicant.get("fields", {}).get("Application ID")
+        if not applicant_id:
+            logger.warning(f"Record {record_id} has no Application ID, skipping")
+            outcomes["failed"].append(record_id)
+            continue
+
+        data = assemble_applicant_data(applicant_id, record_id, personal.get(record_id, []),
+                                       experience.get(record_id, []), salary.get(record_id, []))
+        if is_unchanged(applicant, data, reencode):
+            outcomes["skipped"].append(record_id)
+            continue
+
+        client.update_record(TABLE_APPLICANTS, record_id, {"Compressed JSON": build_json_object(data)})
+        outcomes["written"].append(record_id)
+
+    logger.info(f"Built Compressed JSON for {len(applicants)} applicants from bulk child scans: "
+                f"{len(outcomes['written'])} changed, {len(outcomes['skipped'])} unchanged")
+    return outcomes
+
+
+def load_watermark(path: str = COMPRESS_WATERMARK_PATH) -> str | None:
+    """Start time of the last successful incremental run, if one was recorded."""
+    try:
+        with open(path) as f:
+            return json.load(f).get("last_success")
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def save_watermark(timestamp: str, path: str = COMPRESS_WATERMARK_PATH):
+    """Record a successful run's start time, replacing the file atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"last_success": timestamp}, f)
+    os.replace(tmp_path, path)
+
+
+def find_changed_applicants(client: AirtableClient, since: str) -> list[dict]:
+    """Applicants whose record or linked child records changed after since.
+
+    Deleting a child record or moving it to another applicant isn't seen
+    on the applicant it left; a full run picks those up. The applicants
+    come with their CHILD_LINK_FIELDS, for compress_applicants_bulk(linked_only=True).
+    """
+    fields = APPLICANT_FIELDS + list(CHILD_LINK_FIELDS.values())
+    applicants = client.get_records(TABLE_APPLICANTS, APPLICANT_CHANGED_FORMULA.format(since=since),
+                                    fields=fields)
+    known = {a["id"] for a in applicants}
+
+    parents = {}
+    for table in (TABLE_PERSONAL, TABLE_EXPERIENCE, TABLE_SALARY):
+        changed = client.get_records(table, CHILD_CHANGED_FORMULA.format(since=since), fields=["Application ID"])
+        parents.update(group_by_link(changed))
+
+    missing = [record_id for record_id in parents if record_id not in known]
+    if missing:
+        applicants.extend(client.get_records_by_id(TABLE_APPLICANTS, missing, fields=fields))
+    return applicants
+
+
+def compress_applicants_concurrently(client: AirtableClient, applicants: list[dict],
+                                     reencode: bool = False, workers: int = 1) -> dict[str, list[str]]:
+    """Compress applicants one by one on a pool of worker threads.
+
+    Workers share the client, so they share its rate limiter, read cache
+    and write buffer. A failure only affects its own applicant. Outcomes
+    are collected in input order, whatever order the workers finish in.
+    """
+    def compress(applicant: dict) -> str:
+        try:
+            return compress_applicant(client, applicant, reencode)
+        except Exception as e:
+            logger.error(f"Failed to compress record {applicant.get('id')}: {e}")
+            return "failed"
+
+    outcomes = {"written": [], "skipped": [], "failed": []}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for applicant, outcome in zip(applicants, pool.map(compress, applicants)):
+            outcomes[outcome].append(applicant["id"])
+    return outcomes
+
+
+def compress_all_applicants(bulk: bool = True, incremental: bool = False,
+                            watermark_path: str = COMPRESS_WATERMARK_PATH, reencode: bool = False,
+                            workers: int = COMPRESS_WORKERS, overlap: float = SYNC_OVERLAP_SECONDS):
+    """Main function: compress all applicants in batch.
+
+    bulk joins the child tables in memory; bulk=False compresses applicants
+    one at a time through compress_applicant, on workers threads. incremental
+    only recompresses applicants changed since the last successful
+    incremental run (everyone, the first time) and advances the watermark
+    when the run has no failures. The watermark is the local start time less
+    overlap seconds, as in the mirror's delta syncs, so a local clock running
+    ahead of Airtable's doesn't skip edits; applicants re-checked because of
+    the overlap are skipped by the content check. reencode rewrites values
+    whose content is current but whose encoding isn't.
+    """
+    # One millisecond more so edits landing in the same millisecond as the start aren't missed next time
+    started = format_airtable_time(datetime.now(timezone.utc) - timedelta(seconds=overlap, milliseconds=1))
+    workers = max(1, workers)
+
+    with AirtableClient(pool_size=max(AIRTABLE_POOL_SIZE, workers)) as client:
+        if AIRTABLE_MIRROR_PATH:
+            client.use_mirror(AIRTABLE_MIRROR_PATH)
+
+        since = load_watermark(watermark_path) if incremental else None
+        if since:
+            applicants = find_changed_applicants(client, since)
+            logger.info(f"Found {len(applicants)} applicants changed since {since}")
         else:
-            failure_count += 1
+            # Fetch all applicants (the ID rebuilds their JSON, the stored JSON spots no-op writes)
+            applicants = client.get_records(TABLE_APPLICANTS, fields=APPLICANT_FIELDS)
+            logger.info(f"Found {len(applicants)} applicants to compress")
+
+        with client.buffered_writes() as writes:
+            if bulk:
+                # An incremental run reads only the changed applicants' children
+                outcomes = compress_applicants_bulk(client, applicants, reencode, workers, linked_only=bool(since))
+            else:
+                outcomes = compress_applicants_concurrently(client, applicants, reencode, workers)
+
+        # Buffered updates are sent in batches, so some failures only surface at flush
+        failed_writes = set(writes.failed_ids)
+        written_count = sum(1 for record_id in outcomes["written"] if record_id not in failed_writes)
+        skipped_count = len(outcomes["skipped"])
+        success_count = written_count + skipped_count
+        failure_count = len(applicants) - success_count
+
+        if incremental:
+            # Records without an Application ID can never succeed, so they don't hold the watermark back
+            unusable = sum(1 for a in applicants if not a.get("fields", {}).get("Application ID"))
+            if failure_count == unusable:
+                save_watermark(started, watermark_path)
+            else:
+                logger.warning("Compression had failures, keeping the previous watermark")
 
-    logger.info(f"Compression complete: {success_count} succeeded, {failure_count} failed")
-    return success_count, failure_count
+        client.log_stats("Compression")
+        logger.info(f"Compression complete: {success_count} succeeded ({written_count} written, "
+                    f"{skipped_count} unchanged and skipped), {failure_count} failed")
+        return success_count, failure_count
 
 
 if __name__ == "__main__":
-    compress_all_applicants()
+    parser = argparse.ArgumentParser(description="Compress applicant data into Compressed JSON.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only recompress applicants changed since the last successful incremental run")
+    parser.add_argument("--per-applicant", action="store_true",
+                        help="look up child records per applicant instead of joining whole tables")
+    parser.add_argument("--reencode", action="store_true",
+                        help="rewrite Compressed JSON stored in an older encoding even if its content is current")
+    parser.add_argument("--workers", type=int, default=COMPRESS_WORKERS,
+                        help="applicants compressed concurrently (threads sharing one rate limiter)")
+    args = parser.parse_args()
+    compress_all_applicants(bulk=not args.per_applicant, incremental=args.incremental,
+                            reencode=args.reencode, workers=args.workers)
@@ -34,10 +34,67 @@ TIER_1_COMPANIES = [
     "IBM",
     "Intel"
 ]
+
+# Other names Tier-1 companies go by (former names, parents, subsidiaries) -> the company above
+TIER_1_ALIASES = {
+    "Meta": "Facebook",
+    "Meta Platforms": "Facebook",
+    "Instagram": "Facebook",
+    "WhatsApp": "Facebook",
+    "Alphabet": "Google",
+    "DeepMind": "Google",
+    "YouTube": "Google",
+    "AWS": "Amazon",
+    "Amazon Web Services": "Amazon",
+    "GitHub": "Microsoft",
+    "LinkedIn": "Microsoft"
+}
 MIN_EXPERIENCE_YEARS = 4
 MAX_PREFERRED_RATE = 100
 MIN_AVAILABILITY_HOURS = 20
 APPROVED_LOCATIONS = ["USA", "CANADA", "UK", "GERMANY", "INDIA"]
 
 AIRTABLE_RATE_LIMIT = 5  
-BATCH_SIZE = 10
\ No newline at end of file
+AIRTABLE_RATE_BURST = AIRTABLE_RATE_LIMIT
+# Directory for the cross-process rate limit state (unset = system temp dir, empty = per-process only)
+AIRTABLE_RATE_LIMIT_DIR = os.getenv("AIRTABLE_RATE_LIMIT_DIR")
+BATCH_SIZE = 10
+
+# HTTP connection pooling
+AIRTABLE_HTTP_TRANSPORT = os.getenv("AIRTABLE_HTTP_TRANSPORT", "requests")  # "requests" or "httpx"
+AIRTABLE_HTTP2 = os.getenv("AIRTABLE_HTTP2", "false").lower() == "true"
+AIRTABLE_POOL_SIZE = int(os.getenv("AIRTABLE_POOL_SIZE", "10"))
+AIRTABLE_TIMEOUT = 30
+
+# Retries and circuit breaker (shared by AirtableClient and the LLM calls)
+AIRTABLE_MAX_RETRIES = 3
+AIRTABLE_RETRY_MAX_DELAY = 30
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RESET = float(os.getenv("CIRCUIT_BREAKER_RESET", "60"))
+AIRTABLE_MAX_CONCURRENCY = int(os.getenv("AIRTABLE_MAX_CONCURRENCY", "5"))
+
+# Read cache: seconds a table snapshot stays valid (0 disables) and total records held
+AIRTABLE_CACHE_TTL = float(os.getenv("AIRTABLE_CACHE_TTL", "60"))
+AIRTABLE_CACHE_MAX_RECORDS = int(os.getenv("AIRTABLE_CACHE_MAX_RECORDS", "50000"))
+
+# Parsed Compressed JSON documents kept in memory per process (0 disables)
+DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "5000"))
+
+# Buffered writes: flush a table once its oldest pending update is this many seconds old
+WRITE_BUFFER_MAX_DELAY = float(os.getenv("WRITE_BUFFER_MAX_DELAY", "5"))
+
+# Local SQLite mirror of the base (unset = pipelines read straight from Airtable)
+AIRTABLE_MIRROR_PATH = os.getenv("AIRTABLE_MIRROR_PATH")
+# Seconds between ID-only scans that drop records deleted in Airtable from the mirror
+AIRTABLE_MIRROR_RECONCILE = float(os.getenv("AIRTABLE_MIRROR_RECONCILE", "3600"))
+
+# Incremental compression: where the last successful run's start time is kept
+COMPRESS_WATERMARK_PATH = os.getenv("COMPRESS_WATERMARK_PATH", ".compress_watermark.json")
+
+# Compressed JSON encoding: "never" writes plain compact JSON (readable by airtable_scripts),
+# "auto" zlib-packs applicants with long experience histories, "always" packs every applicant
+COMPRESSED_JSON_PACK = os.getenv("COMPRESSED_JSON_PACK", "never")
+COMPRESSED_JSON_PACK_MIN_EXPERIENCE = int(os.getenv("COMPRESSED_JSON_PACK_MIN_EXPERIENCE", "8"))
+
+# Applicants compressed concurrently by compress_all_applicants (1 = sequential)
+COMPRESS_WORKERS = int(os.getenv("COMPRESS_WORKERS", "1"))
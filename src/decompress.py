@@ -1,26 +1,33 @@
 """
 Decompression Pipeline - Read Compressed JSON and upsert child table records.
 """
+import argparse
 import json
 from src.airtable_client import AirtableClient
+from src.changeset import Changeset, changed_fields
+from src.compress import EXPERIENCE_FIELDS, PERSONAL_FIELDS, SALARY_FIELDS
 from src.config import (
+    AIRTABLE_MIRROR_PATH,
     TABLE_APPLICANTS,
     TABLE_PERSONAL,
     TABLE_EXPERIENCE,
     TABLE_SALARY
 )
+from src.document_cache import load_document
+from src.experience_match import ExperienceMatcher
+from src.linked_index import group_by_link
 from src.utils import get_logger, validate_json_structure
 
 logger = get_logger(__name__)
 
 
-def parse_compressed_json(json_string: str) -> dict | None:
+def parse_compressed_json(json_string: str, record_id: str = None) -> dict | None:
     """Parse and validate JSON structure."""
     if not json_string:
         return None
 
     try:
-        data = json.loads(json_string)
+        data = load_document(json_string, record_id).data
         is_valid, errors = validate_json_structure(data)
         if not is_valid:
             logger.warning(f"JSON validation errors: {errors}")
@@ -30,18 +37,46 @@ def parse_compressed_json(json_string: str) -> dict | None:
         return None
 
 
+def personal_fields(applicant_record_id: str, personal_data: dict) -> dict:
+    """Personal Details fields for an applicant's personal section."""
+    return {
+        "Full Name": personal_data.get("name", ""),
+        "Email": personal_data.get("email", ""),
+        "Location": personal_data.get("location", ""),
+        "LinkedIn": personal_data.get("linkedin", ""),
+        "Application ID": [applicant_record_id]
+    }
+
+
+def experience_fields(applicant_record_id: str, exp: dict) -> dict:
+    """Work Experience fields for one experience entry."""
+    return {
+        "Company": exp.get("company", ""),
+        "Title": exp.get("title", ""),
+        "Start": exp.get("start", ""),
+        "End": exp.get("end", ""),
+        "Technologies": exp.get("technologies", []),
+        "Application ID": [applicant_record_id]
+    }
+
+
+def salary_fields(applicant_record_id: str, salary_data: dict) -> dict:
+    """Salary Preferences fields for an applicant's salary section."""
+    return {
+        "Preferred Rate": salary_data.get("preferred_rate", 0),
+        "Minimum Rate": salary_data.get("minimum_rate", 0),
+        "Currency": salary_data.get("currency", "USD"),
+        "Availability": salary_data.get("availability", 0),
+        "Application ID": [applicant_record_id]
+    }
+
+
 def upsert_personal_details(client: AirtableClient, applicant_record_id: str, personal_data: dict) -> bool:
     """Create or update Personal Details record."""
     try:
         existing = client.get_linked_records(applicant_record_id, TABLE_PERSONAL)
 
-        fields = {
-            "Full Name": personal_data.get("name", ""),
-            "Email": personal_data.get("email", ""),
-            "Location": personal_data.get("location", ""),
-            "LinkedIn": personal_data.get("linkedin", ""),
-            "Application ID": [applicant_record_id]
-        }
+        fields = personal_fields(applicant_record_id, personal_data)
 
         if existing:
             # Update existing record
@@ -59,54 +94,25 @@ def upsert_personal_details(client: AirtableClient, applicant_record_id: str, pe
 
 
 def upsert_work_experience(client: AirtableClient, applicant_record_id: str, experience_list: list) -> bool:
-    """Sync Work Experience records (create/update/delete)."""
+    """Sync Work Experience records (create/update/delete), skipping rows that are already current."""
     try:
         existing = client.get_linked_records(applicant_record_id, TABLE_EXPERIENCE)
-        existing_map = {r["id"]: r for r in existing}
-
-        processed_ids = set()
-
-        for exp in experience_list:
-            fields = {
-                "Company": exp.get("company", ""),
-                "Title": exp.get("title", ""),
-                "Start": exp.get("start", ""),
-                "End": exp.get("end", ""),
-                "Technologies": exp.get("technologies", []),
-                "Application ID": [applicant_record_id]
-            }
+        matcher = ExperienceMatcher(existing)
 
-            # Try to match by record_id if available
-            record_id = exp.get("record_id")
-            if record_id and record_id in existing_map:
-                client.update_record(TABLE_EXPERIENCE, record_id, fields)
-                processed_ids.add(record_id)
-                logger.info(f"Updated Work Experience {record_id}")
-            else:
-                # Try to match by company + title + start
-                matched = False
-                for existing_id, existing_record in existing_map.items():
-                    if existing_id in processed_ids:
-                        continue
-                    ef = existing_record.get("fields", {})
-                    if (ef.get("Company") == fields["Company"] and
-                        ef.get("Title") == fields["Title"] and
-                        ef.get("Start") == fields["Start"]):
-                        client.update_record(TABLE_EXPERIENCE, existing_id, fields)
-                        processed_ids.add(existing_id)
-                        matched = True
-                        logger.info(f"Updated Work Experience {existing_id} (matched)")
-                        break
-
-                if not matched:
-                    result = client.create_record(TABLE_EXPERIENCE, fields)
-                    logger.info(f"Created Work Experience {result.get('id')}")
+        entries = [(exp.get("record_id"), experience_fields(applicant_record_id, exp)) for exp in experience_list]
+        for (_, fields), matched_id in zip(entries, matcher.match(entries)):
+            if matched_id is None:
+                result = client.create_record(TABLE_EXPERIENCE, fields)
+                logger.info(f"Created Work Experience {result.get('id')}")
+            elif changed_fields(matcher.records[matched_id].get("fields", {}), fields):
+                client.update_record(TABLE_EXPERIENCE, matched_id, fields)
+                logger.info(f"Updated Work Experience {matched_id}")
 
         # Delete orphan records
-        for existing_id in existing_map:
-            if existing_id not in processed_ids:
-                client.delete_record(TABLE_EXPERIENCE, existing_id)
-                logger.info(f"Deleted orphan Work Experience {existing_id}")
+        orphan_ids = matcher.unmatched()
+        if orphan_ids:
+            client.batch_delete(TABLE_EXPERIENCE, orphan_ids)
+            logger.info(f"Deleted orphan Work Experience {', '.join(orphan_ids)}")
 
         return True
     except Exception as e:
@@ -119,13 +125,7 @@ def upsert_salary_preferences(client: AirtableClient, applicant_record_id: str,
     try:
         existing = client.get_linked_records(applicant_record_id, TABLE_SALARY)
 
-        fields = {
-            "Preferred Rate": salary_data.get("preferred_rate", 0),
-            "Minimum Rate": salary_data.get("minimum_rate", 0),
-            "Currency": salary_data.get("currency", "USD"),
-            "Availability": salary_data.get("availability", 0),
-            "Application ID": [applicant_record_id]
-        }
+        fields = salary_fields(applicant_record_id, salary_data)
 
         if existing:
             client.update_record(TABLE_SALARY, existing[0]["id"], fields)
@@ -150,7 +150,7 @@ def decompress_applicant(client: AirtableClient, applicant_record: dict) -> bool
         logger.warning(f"Record {record_id} has no Compressed JSON, skipping")
         return False
 
-    data = parse_compressed_json(json_string)
+    data = parse_compressed_json(json_string, record_id)
     if not data:
         return False
 
@@ -162,25 +162,166 @@ def decompress_applicant(client: AirtableClient, applicant_record: dict) -> bool
     return success
 
 
-def decompress_all():
-    """Decompress all applicants with valid JSON."""
-    client = AirtableClient()
+def plan_single_record(changeset: Changeset, table_name: str, existing: list[dict], fields: dict, owner: str):
+    """Plan the create or update of a one-per-applicant child record (Personal Details, Salary)."""
+    if not existing:
+        changeset.create(table_name, fields, owner)
+    elif changed_fields(existing[0].get("fields", {}), fields):
+        changeset.update(table_name, existing[0]["id"], fields, owner)
+
+
+def plan_work_experience(changeset: Changeset, applicant_record_id: str, existing: list[dict], experience_list: list):
+    """Plan Work Experience changes, matching entries to existing records with ExperienceMatcher."""
+    matcher = ExperienceMatcher(existing)
+
+    entries = [(exp.get("record_id"), experience_fields(applicant_record_id, exp)) for exp in experience_list]
+    for (_, fields), matched_id in zip(entries, matcher.match(entries)):
+        if matched_id is None:
+            changeset.create(TABLE_EXPERIENCE, fields, applicant_record_id)
+        elif changed_fields(matcher.records[matched_id].get("fields", {}), fields):
+            changeset.update(TABLE_EXPERIENCE, matched_id, fields, applicant_record_id)
 
-    applicants = client.get_records(TABLE_APPLICANTS)
-    logger.info(f"Found {len(applicants)} applicants to decompress")
+    for existing_id in matcher.unmatched():
+        changeset.delete(TABLE_EXPERIENCE, existing_id, applicant_record_id)
+
+
+class ChildRecords:
+    """Personal Details, Work Experience and Salary Preferences prefetched once and grouped by applicant.
+
+    Pass apply_results as a Changeset's on_applied callback to fold each
+    batch Airtable accepts back in, so the state stays current across runs
+    without rescanning the tables.
+    """
+
+    TABLE_FIELDS = {TABLE_PERSONAL: PERSONAL_FIELDS, TABLE_EXPERIENCE: EXPERIENCE_FIELDS, TABLE_SALARY: SALARY_FIELDS}
+
+    def __init__(self, client: AirtableClient):
+        self.records = {}  # table -> {record_id: record}
+        self.groups = {}  # table -> {applicant_record_id: [record_id]}
+        for table_name, fields in self.TABLE_FIELDS.items():
+            records = client.get_records(table_name, fields=fields)
+            self.records[table_name] = {r["id"]: r for r in records}
+            self.groups[table_name] = {
+                parent_id: [r["id"] for r in children] for parent_id, children in group_by_link(records).items()
+            }
 
-    success_count = 0
+    def get_linked_records(self, parent_id: str, table_name: str) -> list[dict]:
+        """Children of an applicant in one of the prefetched tables."""
+        table = self.records[table_name]
+        return [table[record_id] for record_id in self.groups[table_name].get(parent_id, [])]
+
+    def _unlink(self, table_name: str, record: dict):
+        for parent_id in record.get("fields", {}).get("Application ID", []):
+            children = self.groups[table_name].get(parent_id, [])
+            if record["id"] in children:
+                children.remove(record["id"])
+
+    def apply_results(self, table_name: str, op: str, results: list[dict]):
+        """Fold a successful create/update/delete batch into the grouped state."""
+        if table_name not in self.records:
+            return
+        table = self.records[table_name]
+        for result in results:
+            old = table.get(result["id"])
+            if op == "delete":
+                if result.get("deleted") and old:
+                    self._unlink(table_name, table.pop(result["id"]))
+                continue
+            if old:
+                self._unlink(table_name, old)
+            table[result["id"]] = result
+            for parent_id in result.get("fields", {}).get("Application ID", []):
+                self.groups[table_name].setdefault(parent_id, []).append(result["id"])
+
+
+def plan_applicant(children: AirtableClient | ChildRecords, applicant_record_id: str, data: dict) -> Changeset:
+    """Diff one applicant's decoded JSON against its child records.
+
+    children is anything with get_linked_records(parent_id, table): the
+    client itself, or prefetched ChildRecords. Only records whose fields
+    actually differ are updated; nothing is written here.
+    """
+    changeset = Changeset()
+    plan_single_record(changeset, TABLE_PERSONAL, children.get_linked_records(applicant_record_id, TABLE_PERSONAL),
+                       personal_fields(applicant_record_id, data.get("personal", {})), applicant_record_id)
+    plan_work_experience(changeset, applicant_record_id,
+                         children.get_linked_records(applicant_record_id, TABLE_EXPERIENCE), data.get("experience", []))
+    plan_single_record(changeset, TABLE_SALARY, children.get_linked_records(applicant_record_id, TABLE_SALARY),
+                       salary_fields(applicant_record_id, data.get("salary", {})), applicant_record_id)
+    return changeset
+
+
+def decompress_applicants(client: AirtableClient, applicants: list[dict], children: ChildRecords = None,
+                          dry_run: bool = False) -> tuple[int, int]:
+    """Plan every applicant, then apply the combined changeset in batches.
+
+    Planning reads from children when given (and keeps it current as
+    batches land), otherwise from client.get_linked_records. Returns
+    (success_count, failure_count).
+    """
+    changeset = Changeset()
+    planned = []
     failure_count = 0
 
     for applicant in applicants:
-        if decompress_applicant(client, applicant):
-            success_count += 1
-        else:
+        record_id = applicant["id"]
+        json_string = applicant.get("fields", {}).get("Compressed JSON")
+        if not json_string:
+            logger.warning(f"Record {record_id} has no Compressed JSON, skipping")
+            failure_count += 1
+            continue
+
+        data = parse_compressed_json(json_string, record_id)
+        if not data:
             failure_count += 1
+            continue
+
+        try:
+            changeset.extend(plan_applicant(children or client, record_id, data))
+            planned.append(record_id)
+        except Exception as e:
+            logger.error(f"Failed to plan decompression for {record_id}: {e}")
+            failure_count += 1
+
+    # Every planned change is listed only for dry runs; real runs would log one line per write
+    logger.info(f"Decompression plan ({len(changeset)} changes):\n{changeset.describe(per_change=dry_run)}")
+    if dry_run:
+        logger.info("Dry run, no changes written")
+        return len(planned), failure_count
+
+    failed = changeset.apply(client, children.apply_results if children else None)
+    success_count = sum(1 for record_id in planned if record_id not in failed)
+    return success_count, failure_count + len(planned) - success_count
+
+
+def decompress_all(dry_run: bool = False, bulk: bool = True):
+    """Decompress all applicants with valid JSON.
+
+    bulk prefetches the three child tables once, so a run costs a constant
+    number of table scans whatever the cache settings; bulk=False looks
+    children up through the client per applicant. Either way every
+    applicant is planned first and the changes go out as 10-record batch
+    calls. With dry_run the plan is logged and nothing is written.
+    """
+    with AirtableClient() as client:
+        if AIRTABLE_MIRROR_PATH:
+            client.use_mirror(AIRTABLE_MIRROR_PATH)
+
+        applicants = client.get_records(TABLE_APPLICANTS, fields=["Compressed JSON"])
+        logger.info(f"Found {len(applicants)} applicants to decompress")
+
+        children = ChildRecords(client) if bulk else None
+        success_count, failure_count = decompress_applicants(client, applicants, children, dry_run)
 
-    logger.info(f"Decompression complete: {success_count} succeeded, {failure_count} failed")
-    return success_count, failure_count
+        client.log_stats("Decompression")
+        logger.info(f"Decompression complete: {success_count} succeeded, {failure_count} failed")
+        return success_count, failure_count
 
 
 if __name__ == "__main__":
-    decompress_all()
+    parser = argparse.ArgumentParser(description="Write Compressed JSON back to the child tables.")
+    parser.add_argument("--dry-run", action="store_true", help="log the planned changes without writing them")
+    parser.add_argument("--per-applicant", action="store_true",
+                        help="look up child records per applicant instead of prefetching whole tables")
+    args = parser.parse_args()
+    decompress_all(dry_run=args.dry_run, bulk=not args.per_applicant)
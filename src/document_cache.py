@@ -0,0 +1,100 @@
+"""
+Document Cache - Parse-once cache of applicant Compressed JSON shared by the pipeline stages.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from src.config import DOCUMENT_CACHE_SIZE
+from src.json_codec import decode_applicant, encode_applicant
+from src.utils import canonical_json
+
+
+class ApplicantDocument:
+    """A decoded Compressed JSON value.
+
+    data is shared between every stage that loads the same value, so treat
+    it as read-only. The canonical and encoded forms are built on first use
+    and then reused.
+    """
+
+    def __init__(self, value: str, data: dict):
+        self.value = value
+        self.data = data
+        self._canonical = None
+        self._encoded = None
+
+    @property
+    def canonical(self) -> str:
+        """Canonical serialization (sorted keys, compact), stable across encodings."""
+        if self._canonical is None:
+            self._canonical = canonical_json(self.data)
+        return self._canonical
+
+    @property
+    def encoded(self) -> str:
+        """The data in the currently configured Compressed JSON encoding."""
+        if self._encoded is None:
+            self._encoded = encode_applicant(self.data)
+        return self._encoded
+
+
+class DocumentCache:
+    """Bounded LRU of ApplicantDocuments keyed by record ID and a digest of the raw value.
+
+    A record whose Compressed JSON changes gets a new key, so stale parses
+    are never handed out; they simply age out of the LRU.
+    """
+
+    def __init__(self, max_entries: int = DOCUMENT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (record_id, digest) -> ApplicantDocument
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(record_id: str | None, value: str) -> tuple:
+        return record_id, hashlib.blake2b(value.encode(), digest_size=16).digest()
+
+    def load(self, value: str, record_id: str = None) -> ApplicantDocument:
+        """Decoded document for a Compressed JSON value; raises json.JSONDecodeError when invalid."""
+        key = self._key(record_id, value)
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return document
+            self.misses += 1
+
+        # Parse outside the lock; two threads racing on one value both get a valid document
+        document = ApplicantDocument(value, decode_applicant(value))
+        if self.max_entries <= 0:
+            return document
+
+        with self._lock:
+            self._entries[key] = document
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Process-wide cache shared by compress, shortlist, llm_eval and decompress
+document_cache = DocumentCache()
+
+
+def load_document(value: str, record_id: str = None) -> ApplicantDocument:
+    """Decode value through the shared cache."""
+    return document_cache.load(value, record_id)
@@ -0,0 +1,91 @@
+"""
+Experience Matching - Pair Compressed JSON experience entries with existing Work Experience records.
+"""
+from collections import deque
+
+# Key components that must agree for an edited entry to match: any two of company, title, start
+FUZZY_PAIRS = ((0, 1), (0, 2), (1, 2))
+
+
+def normalize_text(value) -> str:
+    """Case- and whitespace-insensitive form of a text field."""
+    return " ".join(str(value or "").split()).casefold()
+
+
+def experience_key(fields: dict) -> tuple[str, str, str]:
+    """Normalized (company, title, start) of a Work Experience record's fields."""
+    # Dates may come back as full ISO timestamps; the day is what identifies a role
+    return (normalize_text(fields.get("Company")),
+            normalize_text(fields.get("Title")),
+            normalize_text(fields.get("Start"))[:10])
+
+
+class ExperienceMatcher:
+    """Hash indexes over one applicant's existing Work Experience records.
+
+    Entries are matched in three passes, each record being claimed at most
+    once: an explicit record_id, then the exact normalized key, then any two
+    of its three components (an entry whose company, title or start date was
+    edited). Every pass is a dict lookup, so matching stays linear in the
+    number of entries.
+    """
+
+    def __init__(self, existing: list[dict]):
+        self.records = {r["id"]: r for r in existing}
+        self._unclaimed = dict.fromkeys(self.records)  # ordered set of record IDs
+        self._keys = {record_id: experience_key(r.get("fields", {})) for record_id, r in self.records.items()}
+        self._exact = {}
+        self._partial = None  # built on first use, from the records still unclaimed
+
+        for record_id, key in self._keys.items():
+            self._exact.setdefault(key, deque()).append(record_id)
+
+    def _partial_index(self) -> dict:
+        if self._partial is None:
+            self._partial = {}
+            for record_id in self._unclaimed:
+                key = self._keys[record_id]
+                for pair in FUZZY_PAIRS:
+                    subkey = (pair, key[pair[0]], key[pair[1]])
+                    if all(subkey[1:]):
+                        self._partial.setdefault(subkey, deque()).append(record_id)
+        return self._partial
+
+    def _take(self, bucket: deque | None) -> str | None:
+        """First unclaimed record in a bucket, claimed; records claimed elsewhere are dropped lazily."""
+        while bucket:
+            record_id = bucket.popleft()
+            if record_id in self._unclaimed:
+                del self._unclaimed[record_id]
+                return record_id
+        return None
+
+    def match(self, entries: list[tuple[str | None, dict]]) -> list[str | None]:
+        """Existing record ID for each (record_id, fields) entry, or None when it needs creating."""
+        matches = [None] * len(entries)
+
+        for i, (record_id, _) in enumerate(entries):
+            if record_id in self._unclaimed:
+                del self._unclaimed[record_id]
+                matches[i] = record_id
+
+        keys = [experience_key(fields) for _, fields in entries]
+        for i, key in enumerate(keys):
+            if matches[i] is None:
+                matches[i] = self._take(self._exact.get(key))
+
+        for i, key in enumerate(keys):
+            if matches[i] is not None:
+                continue
+            for pair in FUZZY_PAIRS:
+                subkey = (pair, key[pair[0]], key[pair[1]])
+                if all(subkey[1:]):
+                    matches[i] = self._take(self._partial_index().get(subkey))
+                    if matches[i] is not None:
+                        break
+
+        return matches
+
+    def unmatched(self) -> list[str]:
+        """Existing records no entry was matched to (orphans), in their original order."""
+        return list(self._unclaimed)
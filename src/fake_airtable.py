@@ -0,0 +1,510 @@
+"""
+Fake Airtable - In-memory stand-in for the Airtable REST API for offline load and throughput tests.
+
+FakeAirtableBase stores tables in memory and answers requests in the same
+shapes as api.airtable.com: offset pagination, linked-record arrays,
+10-record batch limits, performUpsert, records[] deletes and 429s once the
+configured rate is exceeded. It is reachable two ways:
+
+- FakeSession plugs into AirtableClient(session=...) with no sockets;
+  FakeAirtableBase.client() builds such a client.
+- FakeAirtableServer serves it over HTTP for anything that needs a real URL.
+"""
+import json
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+
+from src.config import BATCH_SIZE
+
+MAX_PAGE_SIZE = 100
+
+
+class FormulaError(ValueError):
+    """Raised for filterByFormula expressions outside the supported subset."""
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+def _now() -> datetime:
+    # Airtable timestamps carry millisecond precision
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def _parse_time(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    value = str(value).replace("Z", "+00:00")
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+_TOKEN = re.compile(r"\s*(?:(\{[^}]*\})|('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")|(\d+(?:\.\d+)?)|"
+                    r"([A-Za-z_][A-Za-z_0-9]*)|(!=|>=|<=|[=<>(),&]))")
+
+
+class Formula:
+    """Evaluator for the subset of Airtable formulas the pipeline uses.
+
+    Supports {Field} references, string/number literals, = != < > <= >= and &,
+    and the functions AND, OR, NOT, IF, BLANK, RECORD_ID, CREATED_TIME,
+    LAST_MODIFIED_TIME({Field}, ...), IS_AFTER, IS_BEFORE, FIND and ARRAYJOIN.
+    """
+
+    def __init__(self, source: str):
+        self.tokens = []
+        pos = 0
+        source = source.strip()
+        while pos < len(source):
+            match = _TOKEN.match(source, pos)
+            if not match or match.end() == pos:
+                raise FormulaError(f"Cannot parse formula near: {source[pos:pos + 20]!r}")
+            self.tokens.append(match.groups())
+            pos = match.end()
+        self.pos = 0
+        self.tree = self._comparison()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"Unexpected trailing tokens in formula: {source!r}")
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None,) * 5
+
+    def _take_op(self, *ops) -> str | None:
+        op = self._peek()[4]
+        if op in ops:
+            self.pos += 1
+            return op
+        return None
+
+    def _comparison(self):
+        left = self._concat()
+        op = self._take_op("=", "!=", "<", ">", "<=", ">=")
+        if op:
+            return ("cmp", op, left, self._concat())
+        return left
+
+    def _concat(self):
+        node = self._atom()
+        while self._take_op("&"):
+            node = ("concat", node, self._atom())
+        return node
+
+    def _atom(self):
+        field, string, number, name, op = self._peek()
+        self.pos += 1
+        if field:
+            return ("field", field[1:-1])
+        if string:
+            return ("lit", bytes(string[1:-1], "utf-8").decode("unicode_escape"))
+        if number:
+            return ("lit", float(number))
+        if op == "(":
+            node = self._comparison()
+            self._expect(")")
+            return node
+        if name:
+            upper = name.upper()
+            if upper in ("TRUE", "FALSE") and self._peek()[4] != "(":
+                return ("lit", upper == "TRUE")
+            self._expect("(")
+            args = []
+            if not self._take_op(")"):
+                args.append(self._comparison())
+                while self._take_op(","):
+                    args.append(self._comparison())
+                self._expect(")")
+            return ("call", upper, args)
+        raise FormulaError("Unexpected token in formula")
+
+    def _expect(self, op: str):
+        if not self._take_op(op):
+            raise FormulaError(f"Expected '{op}' in formula")
+
+    def evaluate(self, record: dict, meta: dict):
+        return self._eval(self.tree, record, meta)
+
+    def _eval(self, node, record, meta):
+        kind = node[0]
+        if kind == "lit":
+            return node[1]
+        if kind == "field":
+            value = record["fields"].get(node[1])
+            if isinstance(value, list):
+                return ", ".join(str(v) for v in value)
+            return "" if value is None else value
+        if kind == "concat":
+            return f"{self._eval(node[1], record, meta)}{self._eval(node[2], record, meta)}"
+        if kind == "cmp":
+            _, op, left, right = node
+            a, b = self._eval(left, record, meta), self._eval(right, record, meta)
+            if isinstance(a, (int, float)) and isinstance(b, str) and b == "":
+                b = 0
+            if op == "=":
+                return a == b
+            if op == "!=":
+                return a != b
+            return {"<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b}[op]
+
+        _, name, args = node
+        if name in ("AND", "OR"):
+            values = [bool(self._eval(a, record, meta)) for a in args]
+            return all(values) if name == "AND" else any(values)
+        if name == "NOT":
+            return not self._eval(args[0], record, meta)
+        if name == "IF":
+            branch = args[1] if self._eval(args[0], record, meta) else (args[2] if len(args) > 2 else ("lit", ""))
+            return self._eval(branch, record, meta)
+        if name == "BLANK":
+            return ""
+        if name == "RECORD_ID":
+            return record["id"]
+        if name == "CREATED_TIME":
+            return record["createdTime"]
+        if name == "LAST_MODIFIED_TIME":
+            if not args:
+                return _timestamp(meta["modified"])
+            names = [a[1] for a in args if a[0] == "field"]
+            return _timestamp(max(meta["field_modified"].get(n, meta["created"]) for n in names))
+        if name in ("IS_AFTER", "IS_BEFORE"):
+            a = _parse_time(self._eval(args[0], record, meta))
+            b = _parse_time(self._eval(args[1], record, meta))
+            if a is None or b is None:
+                return False
+            return a > b if name == "IS_AFTER" else a < b
+        if name == "FIND":
+            needle, haystack = (str(self._eval(a, record, meta)) for a in args[:2])
+            return haystack.find(needle) + 1
+        if name == "ARRAYJOIN":
+            return self._eval(args[0], record, meta)
+        raise FormulaError(f"Unsupported formula function: {name}")
+
+
+class FakeAirtableBase:
+    """In-memory Airtable base answering REST-shaped requests."""
+
+    def __init__(self, base_id: str = "appFAKE", latency: float = 0.0, rate_limit: float = None,
+                 retry_after: float = 30.0, inverse_links: dict = None):
+        self.base_id = base_id
+        # {(table, link_field): (linked_table, inverse_field)}: kept two-sided, as Airtable does
+        self.inverse_links = dict(inverse_links or {})
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self._lock = threading.RLock()
+        self._tables = {}  # table -> OrderedDict(id -> record)
+        self._meta = {}  # record id -> {"created", "modified", "field_modified"}
+        self._recent = deque()
+
+        self.request_count = 0
+        self.throttled_count = 0
+        self.requests_by_method = {}
+
+    # -- Seeding and inspection -------------------------------------------------
+
+    def seed(self, table_name: str, rows: list[dict]) -> list[dict]:
+        """Insert rows of fields directly, without counting as API traffic."""
+        with self._lock:
+            return [self._create(table_name, fields) for fields in rows]
+
+    def records(self, table_name: str) -> list[dict]:
+        with self._lock:
+            return [json.loads(json.dumps(r)) for r in self._tables.get(table_name, {}).values()]
+
+    def client(self, **kwargs):
+        """AirtableClient wired to this base through an in-process session."""
+        from src.airtable_client import AirtableClient
+        from src.rate_limiter import TokenBucket
+
+        kwargs.setdefault("rate_limiter", TokenBucket(rate=1_000_000))
+        return AirtableClient(api_key="fake", base_id=self.base_id, base_url="https://fake.airtable/v0",
+                              session=FakeSession(self), **kwargs)
+
+    # -- Record storage ---------------------------------------------------------
+
+    def _table(self, table_name: str) -> OrderedDict:
+        return self._tables.setdefault(table_name, OrderedDict())
+
+    @staticmethod
+    def _clean(fields: dict) -> dict:
+        # Airtable omits empty values from records
+        return {k: v for k, v in fields.items() if v not in ("", None, [])}
+
+    def _sync_inverse(self, table_name: str, record_id: str, old_fields: dict, new_fields: dict):
+        """Mirror link changes on record_id into the inverse fields of the records it links to."""
+        for (link_table, link_field), (other_table, inverse_field) in self.inverse_links.items():
+            if link_table != table_name:
+                continue
+            old, new = set(old_fields.get(link_field, [])), set(new_fields.get(link_field, []))
+            for other_id in old ^ new:
+                other = self._table(other_table).get(other_id)
+                if other is None:
+                    continue
+                linked = [rid for rid in other["fields"].get(inverse_field, []) if rid != record_id]
+                if other_id in new:
+                    linked.append(record_id)
+                other["fields"][inverse_field] = linked
+                other["fields"] = self._clean(other["fields"])
+                now = _now()
+                self._meta[other_id]["field_modified"][inverse_field] = now
+                self._meta[other_id]["modified"] = now
+
+    def _create(self, table_name: str, fields: dict) -> dict:
+        now = _now()
+        record_id = "rec" + uuid.uuid4().hex[:14]
+        record = {"id": record_id, "createdTime": _timestamp(now), "fields": self._clean(fields)}
+        self._table(table_name)[record_id] = record
+        self._meta[record_id] = {"created": now, "modified": now, "field_modified": {k: now for k in fields}}
+        self._sync_inverse(table_name, record_id, {}, record["fields"])
+        return record
+
+    def _update(self, table_name: str, record_id: str, fields: dict, replace: bool = False) -> dict:
+        record = self._table(table_name)[record_id]
+        now = _now()
+        meta = self._meta[record_id]
+        old_fields = record["fields"]
+        merged = {} if replace else dict(old_fields)
+        for key, value in fields.items():
+            if merged.get(key) != value:
+                meta["field_modified"][key] = now
+            merged[key] = value
+        record["fields"] = self._clean(merged)
+        meta["modified"] = now
+        self._sync_inverse(table_name, record_id, old_fields, record["fields"])
+        return record
+
+    # -- Request handling -------------------------------------------------------
+
+    def _throttled(self) -> bool:
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] >= 1.0:
+            self._recent.popleft()
+        if len(self._recent) >= self.rate_limit:
+            return True
+        self._recent.append(now)
+        return False
+
+    def handle(self, method: str, path: str, query: dict, body: dict | None) -> tuple[int, dict, dict]:
+        """Answer one request; returns (status, payload, headers)."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.request_count += 1
+            self.requests_by_method[method] = self.requests_by_method.get(method, 0) + 1
+            if self._throttled():
+                self.throttled_count += 1
+                return 429, {"errors": [{"error": "RATE_LIMIT_REACHED"}]}, {"Retry-After": str(self.retry_after)}
+
+            parts = [unquote(p) for p in path.strip("/").split("/")]
+            if parts and parts[0] == "v0":
+                parts = parts[1:]
+            if len(parts) < 2 or parts[0] != self.base_id:
+                return 404, {"error": "NOT_FOUND"}, {}
+            table_name = parts[1]
+            record_id = parts[2] if len(parts) > 2 else None
+
+            try:
+                if method == "GET":
+                    return self._get(table_name, record_id, query)
+                if method == "POST" and not record_id:
+                    return self._post(table_name, body or {})
+                if method in ("PATCH", "PUT"):
+                    return self._patch(table_name, record_id, body or {}, replace=method == "PUT")
+                if method == "DELETE":
+                    return self._delete(table_name, record_id, query)
+            except FormulaError as e:
+                return 422, {"error": {"type": "INVALID_FILTER_BY_FORMULA", "message": str(e)}}, {}
+            except KeyError as e:
+                return 404, {"error": {"type": "NOT_FOUND", "message": f"Record not found: {e}"}}, {}
+            return 404, {"error": "NOT_FOUND"}, {}
+
+    @staticmethod
+    def _invalid(message: str) -> tuple[int, dict, dict]:
+        return 422, {"error": {"type": "INVALID_REQUEST_UNKNOWN", "message": message}}, {}
+
+    def _get(self, table_name: str, record_id: str | None, query: dict) -> tuple[int, dict, dict]:
+        table = self._table(table_name)
+        if record_id:
+            return 200, table[record_id], {}
+
+        records = list(table.values())
+        formula = query.get("filterByFormula", [None])[0]
+        if formula:
+            compiled = Formula(formula)
+            records = [r for r in records if compiled.evaluate(r, self._meta[r["id"]])]
+
+        sort_fields = sorted(
+            (int(m.group(1)), m.group(2), values[0])
+            for key, values in query.items()
+            if (m := re.fullmatch(r"sort\[(\d+)\]\[(field|direction)\]", key))
+        )
+        specs = {}
+        for index, part, value in sort_fields:
+            specs.setdefault(index, {"direction": "asc"})[part] = value
+        for spec in reversed([specs[i] for i in sorted(specs)]):
+            records.sort(key=lambda r: str(r["fields"].get(spec["field"], "")), reverse=spec["direction"] == "desc")
+
+        page_size = min(int(query.get("pageSize", [MAX_PAGE_SIZE])[0]), MAX_PAGE_SIZE)
+        start = int(query.get("offset", ["itr0"])[0][3:] or 0)
+        page = records[start:start + page_size]
+
+        fields = query.get("fields[]")
+        if fields:
+            page = [{**r, "fields": {k: v for k, v in r["fields"].items() if k in fields}} for r in page]
+
+        payload = {"records": json.loads(json.dumps(page))}
+        if start + page_size < len(records):
+            payload["offset"] = f"itr{start + page_size}"
+        return 200, payload, {}
+
+    def _post(self, table_name: str, body: dict) -> tuple[int, dict, dict]:
+        if "records" in body:
+            if len(body["records"]) > BATCH_SIZE:
+                return self._invalid(f"Too many records: at most {BATCH_SIZE} per request")
+            return 200, {"records": [self._create(table_name, r.get("fields", {})) for r in body["records"]]}, {}
+        return 200, self._create(table_name, body.get("fields", {})), {}
+
+    def _patch(self, table_name: str, record_id: str | None, body: dict, replace: bool) -> tuple[int, dict, dict]:
+        if record_id:
+            return 200, self._update(table_name, record_id, body.get("fields", {}), replace), {}
+
+        records = body.get("records", [])
+        if len(records) > BATCH_SIZE:
+            return self._invalid(f"Too many records: at most {BATCH_SIZE} per request")
+
+        upsert = body.get("performUpsert")
+        if not upsert:
+            return 200, {"records": [self._update(table_name, r["id"], r.get("fields", {}), replace) for r in records]}, {}
+
+        merge_on = upsert.get("fieldsToMergeOn", [])
+        table = self._table(table_name)
+        results, created, updated = [], [], []
+        for item in records:
+            fields = item.get("fields", {})
+            key = tuple(fields.get(f) for f in merge_on)
+            match = next((r for r in table.values() if tuple(r["fields"].get(f) for f in merge_on) == key), None)
+            if match:
+                results.append(self._update(table_name, match["id"], fields, replace))
+                updated.append(match["id"])
+            else:
+                record = self._create(table_name, fields)
+                results.append(record)
+                created.append(record["id"])
+        return 200, {"records": results, "createdRecords": created, "updatedRecords": updated}, {}
+
+    def _delete(self, table_name: str, record_id: str | None, query: dict) -> tuple[int, dict, dict]:
+        table = self._table(table_name)
+        ids = [record_id] if record_id else query.get("records[]", [])
+        if len(ids) > BATCH_SIZE:
+            return self._invalid(f"Too many records: at most {BATCH_SIZE} per request")
+        for rid in ids:
+            record = table.pop(rid)
+            self._meta.pop(rid, None)
+            self._sync_inverse(table_name, rid, record["fields"], {})
+        if record_id:
+            return 200, {"id": record_id, "deleted": True}, {}
+        return 200, {"records": [{"id": rid, "deleted": True} for rid in ids]}, {}
+
+
+class FakeResponse:
+    """The parts of requests.Response that AirtableClient uses."""
+
+    def __init__(self, status_code: int, payload: dict, headers: dict, url: str):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.content = json.dumps(payload).encode()
+        self.url = url
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class FakeSession:
+    """In-process transport that routes AirtableClient requests to a FakeAirtableBase."""
+
+    def __init__(self, base: FakeAirtableBase):
+        self.base = base
+
+    def request(self, method: str, url: str, headers: dict = None, json: dict = None, timeout: float = None):
+        parts = urlsplit(url)
+        query = parse_qs(parts.query, keep_blank_values=True)
+        status, payload, response_headers = self.base.handle(method, parts.path, query, json)
+        return FakeResponse(status, payload, response_headers, url)
+
+    def close(self):
+        pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    base: FakeAirtableBase = None
+
+    def _dispatch(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        status, payload, headers = self.base.handle(
+            self.command, parts.path, parse_qs(parts.query, keep_blank_values=True), body
+        )
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAirtableServer:
+    """Serve a FakeAirtableBase over HTTP on localhost; use base_url with AirtableClient."""
+
+    def __init__(self, base: FakeAirtableBase, host: str = "127.0.0.1", port: int = 0):
+        self.base = base
+        handler = type("FakeAirtableHandler", (_Handler,), {"base": base})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v0"
+
+    def start(self) -> "FakeAirtableServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
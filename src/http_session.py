@@ -0,0 +1,69 @@
+"""
+HTTP Session Layer - Pooled, keep-alive connections shared by all Airtable calls.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from src.config import (
+    AIRTABLE_HTTP_TRANSPORT,
+    AIRTABLE_HTTP2,
+    AIRTABLE_POOL_SIZE
+)
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Exception types raised by any supported transport
+HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+def create_requests_session(pool_size: int = AIRTABLE_POOL_SIZE) -> requests.Session:
+    """Build a requests Session with a keep-alive connection pool per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HttpxSession:
+    """httpx.Client exposed through the requests.Session call shape."""
+
+    def __init__(self, pool_size: int = AIRTABLE_POOL_SIZE, http2: bool = AIRTABLE_HTTP2):
+        if httpx is None:
+            raise ImportError("The httpx transport requires the 'httpx' package")
+
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+                http2 = False
+
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self._client = httpx.Client(http2=http2, limits=limits)
+
+    def request(self, method: str, url: str, headers: dict = None, json: dict = None, timeout: float = None):
+        return self._client.request(method, url, headers=headers, json=json, timeout=timeout)
+
+    def close(self):
+        self._client.close()
+
+
+def create_session(transport: str = None, pool_size: int = None, http2: bool = None):
+    """Create the pooled session used by AirtableClient."""
+    transport = transport or AIRTABLE_HTTP_TRANSPORT
+    pool_size = pool_size or AIRTABLE_POOL_SIZE
+    http2 = AIRTABLE_HTTP2 if http2 is None else http2
+
+    if transport == "httpx":
+        return HttpxSession(pool_size, http2)
+    if transport != "requests":
+        raise ValueError(f"Unknown HTTP transport: {transport}")
+    return create_requests_session(pool_size)
+
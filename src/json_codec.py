@@ -0,0 +1,60 @@
+"""
+Compressed JSON Codec - Versioned encoding of applicant objects stored in Airtable.
+
+Two formats are written:
+
+- plain: compact JSON with no whitespace. This is the default, because the
+  Airtable scripts in airtable_scripts/ read the field with JSON.parse.
+- packed: "z1:" followed by base64 of zlib-compressed compact JSON. Only the
+  Python pipeline can read it. Use it for long experience histories that
+  would otherwise bloat every page of Applications reads.
+
+decode_applicant reads both, plus the older indent=2 JSON.
+"""
+import base64
+import binascii
+import json
+import zlib
+from src.config import COMPRESSED_JSON_PACK, COMPRESSED_JSON_PACK_MIN_EXPERIENCE
+
+PACKED_PREFIX = "z1:"
+
+
+def encode_plain(data: dict) -> str:
+    """Compact JSON without insignificant whitespace."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode_packed(data: dict) -> str:
+    """zlib-compressed, base64-encoded compact JSON behind a version prefix."""
+    raw = zlib.compress(encode_plain(data).encode(), 9)
+    return PACKED_PREFIX + base64.b64encode(raw).decode("ascii")
+
+
+def should_pack(data: dict, mode: str = COMPRESSED_JSON_PACK) -> bool:
+    """Whether the configured packing mode ("never", "auto", "always") packs this object."""
+    if mode == "always":
+        return True
+    if mode == "auto":
+        return len(data.get("experience", [])) >= COMPRESSED_JSON_PACK_MIN_EXPERIENCE
+    return False
+
+
+def encode_applicant(data: dict, mode: str = COMPRESSED_JSON_PACK) -> str:
+    """Encode an applicant object for the Compressed JSON field."""
+    if should_pack(data, mode):
+        packed = encode_packed(data)
+        plain = encode_plain(data)
+        # Small objects can grow once base64 is added; keep whichever is shorter
+        return packed if len(packed) < len(plain) else plain
+    return encode_plain(data)
+
+
+def decode_applicant(value: str) -> dict:
+    """Decode any Compressed JSON version; raises json.JSONDecodeError when it can't."""
+    if value.startswith(PACKED_PREFIX):
+        try:
+            value = zlib.decompress(base64.b64decode(value[len(PACKED_PREFIX):], validate=True)).decode()
+        except (binascii.Error, zlib.error, UnicodeDecodeError) as e:
+            raise json.JSONDecodeError(f"Invalid packed Compressed JSON: {e}", value, 0)
+    return json.loads(value)
@@ -0,0 +1,105 @@
+"""
+Linked Record Index - parent→children lookups served from one scan per child table.
+"""
+import threading
+
+
+def group_by_link(records: list[dict], link_field: str = "Application ID") -> dict[str, list[dict]]:
+    """Hash-join helper: {parent_record_id: [records linking to it]}, in input order."""
+    groups = {}
+    for record in records:
+        for parent_id in record.get("fields", {}).get(link_field, []):
+            groups.setdefault(parent_id, []).append(record)
+    return groups
+
+
+class LinkedRecordIndex:
+    """In-memory {parent_record_id: [child records]} maps, kept current by client writes.
+
+    Each table's index remembers the snapshot version it was built from;
+    lookups against any other version miss so the caller can rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # child_table -> {"records": {id: record}, "links": {link_field: {parent: [ids]}}, "version": n}
+        self._tables = {}
+
+    def _entry(self, table_name: str) -> dict | None:
+        return self._tables.get(table_name)
+
+    def load(self, table_name: str, records: list[dict], version: int = 0):
+        """Replace the indexed contents of a child table with a snapshot."""
+        with self._lock:
+            self._tables[table_name] = {
+                "records": {r["id"]: r for r in records},
+                "links": {},
+                "version": version
+            }
+
+    def lookup(self, table_name: str, link_field: str, parent_id: str, version: int = 0) -> list[dict] | None:
+        """Children of parent_id, or None when the table is not indexed at this version."""
+        with self._lock:
+            entry = self._entry(table_name)
+            if entry is None or entry["version"] != version:
+                return None
+
+            links = entry["links"].get(link_field)
+            if links is None:
+                links = {}
+                for record_id, record in entry["records"].items():
+                    for linked_id in record.get("fields", {}).get(link_field, []):
+                        links.setdefault(linked_id, []).append(record_id)
+                entry["links"][link_field] = links
+
+            return [entry["records"][record_id] for record_id in links.get(parent_id, [])]
+
+    def upsert(self, table_name: str, records: list[dict]):
+        """Apply created or updated records to an indexed table."""
+        with self._lock:
+            entry = self._entry(table_name)
+            if entry is None:
+                return
+
+            for record in records:
+                record_id = record.get("id")
+                if not record_id:
+                    continue
+                old_fields = entry["records"].get(record_id, {}).get("fields", {})
+                new_fields = record.get("fields", {})
+                entry["records"][record_id] = record
+
+                for link_field, links in entry["links"].items():
+                    old_parents = set(old_fields.get(link_field, []))
+                    new_parents = set(new_fields.get(link_field, []))
+                    for parent_id in old_parents - new_parents:
+                        links[parent_id].remove(record_id)
+                    # Unchanged links keep their position so child order stays stable
+                    for parent_id in new_fields.get(link_field, []):
+                        if parent_id not in old_parents:
+                            links.setdefault(parent_id, []).append(record_id)
+
+    def remove(self, table_name: str, record_ids: list[str]):
+        """Drop deleted records from an indexed table."""
+        with self._lock:
+            entry = self._entry(table_name)
+            if entry is None:
+                return
+
+            for record_id in record_ids:
+                record = entry["records"].pop(record_id, None)
+                if record is None:
+                    continue
+                fields = record.get("fields", {})
+                for link_field, links in entry["links"].items():
+                    for parent_id in fields.get(link_field, []):
+                        if record_id in links.get(parent_id, []):
+                            links[parent_id].remove(record_id)
+
+    def invalidate(self, table_name: str = None):
+        """Forget one table, or every table when none is given."""
+        with self._lock:
+            if table_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_name, None)
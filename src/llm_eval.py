@@ -2,23 +2,30 @@
 LLM Evaluation and Enrichment - Use LLM to analyze and score applicants.
 """
 import json
-import time
 import re
 import hashlib
 from src.airtable_client import AirtableClient
 from src.config import (
+    AIRTABLE_MIRROR_PATH,
     TABLE_APPLICANTS,
     LLM_API_KEY,
     LLM_PROVIDER,
     LLM_MODEL,
     LLM_MAX_TOKENS,
     LLM_MAX_RETRIES,
-    LLM_TIMEOUT
+    LLM_TIMEOUT,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_RESET
 )
+from src.document_cache import load_document
+from src.retry import CircuitBreaker, CircuitOpenError, RetryPolicy, call_with_retry
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+llm_retry_policy = RetryPolicy(LLM_MAX_RETRIES, base_delay=LLM_TIMEOUT)
+llm_circuit_breaker = CircuitBreaker(CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET, name="LLM API")
+
 
 def build_llm_prompt(applicant_json: dict) -> str:
     """Construct prompt with JSON data."""
@@ -95,16 +102,12 @@ def call_llm_api(prompt: str) -> str | None:
         logger.error(f"Unknown LLM provider: {LLM_PROVIDER}")
         return None
 
-    for attempt in range(LLM_MAX_RETRIES):
-        try:
-            return api_func(prompt)
-        except Exception as e:
-            logger.warning(f"LLM API call failed (attempt {attempt + 1}/{LLM_MAX_RETRIES}): {e}")
-            if attempt < LLM_MAX_RETRIES - 1:
-                delay = LLM_TIMEOUT * (2 ** attempt)  # Exponential backoff
-                time.sleep(delay)
-
-    logger.error("LLM API call failed after all retries")
+    try:
+        return call_with_retry(lambda: api_func(prompt), llm_retry_policy, llm_circuit_breaker, label="LLM API call")
+    except CircuitOpenError as e:
+        logger.error(f"Skipping LLM call: {e}")
+    except Exception:
+        logger.error("LLM API call failed after all retries")
     return None
 
 
@@ -159,19 +162,24 @@ def evaluate_applicant(client: AirtableClient, applicant_record: dict) -> bool:
         return False
 
     # Check if JSON has changed (budget guardrail)
-    current_hash = get_json_hash(json_string)
     stored_summary = fields.get("LLM Summary", "")
-
-    # Skip if already evaluated and JSON unchanged
-    if stored_summary and f"[hash:{current_hash[:8]}]" in stored_summary:
+    if stored_summary and f"[hash:{get_json_hash(json_string)[:8]}]" in stored_summary:
         logger.info(f"Skipping {record_id} - JSON unchanged")
         return True
 
     try:
-        json_data = json.loads(json_string)
+        document = load_document(json_string, record_id)
     except json.JSONDecodeError:
         logger.error(f"Invalid JSON for record {record_id}")
         return False
+    json_data = document.data
+
+    # New summaries carry the hash of the canonical form, which stays the same
+    # when Compressed JSON is rewritten in another encoding
+    current_hash = get_json_hash(document.canonical)
+    if stored_summary and f"[hash:{current_hash[:8]}]" in stored_summary:
+        logger.info(f"Skipping {record_id} - JSON unchanged")
+        return True
 
     # Build prompt and call LLM
     prompt = build_llm_prompt(json_data)
@@ -202,22 +210,31 @@ def evaluate_applicant(client: AirtableClient, applicant_record: dict) -> bool:
 
 def evaluate_all_applicants():
     """Main function: evaluate all applicants with LLM."""
-    client = AirtableClient()
-
-    applicants = client.get_records(TABLE_APPLICANTS)
-    logger.info(f"Found {len(applicants)} applicants to evaluate")
-
-    success_count = 0
-    failure_count = 0
-
-    for applicant in applicants:
-        if evaluate_applicant(client, applicant):
-            success_count += 1
-        else:
-            failure_count += 1
-
-    logger.info(f"LLM evaluation complete: {success_count} succeeded, {failure_count} failed")
-    return success_count, failure_count
+    with AirtableClient() as client:
+        if AIRTABLE_MIRROR_PATH:
+            client.use_mirror(AIRTABLE_MIRROR_PATH)
+
+        applicants = client.get_records(TABLE_APPLICANTS, fields=["Compressed JSON", "LLM Summary"])
+        logger.info(f"Found {len(applicants)} applicants to evaluate")
+
+        succeeded = []
+        failure_count = 0
+
+        with client.buffered_writes() as writes:
+            for applicant in applicants:
+                if evaluate_applicant(client, applicant):
+                    succeeded.append(applicant["id"])
+                else:
+                    failure_count += 1
+
+        # Buffered updates are sent in batches, so some failures only surface at flush
+        failed_writes = set(writes.failed_ids)
+        success_count = sum(1 for record_id in succeeded if record_id not in failed_writes)
+        failure_count += len(succeeded) - success_count
+
+        client.log_stats("LLM evaluation")
+        logger.info(f"LLM evaluation complete: {success_count} succeeded, {failure_count} failed")
+        return success_count, failure_count
 
 
 if __name__ == "__main__":
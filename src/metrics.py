@@ -0,0 +1,140 @@
+"""
+Request Metrics - Per-endpoint latency histograms, byte counts and retry/throttle totals.
+"""
+import bisect
+import threading
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class EndpointStats:
+    """Counters for one (table, method) pair."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given fraction of requests."""
+        if not self.requests:
+            return None
+        target = fraction * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "mean_ms": round(self.total_ms / self.requests, 3) if self.requests else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 3),
+            "histogram": dict(zip([f"<={b}ms" for b in LATENCY_BUCKETS_MS] + ["slower"], self.buckets))
+        }
+
+
+class RequestStats:
+    """Thread-safe request metrics for one client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = {}  # (table, method) -> EndpointStats
+            self._list_calls = {}  # table -> [calls, pages, records, max pages]
+            self.rate_limit_waits = 0
+            self.rate_limit_seconds = 0.0
+
+    def _endpoint(self, table_name: str, method: str) -> EndpointStats:
+        key = (table_name, method)
+        if key not in self._endpoints:
+            self._endpoints[key] = EndpointStats()
+        return self._endpoints[key]
+
+    def record_request(self, table_name: str, method: str, elapsed: float,
+                       bytes_sent: int = 0, bytes_received: int = 0, error: bool = False):
+        """Record one HTTP attempt that took elapsed seconds."""
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            stats = self._endpoint(table_name, method)
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def record_retry(self, table_name: str, method: str):
+        with self._lock:
+            self._endpoint(table_name, method).retries += 1
+
+    def record_list_call(self, table_name: str, pages: int, records: int):
+        """Record one paginated list-records read."""
+        with self._lock:
+            calls = self._list_calls.setdefault(table_name, [0, 0, 0, 0])
+            calls[0] += 1
+            calls[1] += pages
+            calls[2] += records
+            calls[3] = max(calls[3], pages)
+
+    def record_rate_limit_wait(self, seconds: float):
+        with self._lock:
+            if seconds > 0:
+                self.rate_limit_waits += 1
+                self.rate_limit_seconds += seconds
+
+    def snapshot(self) -> dict:
+        """Plain-dict copy of every counter."""
+        with self._lock:
+            endpoints = {f"{method} {table}": s.to_dict() for (table, method), s in sorted(self._endpoints.items())}
+            list_calls = {
+                table: {"calls": c, "pages": p, "records": r, "max_pages": m, "pages_per_call": round(p / c, 2)}
+                for table, (c, p, r, m) in sorted(self._list_calls.items())
+            }
+            total = {
+                "requests": sum(s["requests"] for s in endpoints.values()),
+                "errors": sum(s["errors"] for s in endpoints.values()),
+                "retries": sum(s["retries"] for s in endpoints.values()),
+                "bytes_sent": sum(s["bytes_sent"] for s in endpoints.values()),
+                "bytes_received": sum(s["bytes_received"] for s in endpoints.values()),
+                "rate_limit_waits": self.rate_limit_waits,
+                "rate_limit_seconds": round(self.rate_limit_seconds, 3)
+            }
+            return {"total": total, "endpoints": endpoints, "list_calls": list_calls}
+
+    def format(self) -> list[str]:
+        """Human-readable summary lines, one per endpoint."""
+        snapshot = self.snapshot()
+        total = snapshot["total"]
+        lines = [
+            f"{total['requests']} requests, {total['retries']} retries, {total['errors']} errors, "
+            f"{total['bytes_sent']} B sent, {total['bytes_received']} B received, "
+            f"{total['rate_limit_seconds']}s throttled over {total['rate_limit_waits']} waits"
+        ]
+        for name, s in snapshot["endpoints"].items():
+            lines.append(
+                f"  {name}: {s['requests']} req, mean {s['mean_ms']} ms, p50 <={s['p50_ms']} ms, "
+                f"p95 <={s['p95_ms']} ms, max {s['max_ms']} ms, {s['retries']} retries, "
+                f"{s['bytes_sent']}/{s['bytes_received']} B"
+            )
+        for table, c in snapshot["list_calls"].items():
+            lines.append(f"  list {table}: {c['calls']} calls, {c['pages']} pages, {c['records']} records")
+        return lines
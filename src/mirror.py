@@ -0,0 +1,238 @@
+"""
+Airtable Mirror - On-disk SQLite copy of the base, kept current with incremental syncs.
+"""
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from src.config import (
+    AIRTABLE_MIRROR_PATH,
+    AIRTABLE_MIRROR_RECONCILE,
+    TABLE_APPLICANTS,
+    TABLE_EXPERIENCE,
+    TABLE_PERSONAL,
+    TABLE_SALARY,
+    TABLE_SHORTLISTED
+)
+from src.utils import format_airtable_time, get_logger
+
+logger = get_logger(__name__)
+
+# Mirrored tables and a small field to project on when scanning for deleted IDs
+MIRROR_TABLES = {
+    TABLE_APPLICANTS: "Application ID",
+    TABLE_PERSONAL: "Application ID",
+    TABLE_EXPERIENCE: "Application ID",
+    TABLE_SALARY: "Application ID",
+    TABLE_SHORTLISTED: "Applicants"
+}
+
+# Delta syncs look back this far past the last watermark to absorb clock skew
+SYNC_OVERLAP_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    table_name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_time TEXT,
+    fields TEXT NOT NULL,
+    PRIMARY KEY (table_name, id)
+);
+CREATE TABLE IF NOT EXISTS links (
+    table_name TEXT NOT NULL,
+    link_field TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    record_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS links_by_parent ON links (table_name, link_field, parent_id);
+CREATE INDEX IF NOT EXISTS links_by_record ON links (table_name, record_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    table_name TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL,
+    reconciled_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _is_link(value) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, str) and v.startswith("rec") for v in value)
+
+
+class AirtableMirror:
+    """SQLite mirror of the pipeline tables.
+
+    The first sync of a table copies it in full; later syncs fetch only
+    records created or modified since the previous one. Deletions don't show
+    up in those deltas, so every reconcile_interval seconds an ID-only scan
+    drops records that no longer exist. Linked-record fields are indexed for
+    get_linked_records.
+    """
+
+    def __init__(self, client, path: str = None, tables: dict = None,
+                 reconcile_interval: float = AIRTABLE_MIRROR_RECONCILE, overlap: float = SYNC_OVERLAP_SECONDS):
+        self.client = client
+        self.path = path or AIRTABLE_MIRROR_PATH or ":memory:"
+        self.tables = dict(MIRROR_TABLES if tables is None else tables)
+        self.reconcile_interval = reconcile_interval
+        self.overlap = overlap
+        self._lock = threading.RLock()
+        self._synced = set()
+
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._check_base()
+
+    def _check_base(self):
+        """Start over if the file was last synced against a different base."""
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'base_id'").fetchone()
+            if row and row[0] != self.client.base_id:
+                logger.warning(f"Mirror {self.path} belongs to base {row[0]}, resetting")
+                for table in ("records", "links", "sync_state"):
+                    self.conn.execute(f"DELETE FROM {table}")
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('base_id', ?)", (self.client.base_id,))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def is_mirrored(self, table_name: str) -> bool:
+        """True once the table has been synced into the mirror."""
+        return table_name in self._synced
+
+    # -- Sync -------------------------------------------------------------------
+
+    def sync(self, tables: list[str] = None, reconcile: bool = None) -> dict:
+        """Bring tables up to date; returns the number of records fetched per table."""
+        fetched = {}
+        for table_name in tables or list(self.tables):
+            fetched[table_name] = self._sync_table(table_name, reconcile)
+        logger.info(f"Mirror sync fetched {sum(fetched.values())} records across {len(fetched)} tables")
+        return fetched
+
+    def _sync_table(self, table_name: str, reconcile: bool = None) -> int:
+        started = datetime.now(timezone.utc)
+        with self._lock:
+            state = self.conn.execute(
+                "SELECT synced_at, reconciled_at FROM sync_state WHERE table_name = ?", (table_name,)
+            ).fetchone()
+
+        if state is None:
+            records = list(self.client.iter_records(table_name))
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM records WHERE table_name = ?", (table_name,))
+                self.conn.execute("DELETE FROM links WHERE table_name = ?", (table_name,))
+                self._upsert(table_name, records)
+            reconciled_at = time.time()
+        else:
+            synced_at, reconciled_at = state
+            formula = (f"OR(IS_AFTER(LAST_MODIFIED_TIME(), '{synced_at}'), "
+                       f"IS_AFTER(CREATED_TIME(), '{synced_at}'))")
+            records = list(self.client.iter_records(table_name, formula))
+            with self._lock, self.conn:
+                self._upsert(table_name, records)
+
+            if reconcile or (reconcile is None and time.time() - reconciled_at >= self.reconcile_interval):
+                self._reconcile(table_name)
+                reconciled_at = time.time()
+
+        # Timestamps have millisecond precision; step back one so edits in the same millisecond aren't missed
+        watermark = format_airtable_time(started - timedelta(seconds=self.overlap, milliseconds=1))
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (table_name, synced_at, reconciled_at) VALUES (?, ?, ?)",
+                (table_name, watermark, reconciled_at)
+            )
+        self._synced.add(table_name)
+        return len(records)
+
+    def _reconcile(self, table_name: str):
+        """Drop mirrored records that no longer exist in Airtable."""
+        key_field = self.tables.get(table_name)
+        live = {r["id"] for r in self.client.iter_records(table_name, fields=[key_field] if key_field else None)}
+        with self._lock:
+            mirrored = {row[0] for row in self.conn.execute(
+                "SELECT id FROM records WHERE table_name = ?", (table_name,)
+            )}
+        gone = list(mirrored - live)
+        if gone:
+            with self._lock, self.conn:
+                self._delete(table_name, gone)
+            logger.info(f"Mirror dropped {len(gone)} deleted records from {table_name}")
+
+    # -- Writes -----------------------------------------------------------------
+
+    def _upsert(self, table_name: str, records: list[dict]):
+        self.conn.executemany(
+            "INSERT INTO records (table_name, id, created_time, fields) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (table_name, id) DO UPDATE SET fields = excluded.fields",
+            [(table_name, r["id"], r.get("createdTime"), json.dumps(r.get("fields", {}))) for r in records]
+        )
+        self.conn.executemany(
+            "DELETE FROM links WHERE table_name = ? AND record_id = ?",
+            [(table_name, r["id"]) for r in records]
+        )
+        self.conn.executemany(
+            "INSERT INTO links (table_name, link_field, parent_id, record_id) VALUES (?, ?, ?, ?)",
+            [
+                (table_name, field, parent_id, r["id"])
+                for r in records
+                for field, value in r.get("fields", {}).items() if _is_link(value)
+                for parent_id in value
+            ]
+        )
+
+    def _delete(self, table_name: str, record_ids: list[str]):
+        params = [(table_name, rid) for rid in record_ids]
+        self.conn.executemany("DELETE FROM records WHERE table_name = ? AND id = ?", params)
+        self.conn.executemany("DELETE FROM links WHERE table_name = ? AND record_id = ?", params)
+
+    def apply_writes(self, table_name: str, records: list[dict]):
+        """Record creates/updates made through the client."""
+        if table_name not in self._synced or not records:
+            return
+        with self._lock, self.conn:
+            self._upsert(table_name, [r for r in records if "id" in r])
+
+    def apply_deletes(self, table_name: str, record_ids: list[str]):
+        """Record deletes made through the client."""
+        if table_name not in self._synced or not record_ids:
+            return
+        with self._lock, self.conn:
+            self._delete(table_name, record_ids)
+
+    # -- Reads ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_record(row: tuple, fields: list[str] = None) -> dict:
+        record_id, created_time, data = row
+        values = json.loads(data)
+        if fields:
+            values = {k: v for k, v in values.items() if k in fields}
+        return {"id": record_id, "createdTime": created_time, "fields": values}
+
+    def get_records(self, table_name: str, fields: list[str] = None) -> list[dict]:
+        """All mirrored records of a table, in the order they were first synced."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, created_time, fields FROM records WHERE table_name = ? ORDER BY rowid", (table_name,)
+            ).fetchall()
+        return [self._to_record(row, fields) for row in rows]
+
+    def get_linked_records(self, parent_id: str, table_name: str, link_field: str = "Application ID") -> list[dict]:
+        """Mirrored records of table_name whose link_field contains parent_id."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT r.id, r.created_time, r.fields FROM links l "
+                "JOIN records r ON r.table_name = l.table_name AND r.id = l.record_id "
+                "WHERE l.table_name = ? AND l.link_field = ? AND l.parent_id = ? ORDER BY r.rowid",
+                (table_name, link_field, parent_id)
+            ).fetchall()
+        return [self._to_record(row) for row in rows]
@@ -0,0 +1,128 @@
+"""
+Rate Limiter - Token bucket shared across threads and, optionally, processes.
+"""
+import asyncio
+import os
+import struct
+import tempfile
+import threading
+import time
+from src.config import (
+    AIRTABLE_RATE_LIMIT,
+    AIRTABLE_RATE_BURST,
+    AIRTABLE_RATE_LIMIT_DIR
+)
+from src.utils import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to a per-process bucket
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# Bucket state on disk: (tokens, last refill timestamp)
+_STATE = struct.Struct("dd")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; pass state_path to share it between processes."""
+
+    def __init__(self, rate: float, capacity: float = None, state_path: str = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.state_path = state_path if fcntl else None
+        if state_path and not fcntl:
+            logger.warning("File locking unavailable, rate limiter is per-process only")
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._fd = None
+        self._fd_pid = None
+
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _open_state(self) -> int:
+        # A descriptor inherited across fork shares its flock, so reopen per process
+        if self._fd is None or self._fd_pid != os.getpid():
+            self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._fd_pid = os.getpid()
+        return self._fd
+
+    def _take(self, now: float, tokens: float, updated: float) -> tuple[float, float]:
+        """Refill, take one token and return (remaining tokens, wait seconds)."""
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+
+    def reserve(self) -> float:
+        """Take a token now and return how long to wait before using it."""
+        with self._lock:
+            now = time.time()
+            if self.state_path:
+                fd = self._open_state()
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    raw = os.pread(fd, _STATE.size, 0)
+                    tokens, updated = _STATE.unpack(raw) if len(raw) == _STATE.size else (self.capacity, now)
+                    tokens, wait = self._take(now, tokens, updated)
+                    os.pwrite(fd, _STATE.pack(tokens, now), 0)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                self._tokens, wait = self._take(now, self._tokens, self._updated)
+                self._updated = now
+
+            self._acquired += 1
+            if wait > 0:
+                self._throttled += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+        return wait
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns seconds slept."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Asyncio variant of acquire that yields to the event loop while waiting."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> dict:
+        """Throttling metrics for this process."""
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "total_wait": round(self._total_wait, 3),
+                "max_wait": round(self._max_wait, 3),
+                "avg_wait": round(self._total_wait / self._acquired, 3) if self._acquired else 0.0
+            }
+
+
+_shared_limiters: dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_limiter(base_id: str) -> TokenBucket:
+    """Return the process-wide bucket for a base, backed by a lock file when configured."""
+    with _shared_lock:
+        limiter = _shared_limiters.get(base_id)
+        if limiter is None:
+            state_path = None
+            if AIRTABLE_RATE_LIMIT_DIR != "":
+                state_dir = AIRTABLE_RATE_LIMIT_DIR or tempfile.gettempdir()
+                state_path = os.path.join(state_dir, f"airtable-{base_id}.ratelimit")
+            limiter = TokenBucket(AIRTABLE_RATE_LIMIT, AIRTABLE_RATE_BURST, state_path)
+            _shared_limiters[base_id] = limiter
+        return limiter
@@ -0,0 +1,136 @@
+"""
+Record Cache - TTL snapshots of table reads with write-through and change detection.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from src.config import AIRTABLE_CACHE_TTL, AIRTABLE_CACHE_MAX_RECORDS
+
+
+def snapshot_fingerprint(records: list[dict]) -> str:
+    """Stable digest of a table snapshot, used to detect whether it changed."""
+    payload = json.dumps(records, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class RecordCache:
+    """Read-through cache of get_records results keyed by table + query parameters.
+
+    Snapshots expire after ttl seconds and the least recently used ones are
+    evicted once more than max_records records are held. Each key carries a
+    version that only moves when a refetch returns different content, so
+    anything derived from a snapshot can be kept across unchanged refreshes.
+    """
+
+    def __init__(self, ttl: float = AIRTABLE_CACHE_TTL, max_records: int = AIRTABLE_CACHE_MAX_RECORDS):
+        self.ttl = ttl
+        self.max_records = max_records
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()  # key -> {"records": [...], "stored_at": t}
+        self._fingerprints = {}  # key -> (fingerprint, version), kept across expiry
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _drop(self, key: tuple):
+        entry = self._entries.pop(key)
+        self._size -= len(entry["records"])
+
+    def get(self, key: tuple) -> list[dict] | None:
+        """Cached records for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry["stored_at"] > self.ttl:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["records"]
+
+    def put(self, key: tuple, records: list[dict]) -> int:
+        """Store a fresh snapshot and return its version."""
+        with self._lock:
+            fingerprint = snapshot_fingerprint(records)
+            previous, version = self._fingerprints.get(key, (None, 0))
+            if fingerprint != previous:
+                version += 1
+                self._fingerprints[key] = (fingerprint, version)
+
+            if not self.enabled:
+                return version
+
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = {"records": records, "stored_at": time.monotonic()}
+            self._size += len(records)
+
+            while self._size > self.max_records and len(self._entries) > 1:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+            return version
+
+    def version(self, key: tuple) -> int:
+        with self._lock:
+            return self._fingerprints.get(key, (None, 0))[1]
+
+    def apply_writes(self, table_name: str, records: list[dict]):
+        """Write-through: patch the table's full snapshot, drop its filtered ones."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == table_name]:
+                if any(part is not None for part in key[1:]):
+                    self._drop(key)
+                    continue
+                entry = self._entries[key]
+                snapshot = entry["records"]
+                if "positions" not in entry:
+                    entry["positions"] = {r["id"]: i for i, r in enumerate(snapshot)}
+                positions = entry["positions"]
+                for record in records:
+                    record_id = record.get("id")
+                    if record_id in positions:
+                        snapshot[positions[record_id]] = record
+                    elif record_id:
+                        positions[record_id] = len(snapshot)
+                        snapshot.append(record)
+                        self._size += 1
+
+    def apply_deletes(self, table_name: str, record_ids: list[str]):
+        """Write-through: remove deleted records from the table's snapshots."""
+        deleted = set(record_ids)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == table_name]:
+                entry = self._entries[key]
+                snapshot = entry["records"]
+                kept = [r for r in snapshot if r.get("id") not in deleted]
+                self._size -= len(snapshot) - len(kept)
+                snapshot[:] = kept
+                entry.pop("positions", None)
+
+    def invalidate(self, table_name: str = None):
+        """Drop one table's snapshots, or all of them."""
+        with self._lock:
+            for key in [k for k in self._entries if table_name is None or k[0] == table_name]:
+                self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "records": self._size
+            }
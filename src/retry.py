@@ -0,0 +1,198 @@
+"""
+Retry Policy - Classify failures, back off with jitter and fail fast when a service is down.
+"""
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, TypeVar
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Throttling, timeouts and server-side errors; every other 4xx is the caller's fault
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service whose circuit breaker is open."""
+
+
+def get_status_code(error: Exception) -> int | None:
+    """HTTP status carried by a requests/httpx/SDK error, if any."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def get_retry_after(error: Exception) -> float | None:
+    """Seconds requested by a Retry-After header on the error's response."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Which failures to retry and how long to wait between attempts."""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 retryable_statuses: frozenset = RETRYABLE_STATUS_CODES):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_statuses = retryable_statuses
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Connection errors and throttling/server statuses are retried; other statuses are fatal."""
+        status = get_status_code(error)
+        return status is None or status in self.retryable_statuses
+
+    def next_delay(self, previous_delay: float, error: Exception = None) -> float:
+        """Decorrelated jitter, stretched to honor Retry-After when the server sent one."""
+        delay = min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)))
+        retry_after = get_retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    """Opens after consecutive retryable failures and rejects calls until reset_timeout passes.
+
+    After the timeout one trial call is let through (half-open); success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0, name: str = "service"):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go through now."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(f"Circuit open for {self.name} after {self._failures} consecutive failures")
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.error(f"Circuit breaker opened for {self.name} after {self._failures} consecutive failures")
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def release_trial(self):
+        """End a half-open trial that neither succeeded nor failed, so the next call can try again."""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+def call_with_retry(func: Callable[[], T], policy: RetryPolicy, breaker: CircuitBreaker = None,
+                    errors: tuple = (Exception,), label: str = "Request") -> T:
+    """Call func, retrying retryable errors under the policy and breaker."""
+    delay = policy.base_delay
+    for attempt in range(1, policy.max_attempts + 1):
+        if breaker:
+            breaker.before_call()
+        try:
+            result = func()
+        except errors as e:
+            if not policy.is_retryable(e):
+                if breaker:
+                    breaker.record_success()  # The service answered; the request itself was bad
+                logger.warning(f"{label} failed with a non-retryable error: {e}")
+                raise
+            if breaker:
+                breaker.record_failure()
+            if attempt == policy.max_attempts:
+                logger.warning(f"{label} failed (attempt {attempt}/{policy.max_attempts}): {e}")
+                raise
+            delay = policy.next_delay(delay, e)
+            logger.warning(f"{label} failed (attempt {attempt}/{policy.max_attempts}): {e}; retrying in {delay:.1f}s")
+            time.sleep(delay)
+        except BaseException:
+            # Errors outside `errors` say nothing about the service; don't leave a trial stuck in flight
+            if breaker:
+                breaker.release_trial()
+            raise
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
+
+
+async def call_with_retry_async(func: Callable[[], Awaitable[T]], policy: RetryPolicy, breaker: CircuitBreaker = None,
+                                errors: tuple = (Exception,), label: str = "Request") -> T:
+    """Asyncio variant of call_with_retry."""
+    delay = policy.base_delay
+    for attempt in range(1, policy.max_attempts + 1):
+        if breaker:
+            breaker.before_call()
+        try:
+            result = await func()
+        except errors as e:
+            if not policy.is_retryable(e):
+                if breaker:
+                    breaker.record_success()
+                logger.warning(f"{label} failed with a non-retryable error: {e}")
+                raise
+            if breaker:
+                breaker.record_failure()
+            if attempt == policy.max_attempts:
+                logger.warning(f"{label} failed (attempt {attempt}/{policy.max_attempts}): {e}")
+                raise
+            delay = policy.next_delay(delay, e)
+            logger.warning(f"{label} failed (attempt {attempt}/{policy.max_attempts}): {e}; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        except BaseException:
+            if breaker:
+                breaker.release_trial()
+            raise
+        else:
+            if breaker:
+                breaker.record_success()
+            return result
@@ -5,51 +5,56 @@ import json
 from datetime import datetime
 from src.airtable_client import AirtableClient
 from src.config import (
+    AIRTABLE_MIRROR_PATH,
     TABLE_APPLICANTS,
     TABLE_SHORTLISTED,
-    TIER_1_COMPANIES,
     MIN_EXPERIENCE_YEARS,
     MAX_PREFERRED_RATE,
     MIN_AVAILABILITY_HOURS,
     APPROVED_LOCATIONS
 )
+from src.document_cache import ApplicantDocument, load_document
+from src.json_codec import encode_applicant
+from src.tier1 import get_tier1_matcher
 from src.utils import get_logger, calculate_years_between, normalize_location
 
 logger = get_logger(__name__)
 
 
-def calculate_total_experience(experience_list: list) -> float:
-    """Calculate total years from experience entries."""
+def calculate_total_experience(experience_list: list, now: datetime = None) -> float:
+    """Calculate total years from experience entries (open-ended roles run to now)."""
     total_years = 0.0
+    now = now or datetime.now()
 
     for exp in experience_list:
         start = exp.get("start")
         end = exp.get("end")
-        years = calculate_years_between(start, end)
+        years = calculate_years_between(start, end, now)
         total_years += years
 
     return round(total_years, 2)
 
 
 def worked_at_tier1(experience_list: list) -> tuple[bool, str | None]:
-    """Check if any company is in Tier-1 list."""
+    """Check if any company is in Tier-1 list (or is an alias of one), as whole words."""
+    matcher = get_tier1_matcher()
     for exp in experience_list:
         company = exp.get("company", "").strip()
-        for tier1 in TIER_1_COMPANIES:
-            if tier1.lower() in company.lower():
-                return True, company
+        if matcher.match(company):
+            return True, company
     return False, None
 
 
-def meets_experience_criteria(experience_list: list) -> tuple[bool, list[str]]:
+def meets_experience_criteria(experience_list: list, now: datetime = None,
+                              min_years: float = MIN_EXPERIENCE_YEARS) -> tuple[bool, list[str]]:
     """Evaluate experience criterion."""
     reasons = []
 
-    total_years = calculate_total_experience(experience_list)
-    has_min_experience = total_years >= MIN_EXPERIENCE_YEARS
+    total_years = calculate_total_experience(experience_list, now)
+    has_min_experience = total_years >= min_years
 
     if has_min_experience:
-        reasons.append(f"{total_years} years total experience (exceeds {MIN_EXPERIENCE_YEARS}-year minimum)")
+        reasons.append(f"{total_years} years total experience (exceeds {min_years}-year minimum)")
 
     is_tier1, company = worked_at_tier1(experience_list)
     if is_tier1:
@@ -59,7 +64,8 @@ def meets_experience_criteria(experience_list: list) -> tuple[bool, list[str]]:
     return passed, reasons
 
 
-def meets_compensation_criteria(salary_data: dict) -> tuple[bool, list[str]]:
+def meets_compensation_criteria(salary_data: dict, max_rate: float = MAX_PREFERRED_RATE,
+                                min_hours: float = MIN_AVAILABILITY_HOURS) -> tuple[bool, list[str]]:
     """Evaluate rate and availability."""
     reasons = []
 
@@ -68,47 +74,49 @@ def meets_compensation_criteria(salary_data: dict) -> tuple[bool, list[str]]:
     currency = salary_data.get("currency", "USD")
 
     # Check rate (assumes USD for simplicity)
-    rate_ok = preferred_rate <= MAX_PREFERRED_RATE and preferred_rate > 0
-    availability_ok = availability >= MIN_AVAILABILITY_HOURS
+    rate_ok = preferred_rate <= max_rate and preferred_rate > 0
+    availability_ok = availability >= min_hours
 
     if rate_ok:
-        reasons.append(f"Preferred rate: ${preferred_rate}/hour {currency} (under ${MAX_PREFERRED_RATE} threshold)")
+        reasons.append(f"Preferred rate: ${preferred_rate}/hour {currency} (under ${max_rate} threshold)")
 
     if availability_ok:
-        reasons.append(f"Availability: {availability} hours/week (exceeds {MIN_AVAILABILITY_HOURS}-hour minimum)")
+        reasons.append(f"Availability: {availability} hours/week (exceeds {min_hours}-hour minimum)")
 
     passed = rate_ok and availability_ok
     return passed, reasons
 
 
-def meets_location_criteria(personal_data: dict) -> tuple[bool, list[str]]:
+def meets_location_criteria(personal_data: dict, approved: list[str] = APPROVED_LOCATIONS) -> tuple[bool, list[str]]:
     """Normalize and check location."""
     reasons = []
 
     location = personal_data.get("location", "")
     country = normalize_location(location)
 
-    if country and country in APPROVED_LOCATIONS:
+    if country and country in approved:
         reasons.append(f"Location: {location} (approved location)")
         return True, reasons
 
     return False, reasons
 
 
-def evaluate_applicant(applicant_json: dict) -> tuple[bool, list[str]]:
-    """Run all criteria checks, return (passed, reasons)."""
+def evaluate_applicant(applicant_json: dict, now: datetime = None, min_years: float = MIN_EXPERIENCE_YEARS,
+                       max_rate: float = MAX_PREFERRED_RATE, min_hours: float = MIN_AVAILABILITY_HOURS,
+                       approved: list[str] = APPROVED_LOCATIONS) -> tuple[bool, list[str]]:
+    """Run all criteria checks, return (passed, reasons); now is the reference time for open-ended roles."""
     all_reasons = []
 
     # Experience criteria
-    exp_passed, exp_reasons = meets_experience_criteria(applicant_json.get("experience", []))
+    exp_passed, exp_reasons = meets_experience_criteria(applicant_json.get("experience", []), now, min_years)
     all_reasons.extend(exp_reasons)
 
     # Compensation criteria
-    comp_passed, comp_reasons = meets_compensation_criteria(applicant_json.get("salary", {}))
+    comp_passed, comp_reasons = meets_compensation_criteria(applicant_json.get("salary", {}), max_rate, min_hours)
     all_reasons.extend(comp_reasons)
 
     # Location criteria
-    loc_passed, loc_reasons = meets_location_criteria(applicant_json.get("personal", {}))
+    loc_passed, loc_reasons = meets_location_criteria(applicant_json.get("personal", {}), approved)
     all_reasons.extend(loc_reasons)
 
     # All criteria must be met
@@ -117,8 +125,9 @@ def evaluate_applicant(applicant_json: dict) -> tuple[bool, list[str]]:
     return passed, all_reasons
 
 
-def create_shortlisted_lead(client: AirtableClient, applicant_record_id: str, json_data: dict, reasons: list) -> bool:
-    """Create Shortlisted Leads record."""
+def create_shortlisted_lead(client: AirtableClient, applicant_record_id: str, json_data: dict, reasons: list,
+                            encoded: str = None) -> bool:
+    """Create Shortlisted Leads record (encoded: json_data already in Compressed JSON form)."""
     try:
         # Check if already shortlisted
         existing = client.get_linked_records(applicant_record_id, TABLE_SHORTLISTED, "Applicants")
@@ -128,7 +137,7 @@ def create_shortlisted_lead(client: AirtableClient, applicant_record_id: str, js
 
         fields = {
             "Applicants": [applicant_record_id],
-            "Compressed JSON": json.dumps(json_data, indent=2),
+            "Compressed JSON": encoded or encode_applicant(json_data),
             "Score Reason": "\n".join(f"- {r}" for r in reasons)
         }
 
@@ -147,7 +156,7 @@ def create_shortlisted_lead(client: AirtableClient, applicant_record_id: str, js
         return False
 
 
-def shortlist_applicant(client: AirtableClient, applicant_record: dict) -> bool:
+def shortlist_applicant(client: AirtableClient, applicant_record: dict, now: datetime = None) -> bool:
     """Evaluate and shortlist a single applicant."""
     record_id = applicant_record.get("id")
     fields = applicant_record.get("fields", {})
@@ -158,15 +167,19 @@ def shortlist_applicant(client: AirtableClient, applicant_record: dict) -> bool:
         return False
 
     try:
-        json_data = json.loads(json_string)
+        document = load_document(json_string, record_id)
     except json.JSONDecodeError:
         logger.error(f"Invalid JSON for record {record_id}")
         return False
 
-    passed, reasons = evaluate_applicant(json_data)
+    passed, reasons = evaluate_applicant(document.data, now)
+    return record_shortlist_result(client, record_id, document, passed, reasons)
 
+
+def record_shortlist_result(client: AirtableClient, record_id: str, document: ApplicantDocument, passed: bool, reasons: list) -> bool:
+    """Shortlist or reject an evaluated applicant; True when it ends up shortlisted."""
     if passed:
-        return create_shortlisted_lead(client, record_id, json_data, reasons)
+        return create_shortlisted_lead(client, record_id, document.data, reasons, document.encoded)
     else:
         # Update status to Rejected
         client.update_record(TABLE_APPLICANTS, record_id, {
@@ -178,23 +191,32 @@ def shortlist_applicant(client: AirtableClient, applicant_record: dict) -> bool:
 
 def shortlist_all_applicants():
     """Main function: evaluate all applicants."""
-    client = AirtableClient()
-
-    # Fetch applicants with Compressed JSON
-    applicants = client.get_records(TABLE_APPLICANTS)
-    logger.info(f"Found {len(applicants)} applicants to evaluate")
-
-    shortlisted_count = 0
-    rejected_count = 0
-
-    for applicant in applicants:
-        if shortlist_applicant(client, applicant):
-            shortlisted_count += 1
-        else:
-            rejected_count += 1
-
-    logger.info(f"Shortlist complete: {shortlisted_count} shortlisted, {rejected_count} rejected/skipped")
-    return shortlisted_count, rejected_count
+    with AirtableClient() as client:
+        if AIRTABLE_MIRROR_PATH:
+            client.use_mirror(AIRTABLE_MIRROR_PATH)
+
+        # Fetch applicants with Compressed JSON
+        applicants = client.get_records(TABLE_APPLICANTS, fields=["Compressed JSON"])
+        logger.info(f"Found {len(applicants)} applicants to evaluate")
+
+        shortlisted_count = 0
+        rejected_count = 0
+        # One reference time for the whole run, so every applicant is measured against the same "now"
+        now = datetime.now()
+
+        with client.buffered_writes() as writes:
+            for applicant in applicants:
+                if shortlist_applicant(client, applicant, now):
+                    shortlisted_count += 1
+                else:
+                    rejected_count += 1
+
+        if writes.failed_ids:
+            logger.error(f"Failed to save Shortlist Status for {len(writes.failed_ids)} applicants")
+
+        client.log_stats("Shortlist")
+        logger.info(f"Shortlist complete: {shortlisted_count} shortlisted, {rejected_count} rejected/skipped")
+        return shortlisted_count, rejected_count
 
 
 if __name__ == "__main__":
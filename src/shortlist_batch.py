@@ -0,0 +1,273 @@
+"""
+Batch Shortlist Evaluation - Columnar rule checks over many applicants at once.
+"""
+import argparse
+import json
+from datetime import datetime
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # pinned in requirements.txt; without it the masks fall back to plain lists
+    np = None
+
+from src.airtable_client import AirtableClient
+from src.config import (
+    AIRTABLE_MIRROR_PATH,
+    APPROVED_LOCATIONS,
+    MAX_PREFERRED_RATE,
+    MIN_AVAILABILITY_HOURS,
+    MIN_EXPERIENCE_YEARS,
+    TABLE_APPLICANTS,
+    TABLE_SHORTLISTED
+)
+from src.document_cache import ApplicantDocument, load_document
+from src.shortlist import calculate_total_experience, evaluate_applicant, worked_at_tier1
+from src.utils import get_logger, normalize_location
+
+logger = get_logger(__name__)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+class ApplicantColumns:
+    """Decoded applicants as parallel columns, one entry per applicant.
+
+    Numeric columns become float arrays when NumPy is available. Countries
+    are stored as integer codes into self.countries. Applicants the columns
+    can't represent exactly (non-numeric rates, odd section types) are
+    listed in self.irregular and left to the scalar evaluator, which
+    rejects rows it can't compare either. Open-ended
+    roles are measured up to now.
+    """
+
+    def __init__(self, applicants: list[dict], now: datetime = None):
+        self.size = len(applicants)
+        self.now = now or datetime.now()
+        self.total_years = []
+        self.tier1_company = []
+        self.preferred_rate = []
+        self.availability = []
+        self.currency = []
+        self.location = []
+        self.country_code = []
+        self.countries = []
+        self.irregular = set()
+
+        codes = {}
+        for index, applicant in enumerate(applicants):
+            if not isinstance(applicant, dict):
+                applicant = {}
+                self.irregular.add(index)
+            experience = applicant.get("experience", [])
+            salary = applicant.get("salary", {})
+            personal = applicant.get("personal", {})
+            if not (isinstance(experience, list) and isinstance(salary, dict) and isinstance(personal, dict)):
+                experience, salary, personal = [], {}, {}
+                self.irregular.add(index)
+
+            rate = salary.get("preferred_rate", 0)
+            availability = salary.get("availability", 0)
+            location = personal.get("location", "")
+            if not (_is_number(rate) and _is_number(availability) and (location is None or isinstance(location, str))):
+                rate, availability, location = 0, 0, ""
+                self.irregular.add(index)
+
+            total_years, tier1 = 0.0, None
+            if index not in self.irregular:
+                try:
+                    total_years = calculate_total_experience(experience, self.now)
+                    tier1 = worked_at_tier1(experience)[1]
+                except (AttributeError, TypeError, ValueError):
+                    # Malformed experience entries; the scalar path reports the error for this row
+                    total_years, tier1 = 0.0, None
+                    self.irregular.add(index)
+
+            country = normalize_location(location)
+            if country not in codes:
+                codes[country] = len(self.countries)
+                self.countries.append(country)
+
+            self.total_years.append(total_years)
+            self.tier1_company.append(tier1)
+            self.preferred_rate.append(rate)
+            self.availability.append(availability)
+            self.currency.append(salary.get("currency", "USD"))
+            self.location.append(location)
+            self.country_code.append(codes[country])
+
+
+def _masks(columns: ApplicantColumns, min_years: float, max_rate: float, min_hours: float,
+           approved: list[str]) -> dict[str, list[bool]]:
+    """Boolean rule masks over the columns, vectorized when NumPy is installed."""
+    approved_by_code = [bool(country) and country in approved for country in columns.countries]
+
+    if np is not None:
+        years = np.array(columns.total_years, dtype=float)
+        rate = np.array(columns.preferred_rate, dtype=float)
+        hours = np.array(columns.availability, dtype=float)
+        codes = np.array(columns.country_code, dtype=np.intp)
+        masks = {
+            "experience": years >= min_years,
+            "tier1": np.array([c is not None for c in columns.tier1_company], dtype=bool),
+            "rate": (rate <= max_rate) & (rate > 0),
+            "availability": hours >= min_hours,
+            "location": np.array(approved_by_code, dtype=bool)[codes] if columns.size else np.zeros(0, dtype=bool)
+        }
+        return {name: mask.tolist() for name, mask in masks.items()}
+
+    return {
+        "experience": [years >= min_years for years in columns.total_years],
+        "tier1": [c is not None for c in columns.tier1_company],
+        "rate": [max_rate >= rate > 0 for rate in columns.preferred_rate],
+        "availability": [hours >= min_hours for hours in columns.availability],
+        "location": [approved_by_code[code] for code in columns.country_code]
+    }
+
+
+def _evaluate_irregular(applicant: dict, now: datetime, min_years: float, max_rate: float, min_hours: float,
+                        approved: list[str]) -> tuple[bool, list[str]]:
+    """Scalar evaluation at the batch's thresholds; data the rules can't compare rejects the row."""
+    try:
+        return evaluate_applicant(applicant, now, min_years, max_rate, min_hours, approved)
+    except (AttributeError, TypeError, ValueError) as e:
+        logger.error(f"Could not evaluate applicant data: {e}")
+        return False, [f"Could not evaluate applicant data: {e}"]
+
+
+def evaluate_applicants(applicants: list[dict], min_years: float = MIN_EXPERIENCE_YEARS,
+                        max_rate: float = MAX_PREFERRED_RATE, min_hours: float = MIN_AVAILABILITY_HOURS,
+                        approved: list[str] = APPROVED_LOCATIONS, now: datetime = None) -> list[tuple[bool, list[str]]]:
+    """Batch form of shortlist.evaluate_applicant: (passed, reasons) per applicant, in order.
+
+    With the default thresholds the results, reason strings included, are
+    identical to calling evaluate_applicant on each applicant. Passing other
+    thresholds re-screens the same applicants without touching config. All
+    applicants share one reference now (the time of the call by default).
+    """
+    columns = ApplicantColumns(applicants, now)
+    masks = _masks(columns, min_years, max_rate, min_hours, approved)
+
+    results = []
+    for i in range(columns.size):
+        if i in columns.irregular:
+            results.append(_evaluate_irregular(applicants[i], columns.now, min_years, max_rate, min_hours, approved))
+            continue
+
+        reasons = []
+        if masks["experience"][i]:
+            reasons.append(f"{columns.total_years[i]} years total experience (exceeds {min_years}-year minimum)")
+        if masks["tier1"][i]:
+            reasons.append(f"Worked at {columns.tier1_company[i]} (Tier-1 company)")
+        if masks["rate"][i]:
+            reasons.append(f"Preferred rate: ${columns.preferred_rate[i]}/hour {columns.currency[i]} "
+                           f"(under ${max_rate} threshold)")
+        if masks["availability"][i]:
+            reasons.append(f"Availability: {columns.availability[i]} hours/week (exceeds {min_hours}-hour minimum)")
+        if masks["location"][i]:
+            reasons.append(f"Location: {columns.location[i]} (approved location)")
+
+        passed = ((masks["experience"][i] or masks["tier1"][i]) and masks["rate"][i]
+                  and masks["availability"][i] and masks["location"][i])
+        results.append((passed, reasons))
+
+    logger.info(f"Evaluated {columns.size} applicants in batch "
+                f"({'NumPy' if np is not None else 'pure Python'}, {len(columns.irregular)} irregular)")
+    return results
+
+
+def rescreen_applicant(client: AirtableClient, applicant: dict, document: ApplicantDocument,
+                       passed: bool, reasons: list) -> tuple[bool, list[str]]:
+    """Bring one applicant's status and Shortlisted Leads in line with a fresh evaluation.
+
+    Unlike the one-shot shortlist path, an existing lead is kept current:
+    its Score Reason and Compressed JSON are rewritten when they changed,
+    and leads of applicants who no longer pass are returned for deletion.
+    Returns (shortlisted, lead IDs to delete).
+    """
+    record_id = applicant["id"]
+    leads = client.get_linked_records(record_id, TABLE_SHORTLISTED, "Applicants")
+    status = "Shortlisted" if passed else "Rejected"
+    if applicant.get("fields", {}).get("Shortlist Status") != status:
+        client.update_record(TABLE_APPLICANTS, record_id, {"Shortlist Status": status})
+
+    if not passed:
+        return False, [lead["id"] for lead in leads]
+
+    fields = {
+        "Compressed JSON": document.encoded,
+        "Score Reason": "\n".join(f"- {r}" for r in reasons)
+    }
+    if not leads:
+        client.create_record(TABLE_SHORTLISTED, {"Applicants": [record_id], **fields})
+        logger.info(f"Created Shortlisted Lead for {record_id}")
+    elif any(leads[0].get("fields", {}).get(name) != value for name, value in fields.items()):
+        client.update_record(TABLE_SHORTLISTED, leads[0]["id"], fields)
+    # Duplicate leads for one applicant are dropped
+    return True, [lead["id"] for lead in leads[1:]]
+
+
+def rescreen_all_applicants(**thresholds):
+    """Re-shortlist the whole base from one batch evaluation (thresholds as for evaluate_applicants).
+
+    Applicants who now fail are rejected and lose their Shortlisted Leads;
+    those who still pass get their lead's reasons refreshed. Counts match
+    shortlist.shortlist_all_applicants: applicants without usable JSON
+    count as rejected/skipped and are left untouched.
+    """
+    with AirtableClient() as client:
+        if AIRTABLE_MIRROR_PATH:
+            client.use_mirror(AIRTABLE_MIRROR_PATH)
+
+        applicants = client.get_records(TABLE_APPLICANTS, fields=["Compressed JSON", "Shortlist Status"])
+        logger.info(f"Found {len(applicants)} applicants to re-screen")
+
+        documents = []
+        for applicant in applicants:
+            json_string = applicant.get("fields", {}).get("Compressed JSON")
+            if not json_string:
+                logger.warning(f"Record {applicant['id']} has no Compressed JSON, skipping")
+                continue
+            try:
+                documents.append((applicant, load_document(json_string, applicant["id"])))
+            except json.JSONDecodeError:
+                logger.error(f"Invalid JSON for record {applicant['id']}")
+
+        results = evaluate_applicants([document.data for _, document in documents], **thresholds)
+
+        shortlisted_count = 0
+        stale_leads = []
+        with client.buffered_writes() as writes:
+            for (applicant, document), (passed, reasons) in zip(documents, results):
+                try:
+                    shortlisted, to_delete = rescreen_applicant(client, applicant, document, passed, reasons)
+                except Exception as e:
+                    logger.error(f"Failed to re-screen {applicant['id']}: {e}")
+                    continue
+                shortlisted_count += shortlisted
+                stale_leads.extend(to_delete)
+
+            if stale_leads:
+                client.batch_delete(TABLE_SHORTLISTED, stale_leads)
+                logger.info(f"Deleted {len(stale_leads)} Shortlisted Leads that no longer pass")
+        rejected_count = len(applicants) - shortlisted_count
+
+        if writes.failed_ids:
+            logger.error(f"Failed to save re-screen updates for {len(writes.failed_ids)} records")
+
+        client.log_stats("Shortlist")
+        logger.info(f"Re-screen complete: {shortlisted_count} shortlisted, {rejected_count} rejected/skipped")
+        return shortlisted_count, rejected_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-screen every applicant in one batch evaluation.")
+    parser.add_argument("--min-years", type=float, default=MIN_EXPERIENCE_YEARS)
+    parser.add_argument("--max-rate", type=float, default=MAX_PREFERRED_RATE)
+    parser.add_argument("--min-hours", type=float, default=MIN_AVAILABILITY_HOURS)
+    parser.add_argument("--approved", nargs="+", default=APPROVED_LOCATIONS, help="approved countries")
+    args = parser.parse_args()
+    rescreen_all_applicants(min_years=args.min_years, max_rate=args.max_rate,
+                            min_hours=args.min_hours, approved=args.approved)
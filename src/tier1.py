@@ -0,0 +1,100 @@
+"""
+Tier-1 Company Matching - One precompiled regex over every Tier-1 name and alias.
+"""
+import re
+from src import config
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase with runs of whitespace collapsed, as names are stored in the matcher."""
+    return " ".join(name.split()).lower()
+
+
+def _trie_pattern(names: list[str]) -> str:
+    """Regex alternation of names laid out as a character trie.
+
+    Python's re tries each branch of a flat alternation in turn; sharing
+    prefixes makes each attempt cost the length of the name, not the size
+    of the list.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [(r"\s+" if char == " " else re.escape(char)) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return build(trie)
+
+
+class Tier1Matcher:
+    """Finds Tier-1 companies and their aliases as whole words in a company name.
+
+    Aliases ("Meta", "Instagram") map to their canonical Tier-1 company
+    ("Facebook"). Matching is case-insensitive and tolerant of extra
+    whitespace, and a name only matches on word boundaries, so "Intel" is
+    found in "Intel Corp" but not in "Intelligent Systems".
+    """
+
+    def __init__(self, companies: list[str], aliases: dict[str, str] = None):
+        self.canonical = {normalize_name(c): c for c in companies if c.strip()}
+        for alias, company in (aliases or {}).items():
+            if alias.strip():
+                self.canonical[normalize_name(alias)] = company
+
+        # (?<!\w)/(?!\w) rather than \b so names that start or end in punctuation ("AT&T") still work
+        pattern = _trie_pattern(list(self.canonical)) if self.canonical else r"(?!)"
+        self.regex = re.compile(r"(?<!\w)(?:" + pattern + r")(?!\w)", re.IGNORECASE)
+        self._name_regexes = None  # per-name patterns, built on first use
+
+    def _canonical_for(self, text: str) -> str | None:
+        """Canonical company for text the combined regex matched.
+
+        re.IGNORECASE folds some characters ("İ", "ſ") differently from
+        str.lower(), so a match that isn't a key is attributed by matching
+        it against each name's own pattern.
+        """
+        canonical = self.canonical.get(normalize_name(text))
+        if canonical is not None:
+            return canonical
+        if self._name_regexes is None:
+            self._name_regexes = [(re.compile(_trie_pattern([name]), re.IGNORECASE), company)
+                                  for name, company in self.canonical.items()]
+        return next((company for regex, company in self._name_regexes if regex.fullmatch(text)), None)
+
+    def match(self, company: str) -> str | None:
+        """Canonical Tier-1 company named in company, or None."""
+        if not company:
+            return None
+        for found in self.regex.finditer(company):
+            canonical = self._canonical_for(found.group())
+            if canonical is not None:
+                return canonical
+        return None
+
+
+_matcher = None
+
+
+def get_tier1_matcher() -> Tier1Matcher:
+    """The matcher for the configured Tier-1 list, compiled on first use."""
+    global _matcher
+    if _matcher is None:
+        _matcher = Tier1Matcher(config.TIER_1_COMPANIES, config.TIER_1_ALIASES)
+    return _matcher
+
+
+def reset_tier1_matcher():
+    """Recompile from config on next use, after TIER_1_COMPANIES or TIER_1_ALIASES change."""
+    global _matcher
+    _matcher = None
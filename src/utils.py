@@ -1,6 +1,9 @@
 import os
+import json
+import hashlib
 import logging
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser as date_parser
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'logs')
@@ -21,24 +24,67 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def _parse_iso_date(date_string: str) -> datetime | None:
+    """YYYY-MM-DD or YYYY-MM (as the 1st of the month) without dateutil; None for anything else."""
+    if len(date_string) not in (7, 10) or date_string[4] != "-":
+        return None
+    if len(date_string) == 10 and date_string[7] != "-":
+        return None
+    year, month, day = date_string[:4], date_string[5:7], date_string[8:] or "01"
+    digits = year + month + day
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_string(date_string: str) -> datetime | None:
+    parsed = _parse_iso_date(date_string.strip())
+    if parsed is not None:
+        return parsed
+    try:
+        return date_parser.parse(date_string)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
 def parse_date(date_string: str) -> datetime | None:
     if not date_string:
         return None
+    if isinstance(date_string, str):
+        return _parse_date_string(date_string)
     try:
         return date_parser.parse(date_string)
     except (ValueError, TypeError):
         return None
 
 
-def calculate_years_between(start_date: str, end_date: str = None) -> float:
+def calculate_years_between(start_date: str, end_date: str = None, now: datetime = None) -> float:
     start = parse_date(start_date)
     if not start:
         return 0.0
-    end = parse_date(end_date) if end_date else datetime.now()
+    end = parse_date(end_date) if end_date else (now or datetime.now())
     delta = end - start
     return round(delta.days / 365.25, 2)
 
 
+def canonical_json(data) -> str:
+    """Stable serialization: sorted keys, no insignificant whitespace."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_hash(data) -> str:
+    """Digest of the canonical serialization, equal for equal content however it was formatted."""
+    return hashlib.sha256(canonical_json(data).encode()).hexdigest()
+
+
+def format_airtable_time(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
 def normalize_location(location: str) -> str | None:
     if not location:
         return None
@@ -0,0 +1,91 @@
+"""
+Write Buffer - Coalesce single-record updates into batch PATCH requests.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+from src.config import BATCH_SIZE, WRITE_BUFFER_MAX_DELAY
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class WriteBuffer:
+    """Write-behind buffer of pending field updates per table.
+
+    Updates to the same record are merged. A table is flushed once it has a
+    full batch pending, when its oldest pending update is older than
+    max_delay (checked as updates arrive), or on an explicit flush().
+    """
+
+    def __init__(self, send_batch: Callable[[str, list[dict]], list[dict]],
+                 batch_size: int = BATCH_SIZE, max_delay: float = WRITE_BUFFER_MAX_DELAY):
+        self.send_batch = send_batch
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self._lock = threading.RLock()
+        self._pending = {}  # table -> OrderedDict(record_id -> fields)
+        self._first_queued = {}  # table -> monotonic time of oldest pending update
+
+        self.failed_ids = []
+        self.queued = 0
+        self.merged = 0
+        self.requests = 0
+
+    def add(self, table_name: str, record_id: str, fields: dict):
+        """Queue a field update, merging with any pending update to the same record."""
+        with self._lock:
+            pending = self._pending.setdefault(table_name, OrderedDict())
+            if not pending:
+                self._first_queued[table_name] = time.monotonic()
+            if record_id in pending:
+                pending[record_id].update(fields)
+                self.merged += 1
+            else:
+                pending[record_id] = dict(fields)
+            self.queued += 1
+
+            due = (len(pending) >= self.batch_size or
+                   time.monotonic() - self._first_queued[table_name] >= self.max_delay)
+        if due:
+            self.flush(table_name)
+
+    def has_pending(self, table_name: str) -> bool:
+        with self._lock:
+            return bool(self._pending.get(table_name))
+
+    def flush(self, table_name: str = None) -> list[dict]:
+        """Send pending updates for one table (or all) as batch PATCHes."""
+        with self._lock:
+            tables = [table_name] if table_name else list(self._pending)
+            work = []
+            for table in tables:
+                pending = self._pending.pop(table, None)
+                self._first_queued.pop(table, None)
+                if pending:
+                    work.append((table, [{"id": rid, "fields": f} for rid, f in pending.items()]))
+
+        results = []
+        for table, records in work:
+            for i in range(0, len(records), self.batch_size):
+                batch = records[i:i + self.batch_size]
+                with self._lock:
+                    self.requests += 1
+                try:
+                    results.extend(self.send_batch(table, batch))
+                except Exception as e:
+                    ids = [r["id"] for r in batch]
+                    logger.error(f"Failed to flush {len(batch)} buffered updates to {table}: {e}")
+                    with self._lock:
+                        self.failed_ids.extend(ids)
+        return results
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "merged": self.merged,
+                "requests": self.requests,
+                "failed": len(self.failed_ids)
+            }
@@ -0,0 +1,299 @@
+"""Tests for airtable_client module."""
+import threading
+import pytest
+import requests
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlsplit
+from src.airtable_client import AirtableClient, build_list_endpoint
+from src.fake_airtable import FakeAirtableBase
+from src.http_session import HttpxSession, create_session
+
+
+def make_response(payload: dict, status: int = 200) -> Mock:
+    response = Mock()
+    response.status_code = status
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+def make_client(*payloads) -> AirtableClient:
+    session = Mock()
+    session.request.side_effect = [make_response(p) for p in payloads]
+    client = AirtableClient(api_key="key", base_id="app123", session=session)
+    client._rate_limit = Mock()
+    return client
+
+
+class TestSessionLayer:
+    """Tests for the pooled session layer."""
+
+    def test_all_methods_share_one_session(self):
+        client = make_client({"records": [{"id": "rec1"}]}, {"id": "rec1"}, {"id": "rec2"})
+
+        client.get_records("Applications")
+        client.update_record("Applications", "rec1", {"Name": "A"})
+        client.create_record("Applications", {"Name": "B"})
+
+        assert client.session.request.call_count == 3
+
+    def test_uses_custom_base_url(self):
+        client = make_client({"id": "rec1"})
+        client.base_url = "http://127.0.0.1:9999/v0"
+
+        client.get_record("Applications", "rec1")
+
+        url = client.session.request.call_args.kwargs["url"]
+        assert url == "http://127.0.0.1:9999/v0/app123/Applications/rec1"
+
+    def test_context_manager_closes_owned_session(self):
+        with AirtableClient(api_key="key", base_id="app123") as client:
+            client.session = Mock()
+        client.session.close.assert_called_once()
+
+    def test_does_not_close_injected_session(self):
+        session = Mock()
+        with AirtableClient(api_key="key", base_id="app123", session=session):
+            pass
+        session.close.assert_not_called()
+
+    def test_create_session_requests_pool(self):
+        session = create_session("requests", pool_size=4)
+        adapter = session.get_adapter("https://api.airtable.com")
+        assert isinstance(session, requests.Session)
+        assert adapter._pool_maxsize == 4
+        session.close()
+
+    def test_create_session_httpx(self):
+        session = create_session("httpx", pool_size=4, http2=False)
+        assert isinstance(session, HttpxSession)
+        session.close()
+
+    def test_create_session_unknown_transport(self):
+        with pytest.raises(ValueError):
+            create_session("carrier-pigeon")
+
+
+class TestGetLinkedRecords:
+    """Tests for index-backed get_linked_records."""
+
+    CHILDREN = {"records": [
+        {"id": "exp1", "fields": {"Application ID": ["recA"]}},
+        {"id": "exp2", "fields": {"Application ID": ["recB"]}},
+        {"id": "exp3", "fields": {"Application ID": ["recA"]}}
+    ]}
+
+    def test_scans_child_table_once(self):
+        client = make_client(self.CHILDREN)
+
+        first = client.get_linked_records("recA", "Work Experience")
+        second = client.get_linked_records("recB", "Work Experience")
+
+        assert [r["id"] for r in first] == ["exp1", "exp3"]
+        assert [r["id"] for r in second] == ["exp2"]
+        assert client.session.request.call_count == 1
+
+    def test_writes_update_index(self):
+        client = make_client(
+            self.CHILDREN,
+            {"id": "exp4", "fields": {"Application ID": ["recA"]}},
+            {"id": "exp1", "fields": {"Application ID": ["recB"]}},
+            {"deleted": True, "id": "exp3"}
+        )
+        client.get_linked_records("recA", "Work Experience")
+
+        client.create_record("Work Experience", {"Application ID": ["recA"]})
+        client.update_record("Work Experience", "exp1", {"Application ID": ["recB"]})
+        client.delete_record("Work Experience", "exp3")
+
+        assert [r["id"] for r in client.get_linked_records("recA", "Work Experience")] == ["exp4"]
+        assert [r["id"] for r in client.get_linked_records("recB", "Work Experience")] == ["exp2", "exp1"]
+        assert client.session.request.call_count == 4
+
+    def test_invalidate_forces_rescan(self):
+        client = make_client(self.CHILDREN, self.CHILDREN)
+
+        client.get_linked_records("recA", "Work Experience")
+        client.invalidate_cache("Work Experience")
+        client.get_linked_records("recA", "Work Experience")
+
+        assert client.session.request.call_count == 2
+
+
+class TestReadCache:
+    """Tests for cached get_records reads."""
+
+    def test_repeated_reads_cost_one_request(self):
+        client = make_client({"records": [{"id": "rec1", "fields": {}}]})
+
+        client.get_records("Applications")
+        client.get_records("Applications")
+
+        assert client.session.request.call_count == 1
+        assert client.record_cache.stats()["hits"] == 1
+
+    def test_update_is_visible_to_cached_reads(self):
+        client = make_client(
+            {"records": [{"id": "rec1", "fields": {"Shortlist Status": "Rejected"}}]},
+            {"id": "rec1", "fields": {"Shortlist Status": "Shortlisted"}}
+        )
+
+        client.get_records("Applications")
+        client.update_record("Applications", "rec1", {"Shortlist Status": "Shortlisted"})
+        records = client.get_records("Applications")
+
+        assert records[0]["fields"]["Shortlist Status"] == "Shortlisted"
+        assert client.session.request.call_count == 2
+
+    def test_concurrent_misses_share_one_fetch_and_release_locks(self):
+        base = FakeAirtableBase(latency=0.05)
+        base.seed("Applications", [{"Application ID": f"APP{i}"} for i in range(3)])
+        client = base.client()
+
+        threads = [threading.Thread(target=client.get_records, args=("Applications",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for i in range(3):
+            client.get_records("Applications", f"{{Application ID}} = 'APP{i}'")
+
+        assert base.requests_by_method == {"GET": 4}
+        # One lock per distinct read would otherwise pile up in long-lived processes
+        assert client._read_locks == {}
+
+    def test_zero_ttl_disables_cache(self):
+        client = make_client({"records": []}, {"records": []})
+        client.record_cache.ttl = 0
+
+        client.get_records("Applications")
+        client.get_records("Applications")
+
+        assert client.session.request.call_count == 2
+
+
+class TestIterRecords:
+    """Tests for iter_records and list parameters."""
+
+    def test_builds_projection_sort_and_view_params(self):
+        endpoint = build_list_endpoint(
+            "Applications",
+            filter_formula="{Shortlist Status} = 'Shortlisted'",
+            fields=["Application ID", "Shortlist Status"],
+            page_size=50,
+            sort=[{"field": "Application ID", "direction": "desc"}],
+            view="Grid view"
+        )
+        query = parse_qs(urlsplit(endpoint).query)
+
+        assert endpoint.startswith("Applications?")
+        assert query["filterByFormula"] == ["{Shortlist Status} = 'Shortlisted'"]
+        assert query["fields[]"] == ["Application ID", "Shortlist Status"]
+        assert query["pageSize"] == ["50"]
+        assert query["sort[0][field]"] == ["Application ID"]
+        assert query["sort[0][direction]"] == ["desc"]
+        assert query["view"] == ["Grid view"]
+
+    def test_yields_page_by_page(self):
+        client = make_client(
+            {"records": [{"id": "rec1"}, {"id": "rec2"}], "offset": "itr1"},
+            {"records": [{"id": "rec3"}]}
+        )
+
+        records = client.iter_records("Applications", page_size=2)
+
+        assert next(records)["id"] == "rec1"
+        assert client.session.request.call_count == 1
+        assert [r["id"] for r in records] == ["rec2", "rec3"]
+        second_url = client.session.request.call_args.kwargs["url"]
+        assert "offset=itr1" in second_url
+
+    def test_projected_reads_cached_separately(self):
+        client = make_client({"records": []}, {"records": []})
+
+        client.get_records("Applications", fields=["Application ID"])
+        client.get_records("Applications")
+        client.get_records("Applications", fields=["Application ID"])
+
+        assert client.session.request.call_count == 2
+
+
+class TestBufferedWrites:
+    """Tests for write coalescing through update_record."""
+
+    def test_updates_sent_as_one_batch(self):
+        client = make_client({"records": [{"id": f"rec{i}", "fields": {}} for i in range(3)]})
+
+        with client.buffered_writes():
+            for i in range(3):
+                client.update_record("Applications", f"rec{i}", {"Shortlist Status": "Rejected"})
+            assert client.session.request.call_count == 0
+
+        call = client.session.request.call_args.kwargs
+        assert call["method"] == "PATCH"
+        assert len(call["json"]["records"]) == 3
+
+    def test_read_flushes_pending_updates_for_table(self):
+        client = make_client(
+            {"records": [{"id": "rec1", "fields": {"Shortlist Status": "Rejected"}}]},
+            {"records": [{"id": "rec1", "fields": {"Shortlist Status": "Rejected"}}]}
+        )
+
+        with client.buffered_writes():
+            client.update_record("Applications", "rec1", {"Shortlist Status": "Rejected"})
+            records = client.get_records("Applications")
+
+        assert client.session.request.call_args_list[0].kwargs["method"] == "PATCH"
+        assert records[0]["fields"]["Shortlist Status"] == "Rejected"
+
+
+class TestBatchUpsert:
+    """Tests for batch_upsert."""
+
+    def test_chunks_and_collects_created_and_updated(self):
+        client = make_client(
+            {"records": [{"id": f"rec{i}"} for i in range(10)],
+             "createdRecords": ["rec0"], "updatedRecords": [f"rec{i}" for i in range(1, 10)]},
+            {"records": [{"id": "rec10"}], "createdRecords": ["rec10"], "updatedRecords": []}
+        )
+        records = [{"Email": f"user{i}@test.com", "Full Name": f"User {i}"} for i in range(11)]
+
+        result = client.batch_upsert("Personal Details", records, merge_on=["Email"])
+
+        assert result["created"] == ["rec0", "rec10"]
+        assert len(result["updated"]) == 9
+        assert len(result["records"]) == 11
+        first = client.session.request.call_args_list[0].kwargs
+        assert first["method"] == "PATCH"
+        assert first["json"]["performUpsert"] == {"fieldsToMergeOn": ["Email"]}
+        assert len(first["json"]["records"]) == 10
+
+
+class TestBatchDelete:
+    """Tests for batch_delete."""
+
+    def test_deletes_ten_per_request(self):
+        client = make_client(
+            {"records": [{"id": f"rec{i}", "deleted": True} for i in range(10)]},
+            {"records": [{"id": f"rec{i}", "deleted": True} for i in range(10, 12)]}
+        )
+
+        deleted = client.batch_delete("Work Experience", [f"rec{i}" for i in range(12)])
+
+        assert len(deleted) == 12
+        first = client.session.request.call_args_list[0].kwargs
+        query = parse_qs(urlsplit(first["url"]).query)
+        assert first["method"] == "DELETE"
+        assert query["records[]"] == [f"rec{i}" for i in range(10)]
+
+    def test_removes_deleted_records_from_index(self):
+        client = make_client(
+            {"records": [{"id": "exp1", "fields": {"Application ID": ["recA"]}},
+                         {"id": "exp2", "fields": {"Application ID": ["recA"]}}]},
+            {"records": [{"id": "exp1", "deleted": True}]}
+        )
+        client.get_linked_records("recA", "Work Experience")
+
+        client.batch_delete("Work Experience", ["exp1"])
+
+        assert [r["id"] for r in client.get_linked_records("recA", "Work Experience")] == ["exp2"]
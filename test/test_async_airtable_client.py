@@ -0,0 +1,90 @@
+"""Tests for async_airtable_client module."""
+import asyncio
+import json
+import httpx
+import pytest
+from src.async_airtable_client import AsyncAirtableClient
+from src.rate_limiter import TokenBucket
+
+
+def make_client(handler, max_concurrency: int = 5) -> AsyncAirtableClient:
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncAirtableClient(
+        api_key="key",
+        base_id="app123",
+        max_concurrency=max_concurrency,
+        rate_limiter=TokenBucket(rate=1000, capacity=1000),
+        http_client=http_client
+    )
+
+
+class TestAsyncAirtableClient:
+    """Tests for AsyncAirtableClient."""
+
+    def test_get_records_follows_offsets(self):
+        pages = {
+            None: {"records": [{"id": "rec1"}], "offset": "page2"},
+            "page2": {"records": [{"id": "rec2"}]}
+        }
+
+        async def handler(request):
+            return httpx.Response(200, json=pages[request.url.params.get("offset")])
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_records("Applications")
+
+        records = asyncio.run(run())
+        assert [r["id"] for r in records] == ["rec1", "rec2"]
+
+    def test_batch_update_bounded_concurrency_and_order(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=json.loads(request.content))
+
+        records = [{"id": f"rec{i}", "fields": {"n": i}} for i in range(45)]
+
+        async def run():
+            async with make_client(handler, max_concurrency=3) as client:
+                return await client.batch_update("Applications", records)
+
+        results = asyncio.run(run())
+        assert [r["id"] for r in results] == [r["id"] for r in records]
+        assert peak == 3
+
+    def test_get_linked_records_filters_by_parent(self):
+        async def handler(request):
+            return httpx.Response(200, json={"records": [
+                {"id": "c1", "fields": {"Application ID": ["recA"]}},
+                {"id": "c2", "fields": {"Application ID": ["recB"]}}
+            ]})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_linked_records("recA", "Work Experience")
+
+        linked = asyncio.run(run())
+        assert [r["id"] for r in linked] == ["c1"]
+
+    def test_validation_error_is_not_retried(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(422, json={"error": "INVALID"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.get_record("Applications", "rec1")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert calls == 1
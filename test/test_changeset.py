@@ -0,0 +1,46 @@
+"""Tests for changeset module."""
+from unittest.mock import Mock
+from src.changeset import Changeset, changed_fields
+
+
+class TestChangedFields:
+    """Tests for changed_fields function."""
+
+    def test_treats_missing_and_empty_as_equal(self):
+        existing = {"Company": "Google", "Technologies": ["Python"]}
+        assert changed_fields(existing, {"Company": "Google", "End": "", "Technologies": ["Python"]}) == []
+        assert changed_fields(existing, {"Company": "Meta", "Technologies": []}) == ["Company", "Technologies"]
+
+
+class TestChangeset:
+    """Tests for Changeset."""
+
+    def test_batches_across_owners(self):
+        changeset = Changeset()
+        for i in range(12):
+            changeset.create("Work Experience", {"Company": f"C{i}"}, owner=f"rec{i}")
+        changeset.delete("Work Experience", "recOLD", owner="rec0")
+        client = Mock()
+
+        assert changeset.apply(client) == set()
+        assert [len(call.args[1]) for call in client.batch_create.call_args_list] == [10, 2]
+        client.batch_delete.assert_called_once_with("Work Experience", ["recOLD"])
+        assert changeset.counts() == {"Work Experience": {"update": 0, "create": 12, "delete": 1}}
+
+    def test_failed_batch_only_fails_its_owners(self):
+        changeset = Changeset()
+        changeset.update("Personal Details", "recP1", {"Full Name": "A"}, owner="rec1")
+        changeset.create("Salary Preferences", {"Preferred Rate": 90}, owner="rec2")
+        client = Mock()
+        client.batch_update.side_effect = RuntimeError("boom")
+
+        assert changeset.apply(client) == {"rec1"}
+        client.batch_create.assert_called_once()
+
+    def test_describe(self):
+        changeset = Changeset()
+        assert changeset.describe() == "No changes"
+        changeset.update("Personal Details", "recP1", {"Full Name": "A"}, owner="rec1")
+        assert changeset.describe() == ("Personal Details: 0 create, 1 update, 0 delete\n"
+                                        "  update recP1 for rec1: Full Name")
+        assert changeset.describe(per_change=False) == "Personal Details: 0 create, 1 update, 0 delete"
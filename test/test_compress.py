@@ -1,12 +1,40 @@
 """Tests for compress module."""
 import pytest
 import json
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 from src.compress import (
     fetch_applicant_data,
     build_json_object,
-    compress_single_applicant
+    compress_single_applicant,
+    compress_all_applicants,
+    compress_applicants_concurrently,
+    is_unchanged
 )
+from src.fake_airtable import FakeAirtableBase
+
+
+# Child tables' Application ID links, mirrored on Applications as Airtable does
+INVERSE_LINKS = {
+    ("Personal Details", "Application ID"): ("Applications", "Personal Details"),
+    ("Work Experience", "Application ID"): ("Applications", "Work Experience"),
+    ("Salary Preferences", "Application ID"): ("Applications", "Salary Preferences")
+}
+
+
+def seed_applicants(count: int) -> FakeAirtableBase:
+    base = FakeAirtableBase(inverse_links=INVERSE_LINKS)
+    applicants = base.seed("Applications", [{"Application ID": f"APP{i:03d}"} for i in range(count)])
+    for i, applicant in enumerate(applicants):
+        link = [applicant["id"]]
+        base.seed("Personal Details", [{"Full Name": f"Person {i}", "Location": "USA", "Application ID": link}])
+        base.seed("Work Experience", [
+            {"Company": "Google", "Title": "SWE", "Start": "2018-01-01", "Application ID": link},
+            {"Company": "Startup", "Title": "CTO", "Start": "2021-01-01", "Application ID": link}
+        ])
+        base.seed("Salary Preferences", [{"Preferred Rate": 90, "Availability": 30, "Application ID": link}])
+    return base
 
 
 class TestBuildJsonObject:
@@ -82,3 +110,168 @@ class TestCompressSingleApplicant:
         
         assert result is True
         mock_client.update_record.assert_called_once()
+
+
+class TestCompressAllApplicants:
+    """Tests for compress_all_applicants against the fake backend."""
+
+    def test_bulk_matches_per_applicant_output(self):
+        outputs = {}
+        for bulk in (False, True):
+            base = seed_applicants(12)
+            with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+                assert compress_all_applicants(bulk=bulk) == (12, 0)
+            # Record IDs differ between the two seeded bases
+            outputs[bulk] = [
+                json.loads(r["fields"]["Compressed JSON"].replace(r["id"], "recAPP"))
+                for r in base.records("Applications")
+            ]
+            for output in outputs[bulk]:
+                for experience in output["experience"]:
+                    experience.pop("record_id")
+
+        assert outputs[True] == outputs[False]
+        assert outputs[True][0]["personal"]["name"] == "Person 0"
+        assert [e["company"] for e in outputs[True][0]["experience"]] == ["Google", "Startup"]
+
+    def test_bulk_request_count(self):
+        base = seed_applicants(25)
+        with patch('src.compress.AirtableClient', return_value=base.client()):
+            compress_all_applicants()
+
+        # One page per table (4 reads), then 25 updates in batches of 10
+        assert base.requests_by_method == {"GET": 4, "PATCH": 3}
+
+    def test_incremental_recompresses_only_changed_applicants(self, tmp_path):
+        base = seed_applicants(5)
+        watermark = str(tmp_path / "watermark.json")
+        time.sleep(0.01)
+
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert compress_all_applicants(incremental=True, watermark_path=watermark, overlap=0) == (5, 0)
+        time.sleep(0.01)
+
+        # Change one applicant's salary and add a brand-new applicant
+        salary = base.records("Salary Preferences")[2]
+        base.handle("PATCH", f"/v0/appFAKE/Salary Preferences/{salary['id']}", {},
+                    {"fields": {"Preferred Rate": 120}})
+        base.seed("Applications", [{"Application ID": "APP999"}])
+
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert compress_all_applicants(incremental=True, watermark_path=watermark, overlap=0) == (2, 0)
+
+        applicant = next(r for r in base.records("Applications") if r["id"] == salary["fields"]["Application ID"][0])
+        assert json.loads(applicant["fields"]["Compressed JSON"])["salary"]["preferred_rate"] == 120
+
+    def test_incremental_request_count(self, tmp_path):
+        base = seed_applicants(250)
+        watermark = str(tmp_path / "watermark.json")
+        time.sleep(0.01)
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            compress_all_applicants(incremental=True, watermark_path=watermark, overlap=0)
+        time.sleep(0.01)
+
+        experience = base.records("Work Experience")[100]
+        base.handle("PATCH", f"/v0/appFAKE/Work Experience/{experience['id']}", {}, {"fields": {"Title": "VP"}})
+        before = dict(base.requests_by_method)
+
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert compress_all_applicants(incremental=True, watermark_path=watermark, overlap=0) == (1, 0)
+
+        # 4 change scans, 1 parent fetch and 1 fetch per child table: no full child-table pages
+        requests = {method: count - before.get(method, 0) for method, count in base.requests_by_method.items()}
+        assert requests == {"GET": 8, "PATCH": 1}
+        applicant = next(r for r in base.records("Applications")
+                         if r["id"] == experience["fields"]["Application ID"][0])
+        data = json.loads(applicant["fields"]["Compressed JSON"])
+        assert {e["title"] for e in data["experience"]} == {"VP", "CTO"}
+        assert data["personal"]["name"] and data["salary"]["preferred_rate"] == 90
+
+    def test_incremental_tolerates_local_clock_ahead(self, tmp_path):
+        base = seed_applicants(5)
+        watermark = str(tmp_path / "watermark.json")
+        time.sleep(0.01)
+
+        # The local clock runs 30s ahead of Airtable's during the first run
+        ahead = datetime.now(timezone.utc) + timedelta(seconds=30)
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)), \
+                patch('src.compress.datetime') as clock:
+            clock.now.return_value = ahead
+            compress_all_applicants(incremental=True, watermark_path=watermark)
+        patches = base.requests_by_method["PATCH"]
+
+        salary = base.records("Salary Preferences")[2]
+        base.handle("PATCH", f"/v0/appFAKE/Salary Preferences/{salary['id']}", {},
+                    {"fields": {"Preferred Rate": 120}})
+
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert compress_all_applicants(incremental=True, watermark_path=watermark) == (5, 0)
+
+        applicant = next(r for r in base.records("Applications") if r["id"] == salary["fields"]["Application ID"][0])
+        assert json.loads(applicant["fields"]["Compressed JSON"])["salary"]["preferred_rate"] == 120
+        # The overlap re-checks everyone, but only the edited applicant is written
+        assert base.requests_by_method["PATCH"] == patches + 2
+
+    def test_second_run_skips_unchanged_writes(self):
+        base = seed_applicants(15)
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            compress_all_applicants()
+        patches = base.requests_by_method["PATCH"]
+
+        with patch('src.compress.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert compress_all_applicants() == (15, 0)
+            assert compress_all_applicants(bulk=False) == (15, 0)
+
+        assert base.requests_by_method["PATCH"] == patches
+
+
+class TestWorkers:
+    """Tests for concurrent compression."""
+
+    def test_workers_match_sequential_counts(self):
+        for bulk in (False, True):
+            base = seed_applicants(20)
+            base.seed("Applications", [{}])
+            with patch('src.compress.AirtableClient', return_value=base.client()):
+                assert compress_all_applicants(bulk=bulk, workers=4) == (20, 1)
+            assert all(r["fields"].get("Compressed JSON") for r in base.records("Applications")[:20])
+
+    def test_concurrent_misses_share_one_table_scan(self):
+        base = seed_applicants(20)
+        base.latency = 0.01
+        with patch('src.compress.AirtableClient', return_value=base.client()):
+            compress_all_applicants(bulk=False, workers=8)
+
+        # One read per table however many workers miss the cache at once
+        assert base.requests_by_method["GET"] == 4
+
+    @patch('src.compress.compress_applicant')
+    def test_results_keep_input_order_and_isolate_errors(self, mock_compress):
+        def compress(client, applicant, reencode):
+            time.sleep(0.001 * (10 - int(applicant["id"][3:])))
+            if applicant["id"] == "rec3":
+                raise RuntimeError("boom")
+            return "skipped" if applicant["id"] == "rec5" else "written"
+        mock_compress.side_effect = compress
+
+        applicants = [{"id": f"rec{i}", "fields": {}} for i in range(10)]
+        outcomes = compress_applicants_concurrently(Mock(), applicants, workers=4)
+
+        assert outcomes["written"] == [f"rec{i}" for i in range(10) if i not in (3, 5)]
+        assert outcomes["skipped"] == ["rec5"]
+        assert outcomes["failed"] == ["rec3"]
+
+
+class TestIsUnchanged:
+    """Tests for is_unchanged function."""
+
+    def test_ignores_formatting_and_key_order(self):
+        data = {"applicant_id": "APP001", "personal": {"name": "Jane", "email": "j@x.com"}}
+        stored = json.dumps({"personal": {"email": "j@x.com", "name": "Jane"}, "applicant_id": "APP001"})
+        assert is_unchanged({"fields": {"Compressed JSON": stored}}, data)
+
+    def test_detects_changes_and_bad_json(self):
+        data = {"applicant_id": "APP001"}
+        assert not is_unchanged({"fields": {"Compressed JSON": '{"applicant_id": "APP002"}'}}, data)
+        assert not is_unchanged({"fields": {"Compressed JSON": "{not json"}}, data)
+        assert not is_unchanged({"fields": {}}, data)
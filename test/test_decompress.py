@@ -6,8 +6,36 @@ from src.decompress import (
     parse_compressed_json,
     upsert_personal_details,
     upsert_salary_preferences,
-    decompress_applicant
+    decompress_applicant,
+    decompress_all,
+    decompress_applicants,
+    ChildRecords
 )
+from src.fake_airtable import FakeAirtableBase
+
+
+def seed_compressed(count: int) -> FakeAirtableBase:
+    """Applicants with Compressed JSON, half of them with stale child records."""
+    base = FakeAirtableBase()
+    for i in range(count):
+        data = {
+            "applicant_id": f"APP{i:03d}",
+            "personal": {"name": f"Person {i}", "location": "USA"},
+            "experience": [
+                {"company": "Google", "title": "SWE", "start": "2018-01-01"},
+                {"company": "Startup", "title": "CTO", "start": "2021-01-01"}
+            ],
+            "salary": {"preferred_rate": 90, "currency": "USD", "availability": 30}
+        }
+        applicant = base.seed("Applications", [{"Compressed JSON": json.dumps(data)}])[0]
+        if i % 2:
+            link = [applicant["id"]]
+            base.seed("Personal Details", [{"Full Name": "Old Name", "Application ID": link}])
+            base.seed("Work Experience", [
+                {"Company": "Google", "Title": "SWE", "Start": "2018-01-01", "Application ID": link},
+                {"Company": "Gone", "Title": "Intern", "Start": "2015-01-01", "Application ID": link}
+            ])
+    return base
 
 
 class TestParseCompressedJson:
@@ -111,3 +139,74 @@ class TestDecompressApplicant:
         mock_personal.assert_called_once()
         mock_exp.assert_called_once()
         mock_salary.assert_called_once()
+
+
+class TestDecompressAll:
+    """Tests for decompress_all against the fake backend."""
+
+    def test_applies_planned_changes_in_batches(self):
+        base = seed_compressed(10)
+        with patch('src.decompress.AirtableClient', return_value=base.client()):
+            assert decompress_all() == (10, 0)
+
+        assert len(base.records("Personal Details")) == 10
+        assert {r["fields"]["Full Name"] for r in base.records("Personal Details")} == {f"Person {i}" for i in range(10)}
+        assert sorted(r["fields"]["Company"] for r in base.records("Work Experience")) == ["Google"] * 10 + ["Startup"] * 10
+        assert len(base.records("Salary Preferences")) == 10
+        # Reads: one page per table. Writes: 5 personal creates + 5 updates, 15 experience creates,
+        # 5 orphan deletes and 10 salary creates, in batches of 10
+        assert base.requests_by_method == {"GET": 4, "POST": 4, "PATCH": 1, "DELETE": 1}
+
+    def test_dry_run_writes_nothing(self):
+        base = seed_compressed(4)
+        with patch('src.decompress.AirtableClient', return_value=base.client()):
+            assert decompress_all(dry_run=True) == (4, 0)
+        assert set(base.requests_by_method) == {"GET"}
+
+    def test_plan_lists_changes_only_for_dry_runs(self, caplog):
+        for dry_run in (True, False):
+            base = seed_compressed(4)
+            caplog.clear()
+            with caplog.at_level("INFO", logger="src.decompress"), \
+                    patch('src.decompress.AirtableClient', return_value=base.client()):
+                decompress_all(dry_run=dry_run)
+            plan = next(r.getMessage() for r in caplog.records if r.getMessage().startswith("Decompression plan"))
+            assert "Salary Preferences: 4 create" in plan
+            assert ("  create for" in plan) == dry_run
+
+    def test_second_run_skips_unchanged_records(self):
+        base = seed_compressed(6)
+        with patch('src.decompress.AirtableClient', return_value=base.client()):
+            decompress_all()
+        with patch('src.decompress.AirtableClient', return_value=base.client()):
+            assert decompress_all() == (6, 0)
+        assert base.requests_by_method["PATCH"] == 1
+
+    def test_bulk_scans_each_table_once_without_cache(self):
+        for bulk, reads in ((True, 4), (False, 1 + 3 * 8)):
+            base = seed_compressed(8)
+            with patch('src.decompress.AirtableClient', return_value=base.client(cache_ttl=0)):
+                assert decompress_all(bulk=bulk) == (8, 0)
+            assert base.requests_by_method["GET"] == reads
+
+
+class TestChildRecords:
+    """Tests for ChildRecords prefetched state."""
+
+    def test_state_follows_applied_writes(self):
+        base = seed_compressed(6)
+        client = base.client(cache_ttl=0)
+        applicants = client.get_records("Applications")
+        children = ChildRecords(client)
+
+        assert decompress_applicants(client, applicants, children) == (6, 0)
+        reads = base.requests_by_method["GET"]
+
+        # The grouped state matches the base after the writes landed, so a rerun plans nothing
+        for table in ("Personal Details", "Work Experience", "Salary Preferences"):
+            stored = {r["id"]: r["fields"] for r in base.records(table)}
+            assert {rid: r["fields"] for rid, r in children.records[table].items()} == stored
+        assert decompress_applicants(client, applicants, children) == (6, 0)
+        assert base.requests_by_method["GET"] == reads
+        assert set(base.requests_by_method) == {"GET", "POST", "PATCH", "DELETE"}
+        assert base.requests_by_method["PATCH"] == 1
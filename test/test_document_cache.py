@@ -0,0 +1,51 @@
+"""Tests for document_cache module."""
+import json
+import pytest
+from src.document_cache import DocumentCache
+from src.json_codec import encode_packed
+from src.utils import canonical_json
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache."""
+
+    def test_parses_each_value_once(self):
+        cache = DocumentCache()
+        value = '{"applicant_id": "APP001", "personal": {"name": "Jane"}}'
+
+        first = cache.load(value, "rec1")
+        second = cache.load(value, "rec1")
+
+        assert second is first
+        assert first.data["personal"]["name"] == "Jane"
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_changed_value_is_reparsed(self):
+        cache = DocumentCache()
+        assert cache.load('{"applicant_id": "APP001"}', "rec1").data["applicant_id"] == "APP001"
+        assert cache.load('{"applicant_id": "APP002"}', "rec1").data["applicant_id"] == "APP002"
+        assert cache.misses == 2
+
+    def test_canonical_form_is_encoding_independent(self):
+        cache = DocumentCache()
+        data = {"personal": {"name": "Jane"}, "applicant_id": "APP001"}
+        plain = cache.load(json.dumps(data, indent=2), "rec1")
+        packed = cache.load(encode_packed(data), "rec1")
+        assert plain.canonical == packed.canonical == canonical_json(data)
+
+    def test_evicts_least_recently_used(self):
+        cache = DocumentCache(max_entries=2)
+        cache.load('{"a": 1}', "rec1")
+        cache.load('{"a": 2}', "rec2")
+        cache.load('{"a": 1}', "rec1")
+        cache.load('{"a": 3}', "rec3")
+
+        assert len(cache) == 2
+        cache.load('{"a": 1}', "rec1")
+        assert cache.hits == 2
+
+    def test_invalid_json_raises_and_is_not_cached(self):
+        cache = DocumentCache()
+        with pytest.raises(json.JSONDecodeError):
+            cache.load("{not json", "rec1")
+        assert len(cache) == 0
@@ -0,0 +1,53 @@
+"""Tests for experience_match module."""
+from src.experience_match import ExperienceMatcher, experience_key
+
+
+def record(record_id: str, company: str, title: str, start: str) -> dict:
+    return {"id": record_id, "fields": {"Company": company, "Title": title, "Start": start}}
+
+
+def entry(company: str, title: str, start: str, record_id: str = None) -> tuple:
+    return record_id, {"Company": company, "Title": title, "Start": start}
+
+
+class TestExperienceKey:
+    """Tests for experience_key function."""
+
+    def test_normalizes_case_whitespace_and_timestamps(self):
+        assert experience_key({"Company": " Google  LLC", "Title": "SWE", "Start": "2018-01-01T00:00:00.000Z"}) == \
+            experience_key({"Company": "google llc", "Title": "swe", "Start": "2018-01-01"})
+
+
+class TestExperienceMatcher:
+    """Tests for ExperienceMatcher."""
+
+    def test_matches_record_id_then_key_then_fuzzy(self):
+        matcher = ExperienceMatcher([
+            record("recA", "Google", "SWE", "2018-01-01"),
+            record("recB", "Stripe", "Engineer", "2020-01-01"),
+            record("recC", "Acme", "CTO", "2021-01-01"),
+            record("recD", "Old Co", "Intern", "2010-01-01")
+        ])
+
+        matches = matcher.match([
+            entry("stripe", "engineer", "2020-01-01"),
+            entry("Acme", "Chief Technology Officer", "2021-01-01"),  # title edited
+            entry("Renamed", "Anything", "2019-01-01", record_id="recA"),
+            entry("New Co", "SWE", "2023-01-01")
+        ])
+
+        assert matches == ["recB", "recC", "recA", None]
+        assert matcher.unmatched() == ["recD"]
+
+    def test_each_record_is_claimed_once(self):
+        matcher = ExperienceMatcher([record("recA", "Google", "SWE", "2018-01-01")])
+        matches = matcher.match([
+            entry("Google", "SWE", "2018-01-01"),
+            entry("Google", "SWE", "2018-01-01"),
+            entry("Google", "SWE", "2018-01-01", record_id="recA")
+        ])
+        assert matches == [None, None, "recA"]
+
+    def test_blank_components_do_not_fuzzy_match(self):
+        matcher = ExperienceMatcher([record("recA", "", "", "2018-01-01")])
+        assert matcher.match([entry("", "", "2019-01-01")]) == [None]
@@ -0,0 +1,115 @@
+"""Tests for fake_airtable module."""
+import pytest
+import requests
+from src.airtable_client import AirtableClient
+from src.fake_airtable import FakeAirtableBase, FakeAirtableServer, FakeSession, Formula
+from src.rate_limiter import TokenBucket
+from src.retry import RetryPolicy
+
+
+class TestFakeAirtableClient:
+    """Tests for AirtableClient running against the in-process fake."""
+
+    def test_get_records_pages_through_offsets(self):
+        base = FakeAirtableBase()
+        base.seed("Applications", [{"Application ID": f"APP{i:03d}"} for i in range(250)])
+
+        with base.client(cache_ttl=0) as client:
+            records = client.get_records("Applications")
+
+        assert len(records) == 250
+        assert base.requests_by_method["GET"] == 3
+
+    def test_linked_records_and_projection(self):
+        base = FakeAirtableBase()
+        parent = base.seed("Applications", [{"Application ID": "APP001"}])[0]
+        base.seed("Work Experience", [
+            {"Company": "Google", "Application ID": [parent["id"]]},
+            {"Company": "Other", "Application ID": ["recOther"]}
+        ])
+
+        with base.client() as client:
+            linked = client.get_linked_records(parent["id"], "Work Experience")
+            projected = client.get_records("Work Experience", fields=["Company"])
+
+        assert [r["fields"]["Company"] for r in linked] == ["Google"]
+        assert all(set(r["fields"]) == {"Company"} for r in projected)
+
+    def test_batch_writes_respect_ten_record_limit(self):
+        base = FakeAirtableBase()
+        with base.client() as client:
+            created = client.batch_create("Applications", [{"n": i} for i in range(25)])
+            client.batch_delete("Applications", [r["id"] for r in created[:12]])
+
+        assert base.requests_by_method == {"POST": 3, "DELETE": 2}
+        assert len(base.records("Applications")) == 13
+
+        session = FakeSession(base)
+        response = session.request("POST", "https://x/v0/appFAKE/Applications",
+                                   json={"records": [{"fields": {}}] * 11})
+        assert response.status_code == 422
+
+    def test_batch_upsert_merges_on_fields(self):
+        base = FakeAirtableBase()
+        base.seed("Personal Details", [{"Email": "a@x.com", "Full Name": "Old"}])
+
+        with base.client() as client:
+            result = client.batch_upsert("Personal Details", [
+                {"Email": "a@x.com", "Full Name": "New"},
+                {"Email": "b@x.com", "Full Name": "B"}
+            ], merge_on=["Email"])
+
+        assert len(result["created"]) == 1 and len(result["updated"]) == 1
+        names = sorted(r["fields"]["Full Name"] for r in base.records("Personal Details"))
+        assert names == ["B", "New"]
+
+    def test_rate_limit_returns_429_with_retry_after(self):
+        base = FakeAirtableBase(rate_limit=2, retry_after=0.01)
+        record = base.seed("Applications", [{"Application ID": "APP001"}])[0]
+        client = AirtableClient(api_key="k", base_id="appFAKE", session=FakeSession(base),
+                                rate_limiter=TokenBucket(rate=1000), retry_policy=RetryPolicy(1))
+
+        client.get_record("Applications", record["id"])
+        client.get_record("Applications", record["id"])
+        with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+            client.get_record("Applications", record["id"])
+
+        assert excinfo.value.response.status_code == 429
+        assert excinfo.value.response.headers["Retry-After"] == "0.01"
+        assert base.throttled_count == 1
+
+
+class TestFormula:
+    """Tests for the filterByFormula subset."""
+
+    def test_field_comparisons_and_logic(self):
+        record = {"id": "rec1", "createdTime": "", "fields": {"Status": "Done", "Score": 5}}
+        meta = {}
+        assert Formula("AND({Status} = 'Done', {Score} > 3)").evaluate(record, meta)
+        assert Formula("OR({Missing} = '', {Score} < 1)").evaluate(record, meta)
+        assert not Formula("NOT({Status} = 'Done')").evaluate(record, meta)
+
+    def test_last_modified_time_filter(self):
+        base = FakeAirtableBase()
+        base.seed("Applications", [{"Application ID": "APP001"}])
+
+        with base.client(cache_ttl=0) as client:
+            recent = client.get_records("Applications", "IS_AFTER(LAST_MODIFIED_TIME(), '2000-01-01')")
+            future = client.get_records("Applications", "IS_AFTER(LAST_MODIFIED_TIME(), '2999-01-01')")
+
+        assert len(recent) == 1 and future == []
+
+
+class TestFakeAirtableServer:
+    """Tests for serving the fake over HTTP."""
+
+    def test_client_round_trip_over_http(self):
+        base = FakeAirtableBase(base_id="appHTTP")
+        with FakeAirtableServer(base) as server:
+            with AirtableClient(api_key="k", base_id="appHTTP", base_url=server.base_url,
+                                rate_limiter=TokenBucket(rate=1000)) as client:
+                created = client.create_record("Applications", {"Application ID": "APP001"})
+                client.update_record("Applications", created["id"], {"Shortlist Status": "Pending"})
+                fetched = client.get_record("Applications", created["id"])
+
+        assert fetched["fields"] == {"Application ID": "APP001", "Shortlist Status": "Pending"}
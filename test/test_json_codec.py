@@ -0,0 +1,55 @@
+"""Tests for json_codec module."""
+import json
+import pytest
+from src.json_codec import PACKED_PREFIX, decode_applicant, encode_applicant, encode_packed, encode_plain
+
+
+def make_applicant(experience_count: int) -> dict:
+    return {
+        "applicant_id": "APP001",
+        "personal": {"name": "Jane Doe", "email": "jane@test.com", "location": "USA"},
+        "experience": [
+            {"company": f"Company {i}", "title": "Senior Engineer", "start": "2015-01-01",
+             "end": "2016-01-01", "technologies": ["Python", "Go"]}
+            for i in range(experience_count)
+        ],
+        "salary": {"preferred_rate": 90, "currency": "USD"}
+    }
+
+
+class TestEncodeApplicant:
+    """Tests for encode_applicant function."""
+
+    def test_plain_is_compact_json(self):
+        data = make_applicant(1)
+        encoded = encode_applicant(data, mode="never")
+        assert encoded == json.dumps(data, separators=(",", ":"))
+        assert "\n" not in encoded
+
+    def test_auto_packs_long_histories_only(self):
+        assert encode_applicant(make_applicant(20), mode="auto").startswith(PACKED_PREFIX)
+        assert not encode_applicant(make_applicant(2), mode="auto").startswith(PACKED_PREFIX)
+
+    def test_packed_is_smaller_for_long_histories(self):
+        data = make_applicant(20)
+        assert len(encode_packed(data)) < len(encode_plain(data)) / 2
+
+    def test_never_packs_when_it_would_grow(self):
+        assert encode_applicant({"a": 1}, mode="always") == '{"a":1}'
+
+
+class TestDecodeApplicant:
+    """Tests for decode_applicant function."""
+
+    @pytest.mark.parametrize("encode", [
+        lambda d: json.dumps(d, indent=2),
+        encode_plain,
+        encode_packed
+    ])
+    def test_reads_every_version(self, encode):
+        data = make_applicant(3)
+        assert decode_applicant(encode(data)) == data
+
+    def test_invalid_packed_value_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            decode_applicant(PACKED_PREFIX + "not base64!")
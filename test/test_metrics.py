@@ -0,0 +1,73 @@
+"""Tests for metrics module."""
+from unittest.mock import Mock
+from src.airtable_client import AirtableClient
+from src.fake_airtable import FakeAirtableBase, FakeResponse
+from src.metrics import RequestStats
+from src.retry import RetryPolicy
+
+
+class TestRequestStats:
+    """Tests for RequestStats."""
+
+    def test_histogram_and_percentiles(self):
+        stats = RequestStats()
+        for ms in (3, 4, 20, 30, 700):
+            stats.record_request("Applications", "GET", ms / 1000, bytes_sent=10, bytes_received=100)
+
+        endpoint = stats.snapshot()["endpoints"]["GET Applications"]
+        assert endpoint["requests"] == 5
+        assert endpoint["bytes_received"] == 500
+        assert endpoint["p50_ms"] == 25.0
+        assert endpoint["p95_ms"] == 1000.0
+        assert endpoint["histogram"]["<=5ms"] == 2
+
+    def test_list_calls_and_rate_limit_waits(self):
+        stats = RequestStats()
+        stats.record_list_call("Applications", pages=3, records=250)
+        stats.record_list_call("Applications", pages=1, records=10)
+        stats.record_rate_limit_wait(0.0)
+        stats.record_rate_limit_wait(0.25)
+
+        snapshot = stats.snapshot()
+        assert snapshot["list_calls"]["Applications"]["pages_per_call"] == 2.0
+        assert snapshot["list_calls"]["Applications"]["max_pages"] == 3
+        assert snapshot["total"]["rate_limit_waits"] == 1
+        assert snapshot["total"]["rate_limit_seconds"] == 0.25
+
+
+class TestClientInstrumentation:
+    """Tests for metrics collected by AirtableClient."""
+
+    def test_client_records_requests_and_pages(self):
+        base = FakeAirtableBase()
+        base.seed("Applications", [{"Application ID": f"APP{i:03d}"} for i in range(150)])
+
+        with base.client() as client:
+            client.get_records("Applications")
+            client.create_record("Applications", {"Application ID": "NEW"})
+            stats = client.stats()
+
+        list_stats = stats["endpoints"]["GET Applications"]
+        assert list_stats["requests"] == 2 and list_stats["bytes_received"] > 0
+        assert stats["list_calls"]["Applications"]["pages"] == 2
+        post = stats["endpoints"]["POST Applications"]
+        assert post["bytes_sent"] > 0
+        assert stats["total"]["requests"] == 3
+        assert stats["cache"]["misses"] == 1
+
+    def test_client_counts_retries_and_errors(self):
+        session = Mock()
+        session.request.side_effect = [
+            FakeResponse(503, {"error": "UNAVAILABLE"}, {}, "url"),
+            FakeResponse(200, {"id": "rec1"}, {}, "url")
+        ]
+        client = AirtableClient(api_key="key", base_id="app123", session=session,
+                                retry_policy=RetryPolicy(2, base_delay=0))
+        client._rate_limit = Mock()
+
+        client.get_record("Applications", "rec1")
+
+        endpoint = client.stats()["endpoints"]["GET Applications"]
+        assert endpoint["requests"] == 2
+        assert endpoint["errors"] == 1
+        assert endpoint["retries"] == 1
@@ -0,0 +1,75 @@
+"""Tests for mirror module."""
+import time
+from src.fake_airtable import FakeAirtableBase
+from src.mirror import AirtableMirror
+
+
+def seeded_base() -> tuple[FakeAirtableBase, dict]:
+    base = FakeAirtableBase()
+    parent = base.seed("Applications", [{"Application ID": "APP001"}])[0]
+    base.seed("Work Experience", [
+        {"Company": "Google", "Application ID": [parent["id"]]},
+        {"Company": "Other", "Application ID": ["recOther"]}
+    ])
+    return base, parent
+
+
+class TestAirtableMirror:
+    """Tests for AirtableMirror."""
+
+    def test_full_then_incremental_sync(self):
+        base, parent = seeded_base()
+        client = base.client()
+        mirror = AirtableMirror(client, ":memory:", tables={"Work Experience": "Application ID"}, overlap=0)
+        time.sleep(0.005)
+
+        assert mirror.sync() == {"Work Experience": 2}
+        time.sleep(0.005)
+        assert mirror.sync() == {"Work Experience": 0}
+
+        time.sleep(0.005)
+        base.seed("Work Experience", [{"Company": "Apple", "Application ID": [parent["id"]]}])
+        assert mirror.sync() == {"Work Experience": 1}
+        companies = [r["fields"]["Company"] for r in mirror.get_linked_records(parent["id"], "Work Experience")]
+        assert companies == ["Google", "Apple"]
+
+    def test_reconcile_drops_deleted_records(self):
+        base, parent = seeded_base()
+        client = base.client()
+        mirror = AirtableMirror(client, ":memory:", tables={"Work Experience": "Application ID"})
+        mirror.sync()
+
+        other = next(r for r in base.records("Work Experience") if r["fields"]["Company"] == "Other")
+        base.handle("DELETE", f"/v0/appFAKE/Work Experience/{other['id']}", {}, None)
+        mirror.sync(reconcile=True)
+
+        assert [r["fields"]["Company"] for r in mirror.get_records("Work Experience")] == ["Google"]
+
+    def test_resets_when_base_changes(self, tmp_path):
+        base, _ = seeded_base()
+        path = str(tmp_path / "mirror.db")
+        AirtableMirror(base.client(), path, tables={"Work Experience": "Application ID"}).sync()
+
+        other = FakeAirtableBase(base_id="appOTHER")
+        mirror = AirtableMirror(other.client(), path)
+        assert mirror.get_records("Work Experience") == []
+
+
+class TestClientMirror:
+    """Tests for AirtableClient reads served from the mirror."""
+
+    def test_reads_come_from_mirror_and_writes_keep_it_current(self):
+        base, parent = seeded_base()
+        with base.client() as client:
+            client.use_mirror(":memory:")
+            requests_after_sync = base.request_count
+
+            linked = client.get_linked_records(parent["id"], "Work Experience")
+            client.update_record("Work Experience", linked[0]["id"], {"Title": "Engineer"})
+            client.create_record("Work Experience", {"Company": "Apple", "Application ID": [parent["id"]]})
+            client.get_records("Applications", fields=["Application ID"])
+            linked = client.get_linked_records(parent["id"], "Work Experience")
+
+        assert base.request_count == requests_after_sync + 2
+        assert [r["fields"].get("Title") for r in linked] == ["Engineer", None]
+        assert [r["fields"]["Company"] for r in linked] == ["Google", "Apple"]
@@ -0,0 +1,74 @@
+"""Tests for rate_limiter module."""
+import os
+import threading
+import pytest
+from unittest.mock import patch
+from src.rate_limiter import TokenBucket, get_shared_limiter
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_allows_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=5, capacity=5)
+        waits = [bucket.reserve() for _ in range(5)]
+        assert waits == [0.0] * 5
+
+    def test_waits_once_bucket_is_empty(self):
+        bucket = TokenBucket(rate=5, capacity=5)
+        for _ in range(5):
+            bucket.reserve()
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.4, abs=0.01)
+
+    def test_stats_track_throttling(self):
+        bucket = TokenBucket(rate=10, capacity=1)
+        bucket.reserve()
+        bucket.reserve()
+        stats = bucket.stats()
+        assert stats["acquired"] == 2
+        assert stats["throttled"] == 1
+        assert stats["total_wait"] == pytest.approx(0.1, abs=0.01)
+
+    def test_thread_safe_reservations(self):
+        bucket = TokenBucket(rate=10, capacity=10)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(10):
+                wait = bucket.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 40 tokens at 10/s with a burst of 10 means the last one waits ~3s
+        assert len(waits) == 40
+        assert max(waits) == pytest.approx(3.0, abs=0.05)
+
+    def test_state_file_shared_between_buckets(self, tmp_path):
+        state_path = str(tmp_path / "bucket.ratelimit")
+        first = TokenBucket(rate=5, capacity=5, state_path=state_path)
+        second = TokenBucket(rate=5, capacity=5, state_path=state_path)
+
+        for _ in range(5):
+            first.reserve()
+
+        assert os.path.exists(state_path)
+        assert second.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+class TestGetSharedLimiter:
+    """Tests for get_shared_limiter function."""
+
+    def test_returns_same_bucket_per_base(self, tmp_path):
+        with patch("src.rate_limiter.AIRTABLE_RATE_LIMIT_DIR", str(tmp_path)):
+            limiter = get_shared_limiter("appShared1")
+            assert get_shared_limiter("appShared1") is limiter
+            assert get_shared_limiter("appShared2") is not limiter
+            assert limiter.state_path.startswith(str(tmp_path))
@@ -0,0 +1,63 @@
+"""Tests for record_cache module."""
+import pytest
+from unittest.mock import patch
+from src.record_cache import RecordCache
+
+FULL = ("Applications", None)
+FILTERED = ("Applications", "{Shortlist Status} = 'Shortlisted'")
+
+
+def records(*ids):
+    return [{"id": i, "fields": {"Name": i}} for i in ids]
+
+
+class TestRecordCache:
+    """Tests for RecordCache."""
+
+    def test_hit_and_miss_counters(self):
+        cache = RecordCache(ttl=60)
+        assert cache.get(FULL) is None
+        cache.put(FULL, records("rec1"))
+        assert cache.get(FULL) == records("rec1")
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expires_after_ttl(self):
+        cache = RecordCache(ttl=60)
+        with patch("src.record_cache.time.monotonic", return_value=0):
+            cache.put(FULL, records("rec1"))
+        with patch("src.record_cache.time.monotonic", return_value=61):
+            assert cache.get(FULL) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = RecordCache(ttl=60, max_records=3)
+        cache.put(FULL, records("rec1", "rec2"))
+        cache.put(("Work Experience", None), records("exp1", "exp2"))
+        assert cache.get(FULL) is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_version_only_moves_on_changed_content(self):
+        cache = RecordCache(ttl=60)
+        first = cache.put(FULL, records("rec1"))
+        same = cache.put(FULL, records("rec1"))
+        changed = cache.put(FULL, records("rec1", "rec2"))
+        assert first == same
+        assert changed == first + 1
+
+    def test_writes_patch_full_snapshot_and_drop_filtered(self):
+        cache = RecordCache(ttl=60)
+        cache.put(FULL, records("rec1", "rec2"))
+        cache.put(FILTERED, records("rec1"))
+
+        cache.apply_writes("Applications", [{"id": "rec2", "fields": {"Name": "new"}}, {"id": "rec3", "fields": {}}])
+
+        assert [r["id"] for r in cache.get(FULL)] == ["rec1", "rec2", "rec3"]
+        assert cache.get(FULL)[1]["fields"]["Name"] == "new"
+        assert cache.get(FILTERED) is None
+
+    def test_deletes_remove_records(self):
+        cache = RecordCache(ttl=60)
+        cache.put(FULL, records("rec1", "rec2"))
+        cache.apply_deletes("Applications", ["rec1"])
+        assert [r["id"] for r in cache.get(FULL)] == ["rec2"]
+        assert cache.stats()["records"] == 1
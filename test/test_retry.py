@@ -0,0 +1,124 @@
+"""Tests for retry module."""
+import asyncio
+import json
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from src.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    call_with_retry,
+    call_with_retry_async,
+    get_retry_after
+)
+
+
+def http_error(status: int, headers: dict = None) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.exceptions.HTTPError(f"{status} error", response=response)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_classifies_status_codes(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable(http_error(429)) is True
+        assert policy.is_retryable(http_error(503)) is True
+        assert policy.is_retryable(http_error(422)) is False
+        assert policy.is_retryable(requests.exceptions.ConnectionError()) is True
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        delays = [policy.next_delay(2) for _ in range(200)]
+        assert all(1 <= d <= 6 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_honors_retry_after(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        assert policy.next_delay(1, http_error(429, {"Retry-After": "30"})) == 30
+
+    def test_retry_after_missing(self):
+        assert get_retry_after(http_error(429)) is None
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_trial_closes_on_success(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        with patch("src.retry.time.monotonic", return_value=0):
+            breaker.record_failure()
+        with patch("src.retry.time.monotonic", return_value=61):
+            breaker.before_call()
+            with pytest.raises(CircuitOpenError):
+                breaker.before_call()
+            breaker.record_success()
+        assert breaker.state == "closed"
+
+
+class TestCallWithRetry:
+    """Tests for call_with_retry function."""
+
+    @patch("src.retry.time.sleep")
+    def test_retries_then_succeeds(self, mock_sleep):
+        func = Mock(side_effect=[http_error(503), "ok"])
+        assert call_with_retry(func, RetryPolicy(max_attempts=3)) == "ok"
+        assert func.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("src.retry.time.sleep")
+    def test_fatal_error_not_retried(self, mock_sleep):
+        func = Mock(side_effect=http_error(422))
+        with pytest.raises(requests.exceptions.HTTPError):
+            call_with_retry(func, RetryPolicy(max_attempts=3))
+        assert func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("src.retry.time.sleep")
+    def test_open_circuit_fails_fast(self, mock_sleep):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        func = Mock(side_effect=http_error(503))
+
+        with pytest.raises(CircuitOpenError):
+            call_with_retry(func, RetryPolicy(max_attempts=5), breaker)
+
+        assert func.call_count == 2
+
+    def test_unlisted_error_in_trial_does_not_wedge_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        errors = (requests.exceptions.RequestException,)
+        with patch("src.retry.time.monotonic", return_value=0):
+            breaker.record_failure()
+        with patch("src.retry.time.monotonic", return_value=61):
+            with pytest.raises(json.JSONDecodeError):
+                call_with_retry(Mock(side_effect=json.JSONDecodeError("bad", "", 0)), RetryPolicy(), breaker, errors)
+            assert call_with_retry(Mock(return_value="ok"), RetryPolicy(), breaker, errors) == "ok"
+        assert breaker.state == "closed"
+
+    def test_unlisted_error_in_async_trial_does_not_wedge_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+        async def trial():
+            raise KeyError("missing")
+
+        async def healthy():
+            return "ok"
+
+        with patch("src.retry.time.monotonic", return_value=0):
+            breaker.record_failure()
+        with patch("src.retry.time.monotonic", return_value=61):
+            with pytest.raises(KeyError):
+                asyncio.run(call_with_retry_async(trial, RetryPolicy(), breaker, (OSError,)))
+            assert asyncio.run(call_with_retry_async(healthy, RetryPolicy(), breaker, (OSError,))) == "ok"
@@ -0,0 +1,141 @@
+"""Tests for shortlist_batch module."""
+import json
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+import src.shortlist_batch as shortlist_batch
+from src.fake_airtable import FakeAirtableBase
+from src.shortlist import evaluate_applicant
+from src.shortlist_batch import ApplicantColumns, _masks, evaluate_applicants, rescreen_all_applicants
+
+
+def make_applicants() -> list[dict]:
+    locations = ["San Francisco, USA", "London, UK", "Paris, France", "", None, "Toronto, Canada"]
+    companies = ["Google", "Acme", "Stripe"]
+    applicants = []
+    for i in range(36):
+        applicants.append({
+            "applicant_id": f"APP{i:03d}",
+            "personal": {"name": f"Person {i}", "location": locations[i % len(locations)]},
+            "experience": [
+                {"company": companies[i % 3], "title": "SWE", "start": f"{2024 - i % 8}-01-01", "end": "2024-06-01"}
+            ] if i % 5 else [],
+            "salary": {"preferred_rate": [0, 50, 100, 100.5, 80][i % 5], "availability": [10, 20, 40][i % 3],
+                       "currency": "USD"}
+        })
+    return applicants
+
+
+class TestEvaluateApplicants:
+    """Tests for evaluate_applicants function."""
+
+    def test_matches_scalar_evaluation(self):
+        applicants = make_applicants()
+        for applicant in applicants[::4]:
+            applicant["experience"].append({"company": "Acme", "start": "2021-03"})  # open-ended role
+        now = datetime(2025, 6, 1)
+        assert evaluate_applicants(applicants, now=now) == [evaluate_applicant(a, now) for a in applicants]
+
+    def test_irregular_rows_use_scalar_path(self):
+        applicants = [
+            {"salary": {"preferred_rate": True, "availability": 40}, "personal": {"location": "USA"}},
+            {"salary": {"preferred_rate": 50, "availability": 40}, "personal": {"location": "USA"}}
+        ]
+        assert evaluate_applicants(applicants) == [evaluate_applicant(a) for a in applicants]
+
+    def test_custom_thresholds(self):
+        applicant = {
+            "personal": {"location": "Paris, France"},
+            "experience": [{"company": "Acme", "start": "2010-01-01", "end": "2020-01-01"}],
+            "salary": {"preferred_rate": 120, "availability": 30}
+        }
+        assert evaluate_applicants([applicant])[0][0] is False
+
+        passed, reasons = evaluate_applicants([applicant], max_rate=150, approved=["FRANCE"])[0]
+        assert passed is True
+        assert "Preferred rate: $120/hour USD (under $150 threshold)" in reasons
+
+    def test_irregular_rows_use_custom_thresholds(self):
+        applicant = {
+            "personal": {"location": "Paris, France"},
+            "experience": [{"company": "Acme", "start": "2010-01-01", "end": "2020-01-01"}],
+            "salary": {"preferred_rate": True, "availability": 30}
+        }
+        passed, reasons = evaluate_applicants([applicant], min_years=50, approved=["FRANCE"])[0]
+        assert passed is False
+        assert not any("year" in r for r in reasons)
+        assert "Location: Paris, France (approved location)" in reasons
+
+        passed, reasons = evaluate_applicants([applicant], min_years=5, min_hours=30, approved=["FRANCE"])[0]
+        assert passed is True
+        assert "10.0 years total experience (exceeds 5-year minimum)" in reasons
+        assert "Availability: 30 hours/week (exceeds 30-hour minimum)" in reasons
+
+    def test_bad_rows_are_rejected_without_aborting_the_batch(self):
+        good = {"personal": {"location": "USA"}, "experience": [{"company": "Google", "start": "2015-01-01"}],
+                "salary": {"preferred_rate": 80, "availability": 30}}
+        bad = [
+            {"salary": {"preferred_rate": "80", "availability": 30}},
+            {"experience": [{"company": None}], "salary": {"preferred_rate": 80, "availability": 30}},
+            ["not", "an", "object"]
+        ]
+        results = evaluate_applicants(bad + [good], max_rate=90)
+
+        for passed, reasons in results[:3]:
+            assert passed is False
+            assert reasons[0].startswith("Could not evaluate applicant data")
+        assert results[3][0] is True
+
+    def test_numpy_masks_match_list_masks(self, monkeypatch):
+        numpy = pytest.importorskip("numpy")
+        columns = ApplicantColumns(make_applicants(), now=datetime(2025, 6, 1))
+        thresholds = (3, 90, 20, ["USA", "CANADA"])
+
+        monkeypatch.setattr(shortlist_batch, "np", numpy)
+        vectorized = _masks(columns, *thresholds)
+        monkeypatch.setattr(shortlist_batch, "np", None)
+        assert vectorized == _masks(columns, *thresholds)
+
+    def test_empty_batch(self):
+        assert evaluate_applicants([]) == []
+
+
+class TestRescreenAllApplicants:
+    """Tests for rescreen_all_applicants against the fake backend."""
+
+    def test_shortlists_from_batch_results(self):
+        base = FakeAirtableBase()
+        applicants = make_applicants()
+        base.seed("Applications", [{"Compressed JSON": json.dumps(a)} for a in applicants] + [{}])
+
+        with patch('src.shortlist_batch.AirtableClient', return_value=base.client()):
+            shortlisted, rejected = rescreen_all_applicants()
+
+        expected = sum(1 for a in applicants if evaluate_applicant(a)[0])
+        assert expected > 0
+        assert (shortlisted, rejected) == (expected, len(applicants) + 1 - expected)
+        assert len(base.records("Shortlisted Leads")) == expected
+
+    def test_rescreen_removes_and_refreshes_leads(self):
+        base = FakeAirtableBase()
+        applicants = make_applicants()
+        base.seed("Applications", [{"Compressed JSON": json.dumps(a)} for a in applicants])
+
+        with patch('src.shortlist_batch.AirtableClient', return_value=base.client(cache_ttl=0)):
+            before, _ = rescreen_all_applicants(min_years=0, max_rate=150, min_hours=0)
+        with patch('src.shortlist_batch.AirtableClient', return_value=base.client(cache_ttl=0)):
+            after, _ = rescreen_all_applicants(min_years=0, max_rate=60, min_hours=0)
+
+        assert 0 < after < before
+        leads = base.records("Shortlisted Leads")
+        statuses = {r["id"]: r["fields"].get("Shortlist Status") for r in base.records("Applications")}
+        assert len(leads) == after
+        assert all(statuses[lead["fields"]["Applicants"][0]] == "Shortlisted" for lead in leads)
+        assert sum(1 for s in statuses.values() if s == "Shortlisted") == after
+        assert all("(under $60 threshold)" in lead["fields"]["Score Reason"] for lead in leads)
+
+        # Nothing changed since the last re-screen, so nothing is written
+        writes = {m: n for m, n in base.requests_by_method.items() if m != "GET"}
+        with patch('src.shortlist_batch.AirtableClient', return_value=base.client(cache_ttl=0)):
+            assert rescreen_all_applicants(min_years=0, max_rate=60, min_hours=0)[0] == after
+        assert {m: n for m, n in base.requests_by_method.items() if m != "GET"} == writes
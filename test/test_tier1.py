@@ -0,0 +1,50 @@
+"""Tests for tier1 module."""
+from unittest.mock import patch
+from src.tier1 import Tier1Matcher, get_tier1_matcher, reset_tier1_matcher
+
+
+class TestTier1Matcher:
+    """Tests for Tier1Matcher."""
+
+    def test_matches_whole_words_only(self):
+        matcher = Tier1Matcher(["Intel", "Google", "AT&T"])
+        assert matcher.match("Intel Corp") == "Intel"
+        assert matcher.match("intelligent systems") is None
+        assert matcher.match("Ex-GOOGLE, Zurich") == "Google"
+        assert matcher.match("AT&T Labs") == "AT&T"
+        assert matcher.match("") is None
+
+    def test_aliases_map_to_canonical_company(self):
+        matcher = Tier1Matcher(["Facebook", "Amazon"], {"Meta Platforms": "Facebook", "Amazon Web Services": "Amazon"})
+        assert matcher.match("Meta  Platforms Inc") == "Facebook"
+        assert matcher.match("Amazon Web Services") == "Amazon"
+        assert matcher.match("Amazon Logistics") == "Amazon"
+
+    def test_shared_prefixes(self):
+        matcher = Tier1Matcher([f"Company{i}" for i in range(200)])
+        assert matcher.match("Company12 LLC") == "Company12"
+        assert matcher.match("Company1") == "Company1"
+        assert matcher.match("Company1234") is None
+
+    def test_non_ascii_case_folding(self):
+        matcher = Tier1Matcher(["Intel", "Tesla"])
+        assert matcher.match("İNTEL TÜRKİYE") == "Intel"
+        assert matcher.match("Teſla Inc") == "Tesla"
+        assert matcher.match("Société Générale") is None
+
+    def test_empty_list_matches_nothing(self):
+        assert Tier1Matcher([]).match("Google") is None
+
+
+class TestGetTier1Matcher:
+    """Tests for the configured matcher."""
+
+    def test_rebuilds_after_reset(self):
+        try:
+            with patch('src.config.TIER_1_COMPANIES', ["Acme"]), patch('src.config.TIER_1_ALIASES', {}):
+                reset_tier1_matcher()
+                assert get_tier1_matcher().match("Acme Corp") == "Acme"
+                assert get_tier1_matcher() is get_tier1_matcher()
+        finally:
+            reset_tier1_matcher()
+        assert get_tier1_matcher().match("Meta") == "Facebook"
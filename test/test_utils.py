@@ -5,7 +5,9 @@ from src.utils import (
     parse_date,
     calculate_years_between,
     normalize_location,
-    validate_json_structure
+    validate_json_structure,
+    canonical_json,
+    content_hash
 )
 
 
@@ -28,6 +30,15 @@ class TestParseDate:
     def test_invalid_date(self):
         assert parse_date("not-a-date") is None
 
+    def test_fast_path_forms(self):
+        assert parse_date("2023-01") == datetime(2023, 1, 1)
+        assert parse_date(" 2023-01-15 ") == datetime(2023, 1, 15)
+        assert parse_date("2023-02-30") is None
+
+    def test_falls_back_to_dateutil(self):
+        assert parse_date("2021-05-06T10:30:00") == datetime(2021, 5, 6, 10, 30)
+        assert parse_date("March 3, 2020") == datetime(2020, 3, 3)
+
 
 class TestCalculateYearsBetween:
     """Tests for calculate_years_between function."""
@@ -48,6 +59,9 @@ class TestCalculateYearsBetween:
         result = calculate_years_between("2020-01-01")
         assert result > 0
 
+    def test_reference_now(self):
+        assert calculate_years_between("2020-01-01", now=datetime(2022, 1, 1)) == 2.0
+
 
 class TestNormalizeLocation:
     """Tests for normalize_location function."""
@@ -114,3 +128,14 @@ class TestValidateJsonStructure:
         is_valid, errors = validate_json_structure(data)
         assert is_valid is False
         assert "Experience must be a list." in errors
+
+
+class TestContentHash:
+    """Tests for canonical_json and content_hash functions."""
+
+    def test_canonical_form_is_compact_and_sorted(self):
+        assert canonical_json({"b": 1, "a": [1, 2]}) == '{"a":[1,2],"b":1}'
+
+    def test_hash_ignores_key_order(self):
+        assert content_hash({"a": 1, "b": {"c": 2}}) == content_hash({"b": {"c": 2}, "a": 1})
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
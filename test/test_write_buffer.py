@@ -0,0 +1,54 @@
+"""Tests for write_buffer module."""
+import pytest
+from unittest.mock import Mock, patch
+from src.write_buffer import WriteBuffer
+
+
+class TestWriteBuffer:
+    """Tests for WriteBuffer."""
+
+    def test_merges_updates_to_same_record(self):
+        send = Mock(return_value=[])
+        buffer = WriteBuffer(send, max_delay=60)
+
+        buffer.add("Applications", "rec1", {"Shortlist Status": "Rejected"})
+        buffer.add("Applications", "rec1", {"LLM Score": 7})
+        buffer.flush()
+
+        send.assert_called_once_with("Applications", [
+            {"id": "rec1", "fields": {"Shortlist Status": "Rejected", "LLM Score": 7}}
+        ])
+        assert buffer.stats()["merged"] == 1
+
+    def test_flushes_full_batch(self):
+        send = Mock(return_value=[])
+        buffer = WriteBuffer(send, batch_size=10, max_delay=60)
+
+        for i in range(25):
+            buffer.add("Applications", f"rec{i}", {"n": i})
+
+        assert send.call_count == 2
+        assert all(len(call.args[1]) == 10 for call in send.call_args_list)
+        buffer.flush()
+        assert send.call_count == 3
+
+    def test_flushes_when_oldest_update_is_stale(self):
+        send = Mock(return_value=[])
+        buffer = WriteBuffer(send, max_delay=5)
+
+        with patch("src.write_buffer.time.monotonic", side_effect=[0, 0, 6, 6]):
+            buffer.add("Applications", "rec1", {"n": 1})
+            buffer.add("Applications", "rec2", {"n": 2})
+
+        send.assert_called_once()
+
+    def test_records_failed_ids_and_continues(self):
+        send = Mock(side_effect=[Exception("boom"), []])
+        buffer = WriteBuffer(send, max_delay=60)
+
+        buffer.add("Applications", "rec1", {"n": 1})
+        buffer.add("Personal Details", "per1", {"n": 1})
+        buffer.flush()
+
+        assert buffer.failed_ids == ["rec1"]
+        assert send.call_count == 2
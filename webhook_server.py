@@ -16,6 +16,12 @@ app = Flask(__name__)
 client = AirtableClient()
 
 
+@app.before_request
+def refresh_client_cache():
+    """Drop cached child tables so records created in Airtable since the last call are seen."""
+    client.invalidate_cache()
+
+
 def process_application(record_id: str):
     """Process a single application through the full pipeline"""
     try: